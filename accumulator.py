@@ -0,0 +1,154 @@
+"""
+accumulator.py — Mergeable (n, mean, M2) accumulator for z/t tests on partitioned data.
+
+Every test in the app needs only n, the mean and M2 = Σ(x − x̄)². An
+Accumulator holds exactly those three numbers — or three arrays, one slot
+per column — and can be filled value by value (Welford), a block at a time,
+or by merging accumulators filled elsewhere (Chan et al.'s pairwise update).
+Shards, files or worker processes each summarise their own rows; only the
+accumulators travel, and the merge gives the same moments as one pass over
+all the data (up to floating-point rounding).
+
+    parts = [Accumulator.of(chunk) for chunk in read_partitions()]   # map
+    total = Accumulator.merge_all(parts)                               # reduce
+    total.t_test(mu0=0.5, tail="right", alpha=0.05)
+
+A column-wise accumulator (`Accumulator.zeros(k)` or `.of(matrix)`) tests k
+funds at once; its n / mean / var also feed two_sample.welch_t and friends.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from pvalues import critical, p_value, reject
+
+TestResult = namedtuple("TestResult", "se stat df crit pv rej")
+
+
+class Accumulator:
+    """Running n, mean and M2 — scalars, or arrays with one entry per column."""
+
+    __slots__ = ("n", "mean", "m2")
+
+    def __init__(self, n=0.0, mean=0.0, m2=0.0):
+        self.n, self.mean, self.m2 = n, mean, m2
+
+    # ── construction ──────────────────────────────────────────────
+    @classmethod
+    def zeros(cls, k=None):
+        """Empty accumulator: scalar, or k columns."""
+        if k is None:
+            return cls()
+        return cls(np.zeros(k), np.zeros(k), np.zeros(k))
+
+    @classmethod
+    def of(cls, x):
+        """Summarise a block: 1-D → scalar accumulator, 2-D (rows × k) → k columns. NaN is skipped."""
+        x = np.asarray(x, dtype=float)
+        ok = np.isfinite(x)
+        n = ok.sum(axis=0).astype(float)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(n > 0, np.where(ok, x, 0.0).sum(axis=0) / n, 0.0)
+        d = np.where(ok, x - mean, 0.0)
+        m2 = (d * d).sum(axis=0)
+        if x.ndim == 1:
+            return cls(float(n), float(mean), float(m2))
+        return cls(n, mean, m2)
+
+    @classmethod
+    def merge_all(cls, accs):
+        """Pairwise (tree) merge of any number of accumulators."""
+        accs = list(accs)
+        if not accs:
+            return cls()
+        while len(accs) > 1:
+            accs = [accs[i].merge(accs[i + 1]) if i + 1 < len(accs) else accs[i]
+                    for i in range(0, len(accs), 2)]
+        return accs[0].copy()
+
+    def copy(self):
+        return type(self)(*(np.copy(v) if isinstance(v, np.ndarray) else v
+                            for v in (self.n, self.mean, self.m2)))
+
+    # ── updates ───────────────────────────────────────────────────
+    def push(self, x):
+        """Add one observation (or one row, for a column accumulator) — Welford's update."""
+        x = np.asarray(x, dtype=float)
+        if x.ndim == 0 and not isinstance(self.n, np.ndarray):
+            if np.isfinite(x):
+                x = float(x)
+                self.n += 1
+                delta = x - self.mean
+                self.mean += delta / self.n
+                self.m2 += delta * (x - self.mean)
+            return self
+        ok = np.isfinite(x)
+        n = self.n + ok
+        delta = np.where(ok, x - self.mean, 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = self.mean + np.where(ok, delta / n, 0.0)
+        self.m2 = self.m2 + np.where(ok, delta * (x - mean), 0.0)
+        self.n, self.mean = n, mean
+        return self
+
+    def update(self, block):
+        """Add a block of observations (rows × columns) in one vectorised step."""
+        return self.merge_in(Accumulator.of(block))
+
+    def merge(self, other):
+        """New accumulator equal to both inputs' data combined (Chan et al.)."""
+        return self.copy().merge_in(other)
+
+    def merge_in(self, other):
+        """In-place merge of `other` into self."""
+        na, nb = self.n, other.n
+        n = na + nb
+        delta = other.mean - self.mean
+        with np.errstate(invalid="ignore", divide="ignore"):
+            w = np.where(n > 0, nb / np.where(n > 0, n, 1), 0.0)
+        mean = self.mean + delta * w
+        m2 = self.m2 + other.m2 + delta * delta * na * w
+        if not isinstance(n, np.ndarray):
+            mean, m2 = float(mean), float(m2)
+        self.n, self.mean, self.m2 = n, mean, m2
+        return self
+
+    __iadd__ = merge_in
+    __add__  = merge
+
+    # ── moments ───────────────────────────────────────────────────
+    @property
+    def var(self):
+        """Sample variance (ddof=1); NaN while n < 2."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(np.asarray(self.n) > 1, self.m2 / np.maximum(np.asarray(self.n) - 1, 1), np.nan)[()]
+
+    @property
+    def sd(self):
+        return np.sqrt(self.var)
+
+    def __repr__(self):
+        return f"Accumulator(n={self.n!r}, mean={self.mean!r}, m2={self.m2!r})"
+
+    def __getstate__(self):
+        return self.n, self.mean, self.m2
+
+    def __setstate__(self, state):
+        self.n, self.mean, self.m2 = state
+
+    # ── decisions ─────────────────────────────────────────────────
+    def z_test(self, mu0, sigma, tail="two", alpha=0.05) -> TestResult:
+        """One-sample z-test with known σ — same rule as the calculators."""
+        se = sigma / np.sqrt(self.n)
+        z = (self.mean - mu0) / se
+        crit = critical(alpha, tail)
+        return TestResult(se, z, None, crit, p_value(z, tail), reject(z, crit, tail))
+
+    def t_test(self, mu0, tail="two", alpha=0.05) -> TestResult:
+        """One-sample t-test, σ estimated from the accumulated data, df = n − 1."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            se = self.sd / np.sqrt(self.n)
+            t = (self.mean - mu0) / se
+        df = np.subtract(self.n, 1)
+        crit = critical(alpha, tail, df)
+        return TestResult(se, t, df, crit, p_value(t, tail, df), reject(t, crit, tail))
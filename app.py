@@ -7,7 +7,9 @@ from styles import inject_css
 from tabs import (
     tab_overview, tab_one_tailed, tab_two_tailed,
     tab_comparison, tab_finance_examples, tab_python_code,
+    plot_batch,
 )
+from tab_two_sample  import tab_two_sample
 from tab_non_finance import tab_non_finance
 from tab_edu_hub     import tab_edu_hub
 
@@ -61,6 +63,7 @@ tabs = st.tabs([
     "📐 Overview",
     "→ One-Tailed",
     "↔ Two-Tailed",
+    "⇄ Two-Sample",
     "⚖ Comparison",
     "💹 Finance Examples",
     "🌍 Everyday Examples",
@@ -68,14 +71,17 @@ tabs = st.tabs([
     "🐍 Python Code",
 ])
 
-with tabs[0]: tab_overview()
-with tabs[1]: tab_one_tailed()
-with tabs[2]: tab_two_tailed()
-with tabs[3]: tab_comparison()
-with tabs[4]: tab_finance_examples()
-with tabs[5]: tab_non_finance()
-with tabs[6]: tab_edu_hub()
-with tabs[7]: tab_python_code()
+# Plots requested by any tab are drawn concurrently and dropped into place at the end
+with plot_batch():
+    with tabs[0]: tab_overview()
+    with tabs[1]: tab_one_tailed()
+    with tabs[2]: tab_two_tailed()
+    with tabs[3]: tab_two_sample()
+    with tabs[4]: tab_comparison()
+    with tabs[5]: tab_finance_examples()
+    with tabs[6]: tab_non_finance()
+    with tabs[7]: tab_edu_hub()
+    with tabs[8]: tab_python_code()
 
 st.html(f"""
 <div style="text-align:center;padding:18px;color:#8892b0;-webkit-text-fill-color:#8892b0;
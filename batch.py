@@ -0,0 +1,121 @@
+"""
+batch.py — One-sample alpha test for every fund in a returns file, through the result store.
+
+    python batch.py returns.csv --mu0 0 --tail right --alpha 0.05 --out results.csv
+
+returns.csv: one row per period, one column per fund (a first non-numeric
+column such as a date is ignored); blanks are missing values, blank lines
+are skipped and a short row (a fund with a shorter history) is padded with
+missing values. For every
+fund the sufficient statistics (n, mean, sd) are computed in one
+vectorised pass; tests already in the result store (same statistics, μ₀,
+tail, α and engine version — from any earlier run or app session) are read
+back in bulk, only the rest are computed, and the new ones are stored in
+one transaction. Writes one CSV row per fund — the input of report.py.
+"""
+import argparse
+import csv
+import sys
+import time
+
+import numpy as np
+
+from accumulator import Accumulator
+from result_store import ResultStore, DEFAULT_PATH, spec, spec_key
+
+KIND   = "t_one_sample"
+FIELDS = ["fund", "n", "mean", "sd", "mu0", "tail", "alpha", "t", "df", "p_value", "t_crit", "reject"]
+
+
+def read_panel(path):
+    """(fund names, T × k float matrix) from a CSV with a header row.
+
+    Blank lines are skipped and short rows padded with NaN; a row longer than
+    the header raises ValueError naming its line."""
+    def num(v):
+        try:
+            return float(v)
+        except ValueError:
+            return np.nan
+
+    with open(path, newline="") as fh:
+        reader = csv.reader(fh)
+        header = next(reader, None)
+        if not header:
+            raise ValueError(f"{path}: no header row")
+        body = []
+        for row in reader:
+            if not any(v.strip() for v in row):
+                continue
+            if len(row) > len(header):
+                raise ValueError(f"{path}, line {reader.line_num}: {len(row)} fields, "
+                                 f"but the header has {len(header)}")
+            body.append([num(v) for v in row] + [np.nan] * (len(header) - len(row)))
+
+    X = np.array(body, dtype=float).reshape(len(body), len(header))
+    keep = [j for j in range(len(header)) if np.isfinite(X[:, j]).any()]
+    return [header[j] for j in keep], X[:, keep]
+
+
+def fund_inputs(acc: Accumulator, mu0):
+    """Per-fund normalised test inputs: the sufficient statistics and μ₀."""
+    return [dict(n=int(n), mean=float(m), sd=float(s), mu0=mu0)
+            for n, m, s in zip(acc.n, acc.mean, np.atleast_1d(acc.sd))]
+
+
+def run(funds, X, mu0=0.0, tail="right", alpha=0.05, store: ResultStore = None):
+    """[(fund, result dict)] — stored results reused, the rest computed in one vectorised call."""
+    acc = Accumulator.of(X)
+    inputs = fund_inputs(acc, mu0)
+    specs = [spec(KIND, i, tail, alpha) for i in inputs]
+    keys = [spec_key(KIND, i, tail, alpha) for i in inputs]
+    found = store.get_many(keys) if store is not None else {}
+
+    todo = [j for j, k in enumerate(keys) if k not in found]
+    if todo:
+        sub = Accumulator(acc.n[todo], acc.mean[todo], acc.m2[todo])
+        r = sub.t_test(mu0, tail, alpha)
+        new = {keys[j]: dict(t=float(r.stat[i]), df=int(r.df[i]), p_value=float(r.pv[i]),
+                             t_crit=float(r.crit[i]), reject=bool(r.rej[i]))
+               for i, j in enumerate(todo)}
+        if store is not None:
+            store.put_many((keys[j], KIND, specs[j], new[keys[j]]) for j in todo)
+        found.update(new)
+    return [(f, dict(inputs[j], **found[keys[j]])) for j, f in enumerate(funds)], len(todo)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Batch one-sample t-test per fund, cached in the result store.")
+    ap.add_argument("returns", help="CSV: rows = periods, columns = funds")
+    ap.add_argument("--mu0", type=float, default=0.0)
+    ap.add_argument("--tail", choices=["right", "left", "two"], default="right")
+    ap.add_argument("--alpha", type=float, default=0.05)
+    ap.add_argument("--out", help="results CSV (default: stdout)")
+    ap.add_argument("--store", default=str(DEFAULT_PATH), help="result store path")
+    ap.add_argument("--no-store", action="store_true", help="compute everything, read/write nothing")
+    args = ap.parse_args(argv)
+
+    try:
+        funds, X = read_panel(args.returns)
+    except ValueError as e:
+        ap.error(str(e))
+    store = None if args.no_store else ResultStore(args.store)
+    t0 = time.perf_counter()
+    results, computed = run(funds, X, args.mu0, args.tail, args.alpha, store)
+    elapsed = time.perf_counter() - t0
+
+    out = open(args.out, "w", newline="") if args.out else sys.stdout
+    try:
+        w = csv.DictWriter(out, FIELDS, extrasaction="ignore")
+        w.writeheader()
+        for fund, r in results:
+            w.writerow(dict(r, fund=fund, tail=args.tail, alpha=args.alpha))
+    finally:
+        if args.out:
+            out.close()
+    print(f"{len(funds)} funds: {len(funds) - computed} from the store, {computed} computed "
+          f"in {elapsed:.2f} s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+"""
+benchmarks — Performance harnesses for the app. Run from the repo root,
+e.g. `python -m benchmarks.load_harness --help`. Not imported by app.py.
+"""
@@ -0,0 +1,62 @@
+"""
+code_runner_startup.py — Time to first output: warm code_runner worker vs a fresh interpreter.
+
+    cold    subprocess `python -c "import numpy, scipy.stats, matplotlib.pyplot; <snippet>"`
+    warm    CodeRunner.run(<snippet>) with the pool already warm
+
+Both run the same small t-test snippet; times are end to end, as the user sees them.
+
+    python -m benchmarks.code_runner_startup --runs 20
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from code_runner import CodeRunner
+
+SNIPPET = "x = np.random.default_rng(1).normal(0.5, 2, 60)\nprint(stats.ttest_1samp(x, 0).pvalue)"
+PRELUDE = "import numpy as np, scipy.stats as stats, matplotlib.pyplot as plt\n"
+
+
+def cold(runs):
+    env = dict(os.environ, MPLBACKEND="Agg")
+    out = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, "-c", PRELUDE + SNIPPET], env=env, check=True, capture_output=True)
+        out.append((time.perf_counter() - t0) * 1e3)
+    return out
+
+
+def warm(runs, pause):
+    out = []
+    with CodeRunner(warm=2) as runner:
+        runner.run("pass")                                        # wait for the zygote's imports
+        for _ in range(runs):
+            time.sleep(pause)                                     # let the pool refill, as between clicks
+            t0 = time.perf_counter()
+            assert runner.run(SNIPPET).ok
+            out.append((time.perf_counter() - t0) * 1e3)
+        return out, runner.cold_starts
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Warm code-runner pool vs cold interpreter start.")
+    ap.add_argument("--runs", type=int, default=20)
+    ap.add_argument("--pause", type=float, default=0.2, help="seconds between warm runs")
+    args = ap.parse_args(argv)
+
+    c = cold(args.runs)
+    w, forks = warm(args.runs, args.pause)
+    print(f"{args.runs} runs of a one-sample t-test snippet\n")
+    print(f'{"path":>5} {"median ms":>10} {"p90 ms":>8}')
+    for name, xs in (("cold", c), ("warm", w)):
+        print(f"{name:>5} {statistics.median(xs):>10.1f} {sorted(xs)[int(0.9 * (len(xs) - 1))]:>8.1f}")
+    print(f"\n{statistics.median(c) / statistics.median(w):.0f}× faster warm; {forks} of {args.runs + 1} runs (incl. warm-up) waited for a fork")
+
+
+if __name__ == "__main__":
+    main()
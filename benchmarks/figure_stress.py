@@ -0,0 +1,109 @@
+"""
+figure_stress.py — Many sessions rendering decision plots at once: no cross-session artifacts.
+
+Simulates S Streamlit sessions, each a thread doing R reruns. A rerun needs
+the same three plots the app draws on a full rerun: two through the shared
+per-(tail, α, df) templates (figures.render_png), one built fresh
+(figures.plot_test). All three go through figures.submit, so the figure
+thread pool also renders concurrently. Every plot carries its session and
+rerun in the title and a session-specific statistic, so a render that
+picked up another session's state would come out different.
+
+Checks:
+    bytes      every PNG equals the one rendered serially for that job, with nothing else running
+    pyplot     matplotlib.pyplot was never imported (no global figure registry in play)
+    leaks      live Figure objects after the run ≤ before + MAX_TEMPLATES
+
+    python -m benchmarks.figure_stress --sessions 16 --reruns 10
+"""
+import argparse
+import gc
+import sys
+import threading
+import time
+
+import numpy as np
+from matplotlib.figure import Figure
+
+import figures
+from figures import plot_test, png_bytes, render_png, submit
+
+DPI = 80
+# (tail, α, df) of the three plots per rerun: two via templates, one fresh
+PLOTS = [("two", 0.05, None), ("right", 0.05, 35), ("left", 0.01, None)]
+
+
+def fresh(stat, alpha, tail, title, df):
+    return png_bytes(plot_test(stat, alpha, tail, title, df=df), DPI)
+
+
+def jobs_for(session, reruns, seed=0):
+    """[[(fn, stat, alpha, tail, title, df) × 3] per rerun] for one session."""
+    rng = np.random.default_rng(seed + session)
+    out = []
+    for r in range(reruns):
+        rerun = []
+        for k, (tail, alpha, df) in enumerate(PLOTS):
+            fn = fresh if k == 2 else (lambda *a: render_png(*a, dpi=DPI))
+            stat = round(float(rng.normal(0, 1.8)), 4)
+            rerun.append((fn, stat, alpha, tail, f"session {session:02d} · rerun {r} · plot {k}", df))
+        out.append(rerun)
+    return out
+
+
+def _live_figures():
+    gc.collect()
+    return sum(isinstance(o, Figure) for o in gc.get_objects())
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Concurrent figure rendering stress test.")
+    ap.add_argument("--sessions", type=int, default=16)
+    ap.add_argument("--reruns", type=int, default=10)
+    args = ap.parse_args(argv)
+
+    plan = [jobs_for(s, args.reruns) for s in range(args.sessions)]
+    flat = [job for session in plan for rerun in session for job in rerun]
+
+    t0 = time.perf_counter()
+    reference = {job[4]: job[0](*job[1:]) for job in flat}
+    serial = time.perf_counter() - t0
+    before = _live_figures()
+
+    results, errors = {}, []
+
+    def session(reruns):
+        try:
+            for rerun in reruns:
+                futures = [(job[4], submit(*job)) for job in rerun]
+                for title, f in futures:
+                    results[title] = f.result()
+        except Exception as exc:                                  # surfaced in the report below
+            errors.append(repr(exc))
+
+    threads = [threading.Thread(target=session, args=(s,)) for s in plan]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - t0
+
+    mismatched = sum(results.get(title) != png for title, png in reference.items())
+    pyplot = "matplotlib.pyplot" in sys.modules
+    after = _live_figures()
+    print(f"{len(flat)} plots: {args.sessions} sessions × {args.reruns} reruns × {len(PLOTS)}, "
+          f"{figures.RENDER_THREADS} render threads")
+    print(f"serial {serial:.2f} s · concurrent {wall:.2f} s ({serial / wall:.2f}×)")
+    print(f"bytes:  {mismatched} of {len(reference)} differ from the serial render, {len(errors)} errors")
+    print(f"pyplot: imported = {pyplot}")
+    print(f"leaks:  live Figure objects {before} → {after} (cap +{figures.MAX_TEMPLATES})")
+    ok = not mismatched and not errors and not pyplot and after <= before + figures.MAX_TEMPLATES
+    for e in errors[:5]:
+        print("  ", e)
+    print("OK" if ok else "FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
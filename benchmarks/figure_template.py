@@ -0,0 +1,122 @@
+"""
+figure_template.py — Persistent FigureTemplate vs building the test plot from scratch.
+
+Renders the same sequence of decision plots (random statistics across
+tails, α levels and df) three ways and reports ms per PNG:
+
+    fresh+bbox   plot_test → savefig(bbox_inches="tight")  (the app's old path)
+    fresh        plot_test → savefig
+    template     figures.render_png — artists updated in place over a cached background
+
+Then checks:
+    pixels       template output == fresh output, pixel for pixel
+    threads      N threads render the sequence concurrently through the shared
+                 templates; every PNG must equal its serial render (no
+                 cross-talk between renders), pyplot must never be imported,
+                 and the live Figure count must stay within MAX_TEMPLATES
+                 (nothing leaks)
+
+    python -m benchmarks.figure_template --renders 200 --threads 8
+"""
+import argparse
+import gc
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from matplotlib.figure import Figure
+
+import figures
+from figures import plot_test, png_bytes, render_png, template
+
+CASES = [("right", 0.05, None), ("two", 0.05, None), ("left", 0.01, None),
+         ("right", 0.05, 35), ("two", 0.10, 119)]
+
+
+def workload(n, seed=0):
+    """[(stat, alpha, tail, title, df)] — mostly inside ±3.5, a few extreme (forcing a wider x-range)."""
+    rng = np.random.default_rng(seed)
+    out = []
+    for i in range(n):
+        tail, alpha, df = CASES[i % len(CASES)]
+        stat = float(rng.normal(0, 1.5)) if i % 20 else float(rng.choice([-6.2, 5.4]))
+        out.append((round(stat, 4), alpha, tail, f"Fund {i:04d} | α={alpha}", df))
+    return out
+
+
+def fresh_png(stat, alpha, tail, title, df, dpi, bbox):
+    fig = plot_test(stat, alpha, tail, title, df=df)
+    return png_bytes(fig, dpi, **({"bbox_inches": "tight"} if bbox else {}))
+
+
+def _per_png(fn, jobs):
+    t0 = time.perf_counter()
+    for job in jobs:
+        fn(*job)
+    return (time.perf_counter() - t0) / len(jobs) * 1e3
+
+
+def pixel_check(jobs):
+    """Number of jobs whose template pixels differ from plot_test's."""
+    bad = 0
+    for stat, alpha, tail, title, df in jobs:
+        fig = plot_test(stat, alpha, tail, title, df=df)
+        fig.canvas.draw()
+        ref = np.asarray(fig.canvas.buffer_rgba()).copy()
+        got = template(tail, alpha, df).rgba(stat, title)
+        bad += ref.shape != got.shape or not np.array_equal(ref, got)
+    return bad
+
+
+def _live_figures():
+    gc.collect()
+    return sum(isinstance(o, Figure) for o in gc.get_objects())
+
+
+def thread_check(jobs, threads, dpi):
+    serial = [render_png(s, a, t, ti, df, dpi) for s, a, t, ti, df in jobs]
+    before = _live_figures()
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as ex:
+        par = list(ex.map(lambda j: render_png(*j[:4], df=j[4], dpi=dpi), jobs * 3))
+    wall = time.perf_counter() - t0
+    mismatched = sum(p != serial[i % len(jobs)] for i, p in enumerate(par))
+    return dict(wall=wall, renders=len(par), mismatched=mismatched, pyplot="matplotlib.pyplot" in sys.modules,
+                live_before=before, live_after=_live_figures())
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="FigureTemplate vs fresh-figure benchmark + thread/leak check.")
+    ap.add_argument("--renders", type=int, default=200)
+    ap.add_argument("--threads", type=int, default=8)
+    ap.add_argument("--dpi", type=int, default=200)
+    args = ap.parse_args(argv)
+
+    jobs = workload(args.renders)
+    render_png(*jobs[0][:4], df=jobs[0][4], dpi=args.dpi)            # import/font-cache warm-up
+    fresh_png(*jobs[0], args.dpi, True)
+    rows = [
+        ("fresh+bbox", _per_png(lambda *j: fresh_png(*j, args.dpi, True), jobs)),
+        ("fresh",      _per_png(lambda *j: fresh_png(*j, args.dpi, False), jobs)),
+        ("template",   _per_png(lambda s, a, t, ti, df: render_png(s, a, t, ti, df, args.dpi), jobs)),
+    ]
+    base = rows[0][1]
+    print(f"{args.renders} PNGs at {args.dpi} dpi, {len(CASES)} (tail, α, df) templates\n")
+    print(f'{"path":>11} {"ms/PNG":>8} {"speed-up":>9}')
+    for name, ms in rows:
+        print(f"{name:>11} {ms:>8.1f} {base / ms:>8.1f}×")
+    print(f"\ntemplate stats: {figures.template_stats()}")
+
+    print(f"\npixels: {pixel_check(jobs[:40])} of 40 template renders differ from plot_test")
+    r = thread_check(jobs[:60], args.threads, 80)
+    print(f"threads: {r['renders']} renders on {args.threads} threads in {r['wall']:.2f} s — "
+          f"{r['mismatched']} differ from the serial render, pyplot imported: {r['pyplot']}, "
+          f"live Figure objects {r['live_before']} → {r['live_after']} (cap {figures.MAX_TEMPLATES})")
+    ok = r["mismatched"] == 0 and not r["pyplot"] and r["live_after"] <= figures.MAX_TEMPLATES
+    print("OK" if ok else "FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
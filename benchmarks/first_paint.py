@@ -0,0 +1,94 @@
+"""
+first_paint.py — Time-to-first-paint and font-load timing for one or more URLs.
+
+Loads each URL in a fresh (cold-cache) headless Chromium context and records
+first contentful paint, when document.fonts.ready resolves, and how many
+requests / bytes went to third-party origins and to font files. Use it to
+compare builds, e.g. before and after self-hosting the fonts:
+
+    python -m benchmarks.first_paint --url before=http://localhost:8501 \\
+                                     --url after=http://localhost:8502 --runs 10
+
+--offline blocks every non-local request, simulating the air-gapped network.
+Requires Playwright (`pip install playwright && playwright install chromium`).
+"""
+import argparse
+import statistics
+from urllib.parse import urlparse
+
+try:
+    from playwright.sync_api import sync_playwright
+except ImportError:
+    sync_playwright = None
+
+_LOCAL = {"localhost", "127.0.0.1", "::1"}
+
+_TIMINGS_JS = """async () => {
+  await document.fonts.ready;
+  const fontsReady = performance.now();
+  const fcp = performance.getEntriesByName("first-contentful-paint")[0];
+  return {fcp: fcp ? fcp.startTime : null, fonts_ready: fontsReady};
+}"""
+
+
+def measure(browser, url, offline=False, settle_selector="h1"):
+    """One cold load → dict(fcp, fonts_ready, third_party, third_party_kib, font_kib)."""
+    ctx = browser.new_context()
+    page = ctx.new_page()
+    origin = urlparse(url).hostname
+    stats = dict(third_party=0, third_party_kib=0.0, font_kib=0.0)
+
+    if offline:
+        page.route("**/*", lambda route: route.abort()
+                   if urlparse(route.request.url).hostname not in _LOCAL | {origin}
+                   else route.continue_())
+
+    def on_response(resp):
+        try:
+            size = len(resp.body()) / 1024
+        except Exception:
+            size = 0.0
+        host = urlparse(resp.url).hostname
+        if host not in _LOCAL | {origin}:
+            stats["third_party"] += 1
+            stats["third_party_kib"] += size
+        if resp.request.resource_type == "font":
+            stats["font_kib"] += size
+
+    page.on("response", on_response)
+    page.goto(url, wait_until="load")
+    page.wait_for_selector(settle_selector, timeout=60_000)
+    stats.update(page.evaluate(_TIMINGS_JS))
+    ctx.close()
+    return stats
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Measure first paint and font loading.")
+    ap.add_argument("--url", action="append", required=True,
+                    help="label=url (repeatable), e.g. after=http://localhost:8501")
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--offline", action="store_true", help="block all non-local requests")
+    args = ap.parse_args(argv)
+    if sync_playwright is None:
+        raise SystemExit("Playwright is not installed: pip install playwright && playwright install chromium")
+
+    targets = [u.split("=", 1) if "=" in u else (u, u) for u in args.url]
+    print(f'{"build":>10} {"FCP ms p50":>11} {"FCP ms p95":>11} {"fonts ms p50":>13} '
+          f'{"3rd-party req":>13} {"3rd-party KiB":>13} {"font KiB":>9}')
+    with sync_playwright() as pw:
+        browser = pw.chromium.launch()
+        for label, url in targets:
+            runs = [measure(browser, url, args.offline) for _ in range(args.runs)]
+            fcp = sorted(r["fcp"] for r in runs if r["fcp"] is not None) or [float("nan")]
+            print(f'{label:>10} {statistics.median(fcp):>11.0f} '
+                  f'{fcp[min(len(fcp) - 1, int(0.95 * len(fcp)))]:>11.0f} '
+                  f'{statistics.median(r["fonts_ready"] for r in runs):>13.0f} '
+                  f'{statistics.fmean(r["third_party"] for r in runs):>13.1f} '
+                  f'{statistics.fmean(r["third_party_kib"] for r in runs):>13.1f} '
+                  f'{statistics.fmean(r["font_kib"] for r in runs):>9.1f}')
+        browser.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+fragment_latency.py — Per-interaction latency: whole-app rerun vs fragment rerun.
+
+Every calculator is an st.fragment, so the browser reruns only that
+fragment when one of its widgets changes. This replays the same widget
+change both ways against a local server — as a full-script rerun (what
+happened before the calculators were fragments) and as a fragment rerun —
+and reports latency and bytes sent back per interaction.
+
+    python -m benchmarks.fragment_latency --reps 30
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+from pathlib import Path
+
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+from benchmarks.load_harness import ROOT, SimSession, _free_port, _pct, start_server
+
+ALPHAS = [0.1, 0.05, 0.025, 0.01]
+
+
+def _record(key, **inputs):
+    def step(s, rnd, i):
+        s.set(key, dict(inputs, alpha=rnd.choice(ALPHAS), z=0.0, p_value=0.5, reject=False,
+                        recorded_at=i))
+        return key, None
+    return step
+
+def _select(key, values=None):
+    def step(s, rnd, i):
+        s.set(key, rnd.choice(values or s.options(key)))
+        return key, None
+    return step
+
+def _run_z_test(s, rnd, i):
+    s.set("py_xb", round(rnd.uniform(11.0, 15.0), 1))
+    wid = s.widgets["run_zt"][0]
+    return "run_zt", WidgetState(id=wid, trigger_value=True)
+
+
+INTERACTIONS = {
+    "one_tailed: record decision": _record("ot_explorer", x_bar=13.5, mu_0=12.0, sigma=6.0, n=36, tail="right"),
+    "two_tailed: record decision": _record("tt_explorer", x_bar=47.5, mu_0=50.0, sigma=12.0, n=64, tail="two"),
+    "non_finance: switch case":    _select("nf_case"),
+    "non_finance: change α":       _select("nf_alpha", ALPHAS),
+    "python_code: run z-test":     _run_z_test,
+}
+
+
+async def run(url, reps, timeout, seed=0):
+    rnd = random.Random(seed)
+    s = SimSession(url, timeout)
+    await s.connect()
+    results = {}
+    try:
+        for name, step in INTERACTIONS.items():
+            rows = {"full": [], "fragment": []}
+            for i in range(reps):
+                for mode in ("full", "fragment"):
+                    key, trigger = step(s, rnd, 2 * i + (mode == "fragment"))
+                    frag = s.fragments.get(key, "") if mode == "fragment" else ""
+                    lat, nbytes, ok = await s.rerun(trigger=trigger, fragment_id=frag)
+                    if ok:
+                        rows[mode].append((lat, nbytes))
+            results[name] = {
+                mode: dict(p50=_pct([lat for lat, _ in got], 50), p95=_pct([lat for lat, _ in got], 95),
+                           kib=statistics.fmean(nb for _, nb in got) / 1024 if got else float("nan"),
+                           n=len(got))
+                for mode, got in rows.items()
+            }
+            results[name]["fragment_id"] = s.fragments.get(key, "")
+    finally:
+        await s.close()
+    return results
+
+
+def print_report(results):
+    print(f'\n{"interaction":<30} {"full p50 ms":>11} {"frag p50 ms":>11} {"speed-up":>8} '
+          f'{"full p95 ms":>11} {"frag p95 ms":>11} {"full KiB":>8} {"frag KiB":>8}')
+    for name, r in results.items():
+        f, g = r["full"], r["fragment"]
+        note = "" if r["fragment_id"] else "   (not in a fragment)"
+        print(f'{name:<30} {f["p50"] * 1e3:>11.1f} {g["p50"] * 1e3:>11.1f} {f["p50"] / g["p50"]:>7.1f}× '
+              f'{f["p95"] * 1e3:>11.1f} {g["p95"] * 1e3:>11.1f} {f["kib"]:>8.1f} {g["kib"]:>8.1f}{note}')
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--app", default=str(ROOT / "app.py"))
+    ap.add_argument("--url", help="use an already-running server (ws://host:port/_stcore/stream)")
+    ap.add_argument("--reps", type=int, default=20, help="repetitions per interaction and mode")
+    ap.add_argument("--timeout", type=float, default=60)
+    ap.add_argument("--json", help="also write the raw results to this file")
+    args = ap.parse_args(argv)
+
+    proc = None
+    if args.url:
+        url = args.url
+    else:
+        port = _free_port()
+        proc = start_server(args.app, port)
+        url = f"ws://127.0.0.1:{port}/_stcore/stream"
+    try:
+        results = asyncio.run(run(url, args.reps, args.timeout))
+        print_report(results)
+        if args.json:
+            Path(args.json).write_text(json.dumps(results, indent=2))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait(10)
+
+
+if __name__ == "__main__":
+    main()
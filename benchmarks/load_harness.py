@@ -0,0 +1,381 @@
+"""
+load_harness.py — Concurrent-session load test against a local Streamlit server.
+
+Starts `streamlit run app.py` headless, then ramps up simulated browser
+sessions that speak the Streamlit websocket protocol directly (BackMsg /
+ForwardMsg protobufs). Each session loops through scripted flows:
+
+    one_tailed   record a decision from the One-Tailed explorer (new x̄, α, direction)
+    two_tailed   record a decision from the Two-Tailed explorer (new α)
+    non_finance  switch everyday cases and α
+    mcq          open the MCQ quiz and answer questions
+
+A warm-up round (--warmup seconds at the first level's concurrency) runs
+first and is discarded, so cold-start costs — first imports, cache fills,
+the critical-value grid — are not billed to the lowest level. For every
+concurrency level it then reports throughput, p50/p95/p99 rerun latency
+(overall and per flow), error rate, and server CPU and RSS per session,
+and names the saturation point and the flow that degraded first.
+
+    python -m benchmarks.load_harness --levels 1,2,4,8,16,32 --duration 30 --warmup 20
+
+Requires the `websockets` package (installed alongside Streamlit).
+Widget values are encoded for the string-valued widget protocol used by
+Streamlit ≥ 1.40.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from collections import defaultdict
+from pathlib import Path
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+ROOT = Path(__file__).resolve().parent.parent
+
+_FINISHED_OK = {0, 3}       # FINISHED_SUCCESSFULLY, FINISHED_FRAGMENT_RUN_SUCCESSFULLY
+_WIDGET_KINDS = {"number_input", "slider", "radio", "selectbox", "button", "text_input",
+                 "component_instance"}
+
+
+# ═══════════════════════════════════════════════════════════════════
+# SERVER
+# ═══════════════════════════════════════════════════════════════════
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(app, port):
+    cmd = [sys.executable, "-m", "streamlit", "run", str(app),
+           "--server.headless", "true", "--server.port", str(port),
+           "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false"]
+    proc = subprocess.Popen(cmd, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as r:
+                if r.status == 200:
+                    return proc
+        except OSError:
+            time.sleep(0.25)
+    proc.kill()
+    raise RuntimeError("Streamlit server did not become healthy within 60 s")
+
+
+def proc_usage(pid):
+    """(cpu_seconds, rss_bytes) of the server process, from /proc (Linux)."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        cpu = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+        with open(f"/proc/{pid}/status") as f:
+            rss = next(int(l.split()[1]) * 1024 for l in f if l.startswith("VmRSS:"))
+        return cpu, rss
+    except (OSError, StopIteration, IndexError):
+        return None, None
+
+
+# ═══════════════════════════════════════════════════════════════════
+# SIMULATED SESSION
+# ═══════════════════════════════════════════════════════════════════
+class SimSession:
+    """One browser tab: holds widget state and replays it on every rerun."""
+
+    def __init__(self, url, timeout):
+        self.url       = url
+        self.timeout   = timeout
+        self.ws        = None
+        self.widgets   = {}      # user key → (widget id, kind, options)
+        self.fragments = {}      # user key → id of the st.fragment it lives in ("" = none)
+        self.states    = {}      # widget id → WidgetState
+
+    async def connect(self):
+        self.ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+        return await self.rerun()
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+    def _collect(self, fm):
+        """Record widgets from a delta; return True if it is an exception element."""
+        if fm.WhichOneof("type") != "delta" or fm.delta.WhichOneof("type") != "new_element":
+            return False
+        el   = fm.delta.new_element
+        kind = el.WhichOneof("type")
+        if kind == "exception":
+            return True
+        if kind in _WIDGET_KINDS:
+            w = getattr(el, kind)
+            if w.id:
+                key = w.id.rsplit("-", 1)[-1]
+                self.widgets[key] = (w.id, kind, list(getattr(w, "options", [])))
+                self.fragments[key] = fm.delta.fragment_id
+        return False
+
+    async def rerun(self, trigger=None, fragment_id=""):
+        """
+        Send a rerun with the current widget states; return (latency_s, bytes, ok).
+        fragment_id reruns only that st.fragment, as the browser does for widgets inside one.
+        """
+        bm = BackMsg()
+        bm.rerun_script.query_string = ""
+        bm.rerun_script.page_script_hash = ""
+        bm.rerun_script.fragment_id = fragment_id
+        bm.rerun_script.widget_states.widgets.extend(self.states.values())
+        if trigger is not None:
+            bm.rerun_script.widget_states.widgets.append(trigger)
+        t0, nbytes, ok = time.perf_counter(), 0, True
+        await self.ws.send(bm.SerializeToString())
+        while True:
+            raw = await asyncio.wait_for(self.ws.recv(), self.timeout)
+            nbytes += len(raw)
+            fm = ForwardMsg()
+            fm.ParseFromString(raw)
+            if self._collect(fm):
+                ok = False
+            if fm.WhichOneof("type") == "script_finished":
+                ok = ok and fm.script_finished in _FINISHED_OK
+                return time.perf_counter() - t0, nbytes, ok
+
+    def set(self, key, value):
+        """Set a widget's value by user key (string/array encoding, Streamlit ≥ 1.40)."""
+        wid, kind, _ = self.widgets[key]
+        ws = WidgetState(id=wid)
+        if kind == "number_input":
+            ws.double_value = float(value)
+        elif kind == "component_instance":
+            ws.json_value = json.dumps(value)
+        elif kind == "slider":
+            ws.string_array_value.data.extend([str(value)])
+        else:
+            ws.string_value = str(value)
+        self.states[wid] = ws
+
+    def options(self, key):
+        return self.widgets[key][2]
+
+    def has(self, key):
+        return key in self.widgets
+
+
+# ═══════════════════════════════════════════════════════════════════
+# FLOWS — each step mutates widget state and returns the key the user
+# touched; the caller reruns that widget's fragment (or the whole app)
+# ═══════════════════════════════════════════════════════════════════
+# In-browser explorers only reach the server when a decision is recorded.
+def _record(s, key, rnd, **inputs):
+    s.set(key, dict(inputs, z=0.0, p_value=0.5, reject=False, recorded_at=rnd.getrandbits(40)))
+    return key
+
+def _flow_one_tailed(s, rnd):
+    return _record(s, "ot_explorer", rnd, x_bar=round(rnd.uniform(11.0, 15.0), 1), mu_0=12.0, sigma=6.0, n=36,
+            alpha=rnd.choice([0.1, 0.05, 0.025, 0.01]), tail=rnd.choice(["right", "left"]))
+
+def _flow_two_tailed(s, rnd):
+    return _record(s, "tt_explorer", rnd, x_bar=47.5, mu_0=50.0, sigma=12.0, n=64,
+            alpha=rnd.choice([0.1, 0.05, 0.025, 0.01]), tail="two")
+
+def _flow_non_finance(s, rnd):
+    key = rnd.choice(["nf_case", "nf_alpha"])
+    s.set(key, rnd.choice(s.options("nf_case")) if key == "nf_case" else rnd.choice([0.1, 0.05, 0.025, 0.01]))
+    return key
+
+def _flow_mcq(s, rnd):
+    mode = next(o for o in s.options("edu_mode") if "MCQ" in o)
+    s.set("edu_mode", mode)
+    qs = [k for k in s.widgets if k.startswith("mcq_q")]
+    if not qs:
+        return "edu_mode"
+    k = rnd.choice(qs)
+    s.set(k, rnd.choice(s.options(k)))
+    return k
+
+FLOWS = {
+    "one_tailed":  _flow_one_tailed,
+    "two_tailed":  _flow_two_tailed,
+    "non_finance": _flow_non_finance,
+    "mcq":         _flow_mcq,
+}
+
+
+async def _client_loop(url, stop_at, think, timeout, seed, samples):
+    rnd = random.Random(seed)
+    s = SimSession(url, timeout)
+    try:
+        lat, nb, ok = await s.connect()
+        samples["initial"].append((lat, nb, ok))
+        while time.perf_counter() < stop_at:
+            name = rnd.choice(list(FLOWS))
+            try:
+                key = FLOWS[name](s, rnd)
+                lat, nb, ok = await s.rerun(fragment_id=s.fragments.get(key, ""))
+            except (asyncio.TimeoutError, websockets.ConnectionClosed):
+                lat, nb, ok = timeout, 0, False
+            except KeyError:          # widget not rendered yet on this page
+                continue
+            samples[name].append((lat, nb, ok))
+            if think:
+                await asyncio.sleep(rnd.expovariate(1 / think))
+    except (OSError, asyncio.TimeoutError, websockets.ConnectionClosed):
+        samples["connect"].append((timeout, 0, False))
+    finally:
+        await s.close()
+
+
+def _pct(xs, q):
+    if not xs:
+        return float("nan")
+    xs = sorted(xs)
+    return xs[min(len(xs) - 1, int(round(q / 100 * (len(xs) - 1))))]
+
+
+async def run_level(url, n, duration, think, timeout, pid, baseline_rss):
+    samples = defaultdict(list)
+    cpu0, _ = proc_usage(pid)
+    t0 = time.perf_counter()
+    stop_at = t0 + duration
+    await asyncio.gather(*(_client_loop(url, stop_at, think, timeout, 1000 * n + i, samples)
+                           for i in range(n)))
+    elapsed = time.perf_counter() - t0
+    cpu1, rss = proc_usage(pid)
+
+    flows = {}
+    all_lat, total, errors = [], 0, 0
+    for name, rows in samples.items():
+        if name in ("initial", "connect"):
+            continue
+        lats = [r[0] for r in rows if r[2]]
+        errs = sum(1 for r in rows if not r[2])
+        all_lat += lats; total += len(rows); errors += errs
+        flows[name] = dict(count=len(rows), errors=errs,
+                           p50=_pct(lats, 50), p95=_pct(lats, 95), p99=_pct(lats, 99),
+                           kib=statistics.fmean(r[1] for r in rows) / 1024 if rows else 0.0)
+    errors += sum(1 for r in samples["connect"])
+    return dict(
+        sessions=n, seconds=elapsed, reruns=total, errors=errors,
+        throughput=total / elapsed if elapsed else 0.0,
+        p50=_pct(all_lat, 50), p95=_pct(all_lat, 95), p99=_pct(all_lat, 99),
+        cpu_s_per_session=((cpu1 - cpu0) / n) if cpu0 is not None else None,
+        cpu_util=((cpu1 - cpu0) / elapsed) if cpu0 is not None else None,
+        rss_mib=rss / 2**20 if rss else None,
+        rss_mib_per_session=((rss - baseline_rss) / n / 2**20) if rss and baseline_rss else None,
+        first_paint_p95=_pct([r[0] for r in samples["initial"] if r[2]], 95),
+        flows=flows,
+    )
+
+
+# ═══════════════════════════════════════════════════════════════════
+# REPORT
+# ═══════════════════════════════════════════════════════════════════
+def _fmt(v, spec=".3f"):
+    return "—" if v is None or v != v else format(v, spec)
+
+
+def _breach(level, slo):
+    return level["p95"] > slo or level["errors"] > 0
+
+
+def analyse(levels, slo):
+    """
+    Saturation = first level after the first whose throughput gains < 10 % on the level before,
+    or that breaks the SLO (p95 or errors) when the level before did not. A breach already at
+    the first level is not caused by load, so on its own it never names a saturation point.
+    """
+    saturation, first_fail = None, None
+    for prev, cur in zip([None] + levels[:-1], levels):
+        if saturation is None and prev is not None:
+            flat = cur["throughput"] < prev["throughput"] * 1.10
+            if flat or (_breach(cur, slo) and not _breach(prev, slo)):
+                saturation = cur["sessions"]
+        if first_fail is None:
+            bad = [(f["p95"], name) for name, f in cur["flows"].items()
+                   if f["errors"] or f["p95"] > slo]
+            if bad:
+                first_fail = (cur["sessions"], max(bad)[1])
+    return saturation, first_fail
+
+
+def print_report(levels, slo):
+    print(f'\n{"sessions":>8} {"reruns/s":>9} {"p50 s":>7} {"p95 s":>7} {"p99 s":>7} '
+          f'{"errors":>6} {"cpu util":>8} {"cpu s/sess":>10} {"rss MiB":>8} {"MiB/sess":>8}')
+    for r in levels:
+        print(f'{r["sessions"]:>8} {r["throughput"]:>9.2f} {_fmt(r["p50"]):>7} {_fmt(r["p95"]):>7} '
+              f'{_fmt(r["p99"]):>7} {r["errors"]:>6} {_fmt(r["cpu_util"], ".2f"):>8} '
+              f'{_fmt(r["cpu_s_per_session"], ".2f"):>10} {_fmt(r["rss_mib"], ".0f"):>8} '
+              f'{_fmt(r["rss_mib_per_session"], ".1f"):>8}')
+    print("\nPer-flow p95 latency (s) by concurrency:")
+    names = sorted({n for r in levels for n in r["flows"]})
+    print(f'{"sessions":>8} ' + " ".join(f"{n:>12}" for n in names))
+    for r in levels:
+        print(f'{r["sessions"]:>8} ' + " ".join(
+            f'{_fmt(r["flows"].get(n, {}).get("p95")):>12}' for n in names))
+
+    saturation, first_fail = analyse(levels, slo)
+    print()
+    if _breach(levels[0], slo):
+        print(f"Note: the SLO is already broken at {levels[0]['sessions']} session(s) — that is "
+              f"per-rerun cost, not contention; lengthen --warmup or profile the slow flow")
+    print(f"Saturation point: {saturation} concurrent sessions" if saturation
+          else "Saturation point: not reached — extend --levels")
+    print(f"First flow to break the {slo:.1f} s p95 SLO: {first_fail[1]} at {first_fail[0]} sessions"
+          if first_fail else f"No flow broke the {slo:.1f} s p95 SLO")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--app", default=str(ROOT / "app.py"))
+    ap.add_argument("--url", help="use an already-running server (ws://host:port/_stcore/stream)")
+    ap.add_argument("--levels", default="1,2,4,8,16,32",
+                    help="comma-separated concurrent session counts")
+    ap.add_argument("--duration", type=float, default=30, help="seconds per level")
+    ap.add_argument("--warmup", type=float, default=20,
+                    help="seconds of discarded load before the first level (0 = none)")
+    ap.add_argument("--think", type=float, default=1.0, help="mean think time between actions (s)")
+    ap.add_argument("--timeout", type=float, default=60, help="per-rerun timeout (s)")
+    ap.add_argument("--slo", type=float, default=2.0, help="p95 rerun latency target (s)")
+    ap.add_argument("--json", help="also write the raw results to this file")
+    args = ap.parse_args(argv)
+
+    proc = None
+    if args.url:
+        url, pid = args.url, None
+    else:
+        port = _free_port()
+        proc = start_server(args.app, port)
+        url, pid = f"ws://127.0.0.1:{port}/_stcore/stream", proc.pid
+    try:
+        counts = [int(x) for x in args.levels.split(",")]
+        if args.warmup > 0:
+            print(f"… warm-up: {counts[0]} session(s) for {args.warmup:.0f} s (discarded)", flush=True)
+            asyncio.run(run_level(url, counts[0], args.warmup, args.think, args.timeout, pid, None))
+        _, baseline_rss = proc_usage(pid) if pid else (None, None)
+        levels = []
+        for n in counts:
+            print(f"… {n} session(s) for {args.duration:.0f} s", flush=True)
+            levels.append(asyncio.run(run_level(url, n, args.duration, args.think,
+                                                args.timeout, pid, baseline_rss)))
+        print_report(levels, args.slo)
+        if args.json:
+            Path(args.json).write_text(json.dumps(levels, indent=2))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait(10)
+
+
+if __name__ == "__main__":
+    main()
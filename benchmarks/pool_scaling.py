@@ -0,0 +1,82 @@
+"""
+pool_scaling.py — Shared-memory PanelPool vs pickling ProcessPoolExecutor, 1 → all cores.
+
+Runs the rolling alpha test (rolling.rolling_t_test, 36-month window) over
+a T × k return panel split into column chunks, and reports wall time,
+speed-up over a single in-process run, and the bytes shipped to workers:
+
+    pickle   ProcessPoolExecutor.map over X[:, chunk] — every chunk pickled
+    shared   PanelPool — panel copied into shared memory once, tasks carry slices
+
+    python -m benchmarks.pool_scaling --months 600 --funds 20000
+"""
+import argparse
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from panel_pool import PanelPool, _chunks
+from rolling import rolling_t_test
+
+WINDOW = 36
+
+
+def reject_share(block, window=WINDOW):
+    """Per fund: share of trailing windows where H₀ (alpha ≤ 0) is rejected — k floats back."""
+    return rolling_t_test(block, window, tail="right").reject.mean(axis=0)
+
+
+def _pickled(X, parts, workers):
+    chunks = [X[:, s] for s in _chunks(X.shape[1], parts)]
+    sent = sum(len(pickle.dumps(c, protocol=pickle.HIGHEST_PROTOCOL)) for c in chunks)
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        out = np.concatenate(list(ex.map(reject_share, chunks)))
+    return time.perf_counter() - t0, sent, out
+
+
+def _shared(X, parts, workers):
+    t0 = time.perf_counter()
+    with PanelPool(X, workers=workers) as pool:
+        idx = pool.column_slices(parts)
+        out = np.concatenate(pool.map(reject_share, idx))
+    sent = sum(len(pickle.dumps((pool.panel.name, reject_share, i, (), {}))) for i in idx)
+    return time.perf_counter() - t0, sent, out
+
+
+def worker_counts(max_workers):
+    counts, w = [], 1
+    while w < max_workers:
+        counts.append(w)
+        w *= 2
+    return counts + [max_workers]
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Scaling benchmark for the shared-memory panel pool.")
+    ap.add_argument("--months", type=int, default=600)
+    ap.add_argument("--funds", type=int, default=20_000)
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="largest worker count")
+    ap.add_argument("--chunks-per-worker", type=int, default=4)
+    args = ap.parse_args(argv)
+
+    X = np.random.default_rng(0).normal(0.4, 4.0, (args.months, args.funds))
+    t0 = time.perf_counter()
+    ref = reject_share(X)
+    serial = time.perf_counter() - t0
+    print(f"panel {X.shape[0]} × {X.shape[1]} = {X.nbytes / 2**20:.0f} MiB, "
+          f"{os.cpu_count()} cores, in-process run {serial:.2f} s\n")
+    print(f'{"workers":>7} {"mode":>7} {"wall s":>8} {"speed-up":>8} {"MiB to workers":>14} {"match":>6}')
+    for w in worker_counts(args.workers):
+        parts = w * args.chunks_per_worker
+        for mode, run in (("pickle", _pickled), ("shared", _shared)):
+            wall, sent, out = run(X, parts, w)
+            print(f'{w:>7} {mode:>7} {wall:>8.2f} {serial / wall:>7.2f}× {sent / 2**20:>14.2f} '
+                  f'{str(np.array_equal(out, ref)):>6}')
+
+
+if __name__ == "__main__":
+    main()
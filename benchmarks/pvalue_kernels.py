@@ -0,0 +1,97 @@
+"""
+pvalue_kernels.py — pvalues.py ufunc kernels vs the scipy.stats expressions they replace.
+
+Latency: per-call time on a Python scalar (what every calculator does) and
+per-element time on an array, for each p-value / critical-value form the
+app used. Accuracy: over a grid of statistics and df, the largest relative
+difference from the old expression where that expression is still
+meaningful, and how many deep-tail points the old `1 − cdf` form rounded
+to 0 (or to a few ulps) while the survival form keeps full precision.
+
+    python -m benchmarks.pvalue_kernels --array 100000
+"""
+import argparse
+import timeit
+
+import numpy as np
+import scipy.stats as stats
+
+import pvalues as pv
+
+# name → (old expression, new expression); each takes (x, df)
+CASES = {
+    "z right p":    (lambda x, df: 1 - stats.norm.cdf(x),               lambda x, df: pv.p_value(x, "right")),
+    "z left p":     (lambda x, df: stats.norm.cdf(x),                   lambda x, df: pv.p_value(x, "left")),
+    "z two p":      (lambda x, df: 2 * (1 - stats.norm.cdf(np.abs(x))), lambda x, df: pv.p_value(x, "two")),
+    "t right p":    (lambda x, df: 1 - stats.t.cdf(x, df),              lambda x, df: pv.p_value(x, "right", df)),
+    "t two p":      (lambda x, df: 2 * (1 - stats.t.cdf(np.abs(x), df)), lambda x, df: pv.p_value(x, "two", df)),
+}
+CRIT_CASES = {
+    "z two crit":   (lambda a, df: stats.norm.ppf(1 - a / 2),           lambda a, df: pv.critical(a, "two")),
+    "t two crit":   (lambda a, df: stats.t.ppf(1 - a / 2, df),          lambda a, df: pv.critical(a, "two", df)),
+}
+
+
+def _per_call(fn, arg, df, number):
+    return min(timeit.repeat(lambda: fn(arg, df), number=number, repeat=5)) / number
+
+
+def latency(array_size, number=2000):
+    rows = []
+    rnd = np.random.default_rng(0)
+    xs = rnd.normal(0, 2, array_size)
+    qs = rnd.uniform(1e-4, 0.2, array_size)
+    for name, (old, new) in {**CASES, **CRIT_CASES}.items():
+        scalar, arr = (0.05, qs) if name in CRIT_CASES else (1.7, xs)
+        rows.append(dict(
+            name=name,
+            old_us=_per_call(old, scalar, 30, number) * 1e6,
+            new_us=_per_call(new, scalar, 30, number) * 1e6,
+            old_ns=_per_call(old, arr, 30, 20) / array_size * 1e9,
+            new_ns=_per_call(new, arr, 30, 20) / array_size * 1e9,
+        ))
+    return rows
+
+
+def accuracy():
+    """Compare against the old expression and against scipy.stats' own sf (the reference)."""
+    x = np.linspace(-40, 40, 16001)
+    rows = []
+    for name, (old, new) in CASES.items():
+        for df in ([None] if name.startswith("z") else [3, 30, 120]):
+            o = old(x, df)
+            n = new(x, df)
+            dist = stats.norm if df is None else stats.t(df)
+            tail = name.split()[1]
+            ref = {"right": dist.sf(x), "left": dist.cdf(x), "two": 2 * dist.sf(np.abs(x))}[tail]
+            ok = o > 1e-6                                  # old form still has ≥ 10 good digits
+            rows.append(dict(
+                name=name, df=df,
+                max_rel_vs_old=float(np.max(np.abs(n[ok] - o[ok]) / o[ok])),
+                max_rel_vs_ref=float(np.max(np.abs(n - ref) / np.where(ref > 0, ref, 1))),
+                old_zero=int(np.sum((o == 0) & (n > 0))),
+                old_bad=int(np.sum(np.abs(o - ref) > 1e-3 * ref)),
+            ))
+    return rows
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark the p-value kernels.")
+    ap.add_argument("--array", type=int, default=100_000, help="array length for the vectorised timing")
+    args = ap.parse_args(argv)
+
+    print(f'{"form":<12} {"old µs/call":>11} {"new µs/call":>11} {"speed-up":>8} '
+          f'{"old ns/elem":>11} {"new ns/elem":>11}')
+    for r in latency(args.array):
+        print(f'{r["name"]:<12} {r["old_us"]:>11.2f} {r["new_us"]:>11.2f} {r["old_us"] / r["new_us"]:>7.0f}× '
+              f'{r["old_ns"]:>11.2f} {r["new_ns"]:>11.2f}')
+
+    print(f'\n{"form":<12} {"df":>4} {"max rel Δ vs old":>17} {"max rel Δ vs sf":>16} '
+          f'{"old → 0":>8} {"old off >0.1%":>13}')
+    for r in accuracy():
+        print(f'{r["name"]:<12} {str(r["df"] or "—"):>4} {r["max_rel_vs_old"]:>17.2e} '
+              f'{r["max_rel_vs_ref"]:>16.2e} {r["old_zero"]:>8} {r["old_bad"]:>13}')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+result_grid.py — What a large result table costs per rerun: inline-HTML table vs paged grid.
+
+For N strategy-screen rows (random t, p, flags) it measures
+
+    table_html   components.table_html over all N rows — bytes sent and build time
+    grid page    data_grid.matching_rows + sorted_page (filter, full sort) and one page
+                 as Arrow — what result_grid hands to st.dataframe
+
+    python -m benchmarks.result_grid --rows 1000,5000,50000 --page 50
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from streamlit import dataframe_util
+
+from html_parts import table_html, txt_s, hl, vf, vr
+from data_grid import matching_rows, sorted_page
+
+
+def columns(n, seed=0):
+    rng = np.random.default_rng(seed)
+    t = rng.normal(0.3, 1.2, n)
+    return {
+        "Strategy": np.array([f"S{i:05d}" for i in range(n)]),
+        "Mean excess (%/mo)": rng.normal(0.1, 0.4, n),
+        "t": t, "df": np.full(n, 59.0), "p-value": rng.uniform(0, 1, n),
+        "Significant": t > 1.671, "True alpha": np.arange(n) % 10 == 0,
+    }
+
+
+def _ms(fn, reps=3):
+    best = float("inf")
+    for _ in range(reps):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return out, best * 1e3
+
+
+def html_table(cols):
+    return table_html(list(cols), [
+        [txt_s(s), txt_s(f"{d:+.3f}"), hl(f"{t:.3f}"), txt_s(f"{df:.1f}"), txt_s(f"{p:.2e}"),
+         vf("yes") if sig else vr("no"), vf("yes") if true else vr("no")]
+        for s, d, t, df, p, sig, true in zip(*cols.values())
+    ])
+
+
+def grid_page(cols, page_size):
+    idx = matching_rows(cols, flags=("Significant",))
+    rows = sorted_page(cols, idx, "p-value", True, 1, page_size)
+    frame = pd.DataFrame({h: c[rows] for h, c in cols.items()})
+    return dataframe_util.convert_pandas_df_to_arrow_bytes(frame)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Inline-HTML table vs server-paged st.dataframe grid.")
+    ap.add_argument("--rows", default="1000,5000,50000")
+    ap.add_argument("--page", type=int, default=50)
+    args = ap.parse_args(argv)
+
+    print(f'{"rows":>7} {"html KB":>9} {"html ms":>8} {"page KB":>8} {"page ms":>8}')
+    for n in (int(x) for x in args.rows.split(",")):
+        cols = columns(n)
+        html, h_ms = _ms(lambda: html_table(cols))
+        page, g_ms = _ms(lambda: grid_page(cols, args.page))
+        print(f"{n:>7,} {len(html.encode()) / 1024:>9,.0f} {h_ms:>8.1f} {len(page) / 1024:>8.1f} {g_ms:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+rolling_tests.py — Rolling alpha test: prefix-sum engine vs window-by-window.
+
+For a T-month × k-fund panel, times the full rolling one-sample t-test
+(statistic, p-value, decision for every trailing window of every fund)
+three ways:
+
+    scipy loop   scipy.stats.ttest_1samp per fund per window (what the
+                 quarterly review scripts do) — timed on a few funds and
+                 scaled up to k
+    window loop  rolling_t_test_naive: O(T·w), vectorised across funds
+    prefix       rolling_t_test: O(T), vectorised across funds
+
+The "stat" columns time the window moments alone (no p-values), where the
+O(T·w) vs O(T) difference shows; the p-value ufunc costs the same for both.
+Also checks that the prefix engine's t-statistics match the window loop.
+
+    python -m benchmarks.rolling_tests --months 120,360,1200 --funds 2000
+    python -m benchmarks.rolling_tests --months 240 --funds 1000   # the One-Tailed tab's peer panel
+
+The tab computes that panel once per (window, α) per process (tabs._rolling_panel)
+and no longer shows its timing; this is where to measure it.
+"""
+import argparse
+import time
+
+import numpy as np
+import scipy.stats as stats
+
+from rolling import rolling_moments, prefix_moments, rolling_t_test, rolling_t_test_naive
+
+
+def _time(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def _scipy_loop(X, window, mu0):
+    T = X.shape[0]
+    for j in range(X.shape[1]):
+        for i in range(T - window + 1):
+            stats.ttest_1samp(X[i:i + window, j], mu0, alternative="greater")
+
+
+def _loop_moments(X, window):
+    T = X.shape[0]
+    for i in range(T - window + 1):
+        W = X[i:i + window]
+        W.mean(axis=0), W.var(axis=0, ddof=1)
+
+
+def run(months, funds, window, mu0=0.5, scipy_funds=3, seed=0):
+    X = np.random.default_rng(seed).normal(0.6, 4.0, (months, funds))
+    t_scipy, _ = _time(lambda: _scipy_loop(X[:, :scipy_funds], window, mu0), repeat=1)
+    t_naive, (tn, _, rn) = _time(lambda: rolling_t_test_naive(X, window, mu0))
+    t_fast, r = _time(lambda: rolling_t_test(X, window, mu0))
+    t_stat, _ = _time(lambda: rolling_moments(prefix_moments(X), window))
+    t_loop_stat, _ = _time(lambda: _loop_moments(X, window))
+    return dict(
+        months=months, funds=funds, window=window,
+        scipy_s=t_scipy * funds / scipy_funds, naive_s=t_naive, prefix_s=t_fast,
+        loop_stat_s=t_loop_stat, prefix_stat_s=t_stat,
+        max_abs_t=float(np.nanmax(np.abs(r.t - tn))), decisions_differ=int((r.reject != rn).sum()),
+    )
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark the rolling t-test engine.")
+    ap.add_argument("--months", default="120,360,1200", help="comma-separated history lengths")
+    ap.add_argument("--funds", type=int, default=2000)
+    ap.add_argument("--windows", default="36,60")
+    args = ap.parse_args(argv)
+
+    print(f'{"T":>5} {"w":>3} {"funds":>6} {"scipy loop s":>12} {"window loop s":>13} '
+          f'{"prefix s":>9} {"vs scipy":>9} {"loop stat s":>11} {"prefix stat s":>13} {"stat ×":>7} '
+          f'{"max |Δt|":>9} {"Δdecisions":>10}')
+    for T in map(int, args.months.split(",")):
+        for w in map(int, args.windows.split(",")):
+            if w >= T:
+                continue
+            r = run(T, args.funds, w)
+            print(f'{T:>5} {w:>3} {r["funds"]:>6} {r["scipy_s"]:>12.1f} {r["naive_s"]:>13.3f} '
+                  f'{r["prefix_s"]:>9.3f} {r["scipy_s"] / r["prefix_s"]:>8.0f}× '
+                  f'{r["loop_stat_s"]:>11.3f} {r["prefix_stat_s"]:>13.3f} '
+                  f'{r["loop_stat_s"] / r["prefix_stat_s"]:>6.1f}× '
+                  f'{r["max_abs_t"]:>9.1e} {r["decisions_differ"]:>10}')
+
+
+if __name__ == "__main__":
+    main()
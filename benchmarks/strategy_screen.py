@@ -0,0 +1,93 @@
+"""
+strategy_screen.py — The Two-Sample tab's strategy screen: computed vs read from the result store.
+
+For k simulated strategies (as in tab_two_sample: a benchmark plus k strategies,
+every tenth with +0.5 %/mo alpha) it times one screen
+
+    computed     simulate, two_sample.against_benchmark over all k columns, then
+                 encode and put the summary into a fresh result store
+    store hit    ResultStore.get_or_compute with the summary already stored
+
+and reports the stored size per screen.
+
+    python -m benchmarks.strategy_screen --strategies 200,1000,5000 --months 60
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from result_store import ResultStore
+from two_sample import against_benchmark
+
+
+def _simulated_returns(k, months, seed=7):
+    rng   = np.random.default_rng(seed)
+    bench = rng.normal(0.8, 4.0, months)
+    alpha = np.where(np.arange(k) % 10 == 0, 0.5, 0.0)
+    beta  = rng.uniform(0.7, 1.3, k)
+    noise = rng.normal(0.0, 1.0, (months, k)) * rng.uniform(0.8, 3.0, k)
+    return bench, bench[:, None] * beta + alpha + noise, alpha > 0
+
+
+def _summary(k, months, method):
+    bench, R, true_alpha = _simulated_returns(k, months)
+    r = against_benchmark(R, bench, method=method, tail="right", alpha=0.05)
+    return dict(
+        hits=int(r.reject.sum()), true_hits=int((r.reject & true_alpha).sum()),
+        diff=r.diff, t=r.t, df=r.df, p=r.p, reject=r.reject, true_alpha=true_alpha,
+    )
+
+
+def _time(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def run(k, months, method, tmp):
+    inputs = dict(data="simulated", k=k, months=months, seed=7, method=method, rows="all")
+
+    def cold():
+        path = os.path.join(tmp, f"cold-{k}-{time.perf_counter_ns()}.sqlite")
+        store = ResultStore(path)
+        try:
+            return store.get_or_compute("strategy_screen", inputs, "right", 0.05,
+                                        lambda: _summary(k, months, method))
+        finally:
+            store.close()
+
+    t_cold, _ = _time(cold)
+    store = ResultStore(os.path.join(tmp, f"warm-{k}.sqlite"))
+    try:
+        store.get_or_compute("strategy_screen", inputs, "right", 0.05, lambda: _summary(k, months, method))
+        t_hit, _ = _time(lambda: store.get_or_compute("strategy_screen", inputs, "right", 0.05,
+                                                      lambda: _summary(k, months, method)))
+        size = store.total_bytes()
+    finally:
+        store.close()
+    return dict(strategies=k, cold_s=t_cold, hit_s=t_hit, stored_bytes=size)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark the strategy screen with and without the result store.")
+    ap.add_argument("--strategies", default="200,1000,5000", help="comma-separated strategy counts")
+    ap.add_argument("--months", type=int, default=60)
+    ap.add_argument("--method", choices=["paired", "welch"], default="paired")
+    args = ap.parse_args(argv)
+
+    print(f'{"strategies":>10} {"computed ms":>11} {"store hit ms":>12} {"speed-up":>9} {"stored KB":>9}')
+    with tempfile.TemporaryDirectory() as tmp:
+        for k in map(int, args.strategies.split(",")):
+            r = run(k, args.months, args.method, tmp)
+            print(f'{k:>10,} {r["cold_s"] * 1e3:>11.1f} {r["hit_s"] * 1e3:>12.2f} '
+                  f'{r["cold_s"] / r["hit_s"]:>8.0f}× {r["stored_bytes"] / 1024:>9.0f}')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+build_fonts.py — Subset the app's three typefaces into static/fonts/.
+
+Only the glyphs the app can actually show are kept: Basic Latin + Latin-1,
+Greek, sub/superscripts, general punctuation, arrows and math operators,
+plus every other character found in the source and content files. Variable
+weight axes are preserved, so one file per family covers every weight used.
+
+    python build_fonts.py --src path/to/ttfs   # upstream OFL .ttf files
+    python build_fonts.py --fetch --strict     # deploy step: download, build, fail if a face is missing
+
+static/fonts/ is a build output (gitignored), so run this as part of every
+deploy, after `pip install -r requirements-build.txt` (fontTools, brotli).
+Looks in --src (default fonts_src/) for each family's TTF; --fetch first
+downloads any that are missing from the google/fonts repository. Writes
+WOFF2 when the `brotli` package is installed, WOFF otherwise; with brotli,
+Source Sans falls back to the copy bundled with Streamlit. styles.py
+declares whichever faces were built.
+"""
+import argparse
+import urllib.request
+from pathlib import Path
+from urllib.parse import quote
+
+from fontTools import subset
+from fontTools.ttLib import TTFont
+
+from styles import FONT_FACES, FONTS_DIR
+
+ROOT = Path(__file__).parent
+
+# Code-point ranges always kept, whether or not they appear in the text today.
+BASE_RANGES = [
+    (0x0020, 0x007E),   # Basic Latin
+    (0x00A0, 0x00FF),   # Latin-1 (×, ±, ², ³, °, ·, ¹ …)
+    (0x0370, 0x03FF),   # Greek (α β μ σ χ …)
+    (0x2000, 0x206F),   # General punctuation (– — ' " … ‖)
+    (0x2070, 0x209F),   # Super/subscripts (₀ ₁ ₂ ⁻ …)
+    (0x2190, 0x21FF),   # Arrows
+    (0x2200, 0x22FF),   # Math operators (≠ ≤ ≥ √ ∑ ∞ …)
+    (0x0300, 0x036F),   # Combining marks (x̄, p̂)
+]
+
+# Candidate source filenames per family, first match wins.
+SOURCES = {
+    "Playfair Display": ["PlayfairDisplay[wght].ttf", "PlayfairDisplay-VariableFont_wght.ttf",
+                         "PlayfairDisplay-Regular.ttf"],
+    "Source Sans Pro":  ["SourceSans3[wght].ttf", "SourceSans3-VariableFont_wght.ttf",
+                         "SourceSansPro-Regular.ttf"],
+    "JetBrains Mono":   ["JetBrainsMono[wght].ttf", "JetBrainsMono-VariableFont_wght.ttf",
+                         "JetBrainsMono-Regular.ttf"],
+}
+
+# Where --fetch downloads each family's first SOURCES name from (OFL, google/fonts).
+UPSTREAM = "https://github.com/google/fonts/raw/main/ofl/"
+UPSTREAM_DIRS = {"Playfair Display": "playfairdisplay", "Source Sans Pro": "sourcesans3",
+                 "JetBrains Mono": "jetbrainsmono"}
+
+
+def fetch(src_dir: Path):
+    """Download the upstream TTF of every family that has no source file in src_dir yet."""
+    src_dir.mkdir(parents=True, exist_ok=True)
+    for family, names in SOURCES.items():
+        if any((src_dir / n).exists() for n in names):
+            continue
+        url = f"{UPSTREAM}{UPSTREAM_DIRS[family]}/{quote(names[0])}"
+        print(f"  fetch {url}")
+        with urllib.request.urlopen(url, timeout=60) as resp:
+            data = resp.read()
+        (src_dir / names[0]).write_bytes(data)
+
+
+def _bundled_source_sans():
+    import streamlit
+    media = Path(streamlit.__file__).parent / "static" / "static" / "media"
+    return next(iter(sorted(media.glob("SourceSansVF-Upright*.woff2"))), None)
+
+
+def used_codepoints() -> set:
+    """BASE_RANGES plus every character in the app's .py and content files."""
+    cps = {cp for lo, hi in BASE_RANGES for cp in range(lo, hi + 1)}
+    for path in [*ROOT.glob("*.py"), *ROOT.glob("content/*.jsonl")]:
+        cps.update(ord(ch) for ch in path.read_text(encoding="utf-8") if ord(ch) >= 0x20)
+    return cps
+
+
+def _flavor():
+    try:
+        import brotli  # noqa: F401
+        return "woff2"
+    except ImportError:
+        return "woff"
+
+
+def subset_font(src: Path, dest: Path, codepoints: set, flavor: str):
+    opts = subset.Options()
+    opts.flavor           = flavor
+    opts.layout_features  = ["*"]          # keep kerning, ligatures, tabular figures
+    opts.name_IDs         = ["*"]
+    opts.notdef_outline   = True
+    opts.hinting          = False           # hints are dead weight on modern rasterisers
+    opts.desubroutinize   = True            # compresses better
+    font = TTFont(src)
+    sub = subset.Subsetter(opts)
+    sub.populate(unicodes=codepoints)
+    sub.subset(font)
+    font.flavor = flavor
+    font.save(dest)
+
+
+def build(src_dir: Path, out_dir: Path = FONTS_DIR) -> dict:
+    """Subset every family found; returns {family: (written path, bytes)}."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    flavor, cps, built = _flavor(), used_codepoints(), {}
+    for face in FONT_FACES:
+        family = face["family"]
+        src = next((src_dir / n for n in SOURCES[family] if (src_dir / n).exists()), None)
+        if src is None and family == "Source Sans Pro" and flavor == "woff2":
+            src = _bundled_source_sans()        # shipped as WOFF2: reading it needs brotli too
+        if src is None:
+            print(f"  skip  {family}: none of {SOURCES[family]} in {src_dir}")
+            continue
+        for stale in out_dir.glob(face["stem"] + ".*"):
+            stale.unlink()
+        dest = out_dir / f'{face["stem"]}.{flavor}'
+        subset_font(src, dest, cps, flavor)
+        built[family] = (dest, dest.stat().st_size)
+        print(f"  {src.stat().st_size / 1024:7.1f} KiB → {dest.stat().st_size / 1024:6.1f} KiB  "
+              f"{family} ({dest.name})")
+    return built
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Subset the app fonts into static/fonts/.")
+    ap.add_argument("--src", default=str(ROOT / "fonts_src"), help="directory with the source .ttf files")
+    ap.add_argument("--fetch", action="store_true", help="download missing source .ttf files first")
+    ap.add_argument("--strict", action="store_true", help="exit 1 unless every face was built")
+    args = ap.parse_args(argv)
+    if args.fetch:
+        fetch(Path(args.src))
+    built = build(Path(args.src))
+    return 1 if args.strict and len(built) < len(FONT_FACES) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
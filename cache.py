@@ -0,0 +1,132 @@
+"""
+cache.py — Process-wide cache shared by every Streamlit session.
+Deterministic artifacts (quantiles, rendered figures, static HTML
+fragments, case results) are computed once per process instead of once
+per session. Each namespace has its own memory limit, TTL, LRU eviction
+and hit/miss statistics.
+"""
+import functools
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+# ── Namespace limits ──────────────────────────────────────────────
+# ttl=None → entries never expire (pure functions of their key).
+NAMESPACES = {
+    "quantiles": dict(max_bytes=2 * 2**20,  ttl=None),
+    "figures":   dict(max_bytes=96 * 2**20, ttl=6 * 3600),
+    "html":      dict(max_bytes=16 * 2**20, ttl=None),
+    "cases":     dict(max_bytes=2 * 2**20,  ttl=None),
+}
+
+
+def _sizeof(value) -> int:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(_sizeof(v) for v in value)
+    nbytes = getattr(value, "nbytes", None)          # numpy arrays
+    return nbytes if isinstance(nbytes, int) else sys.getsizeof(value)
+
+
+class _Namespace:
+    """LRU map bounded by total value size, with optional per-entry TTL."""
+
+    def __init__(self, name, max_bytes, ttl):
+        self.name      = name
+        self.max_bytes = max_bytes
+        self.ttl       = ttl
+        self._entries  = OrderedDict()     # key → (value, size, expires_at)
+        self._bytes    = 0
+        self._lock     = threading.Lock()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            value, size, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._drop(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        size = _sizeof(value)
+        if size > self.max_bytes:
+            return value                    # never cacheable — don't flush everything else
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (value, size, expires_at)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+        return value
+
+    def _drop(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return dict(entries=len(self._entries), bytes=self._bytes,
+                        max_bytes=self.max_bytes, ttl=self.ttl,
+                        hits=self.hits, misses=self.misses,
+                        hit_rate=self.hits / lookups if lookups else 0.0,
+                        evictions=self.evictions, expirations=self.expirations)
+
+
+class SharedCache:
+    def __init__(self, namespaces: dict):
+        self._ns = {name: _Namespace(name, **cfg) for name, cfg in namespaces.items()}
+
+    def namespace(self, name) -> _Namespace:
+        return self._ns[name]
+
+    def get_or_compute(self, namespace, key, compute):
+        ns = self._ns[namespace]
+        missing = object()
+        value = ns.get(key, missing)
+        if value is missing:
+            value = ns.put(key, compute())
+        return value
+
+    def clear(self, namespace=None):
+        for name, ns in self._ns.items():
+            if namespace in (None, name):
+                ns.clear()
+
+    def stats(self) -> dict:
+        return {name: ns.stats() for name, ns in self._ns.items()}
+
+
+shared_cache = SharedCache(NAMESPACES)
+
+
+def cached(namespace: str):
+    """Memoise a pure function in a shared namespace, keyed on its arguments."""
+    def deco(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = (fn.__module__, fn.__qualname__, args, tuple(sorted(kwargs.items())))
+            return shared_cache.get_or_compute(namespace, key, lambda: fn(*args, **kwargs))
+        return wrapper
+    return deco
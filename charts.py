@@ -1,7 +1,20 @@
 """
 charts.py — SVG distribution charts for hypothesis testing visualizations
 All charts rendered as inline SVG via st.markdown for pixel-perfect styling.
+Tail charts are drawn from the real normal / t density with rejection
+regions at the true quantiles, for any α, tail and df; each parameter set
+is built once per process (cache namespace "html").
 """
+import numpy as np
+import scipy.stats as stats
+
+from cache import cached
+from critical_grid import converged_df, curve
+from pvalues import critical
+
+# Samples along the visible curve / along each shaded tail
+_CURVE_PTS = 97
+_TAIL_PTS  = 33
 
 
 def normal_curve_overview() -> str:
@@ -29,124 +42,336 @@ def normal_curve_overview() -> str:
 </svg>"""
 
 
-def right_tailed_chart() -> str:
-    return """
-<svg width="100%" viewBox="0 0 310 175" style="max-width:310px;display:block;margin:8px auto">
-  <defs>
-    <linearGradient id="rg1" x1="0%" y1="0%" x2="100%" y2="0%">
-      <stop offset="0%"   style="stop-color:#003366;stop-opacity:.4"/>
-      <stop offset="75%"  style="stop-color:#004d80;stop-opacity:.65"/>
-      <stop offset="100%" style="stop-color:#dc3545;stop-opacity:.7"/>
-    </linearGradient>
-  </defs>
-  <path d="M8,148 Q22,147 38,140 Q62,126 88,92 Q110,62 128,42
-           Q140,28 155,28 Q170,28 182,36 Q198,50 215,74
-           Q235,108 255,132 Q268,148 300,148Z"
-        fill="url(#rg1)" stroke="#ADD8E6" stroke-width="1.5"/>
-  <path d="M235,108 Q255,132 268,148 Q283,152 300,148 L300,148 L235,148Z"
-        fill="rgba(220,53,69,.65)" stroke="#dc3545" stroke-width="2"/>
-  <line x1="235" y1="108" x2="235" y2="152" stroke="#dc3545" stroke-width="2" stroke-dasharray="4"/>
-  <text x="235" y="166" fill="#dc3545" font-size="10" text-anchor="middle" font-family="JetBrains Mono">z = +1.645</text>
-  <text x="270"  y="138"  fill="#FFD700"  font-size="9"  font-family="Source Sans Pro">α=5%</text>
-  <text x="130" y="165" fill="#8892b0" font-size="9" font-family="Source Sans Pro">Fail to Reject H₀</text>
-  <text x="265" y="124" fill="#dc3545" font-size="15">✗</text>
-  <text x="155" y="174" fill="#ADD8E6" font-size="9" text-anchor="middle" font-family="Source Sans Pro">H₁: μ &gt; μ₀ | Right-Tailed</text>
-</svg>"""
+# ═══════════════════════════════════════════════════════════════════
+# GEOMETRY — density → SVG path in a plot box
+# ═══════════════════════════════════════════════════════════════════
+def _dist(df):
+    return stats.norm if df is None else stats.t(df)
 
 
-def left_tailed_chart() -> str:
-    return """
+def _sym(df):
+    return "z" if df is None else "t"
+
+
+def _signed(v):
+    return f"{v:+.3f}".replace("-", "−")
+
+
+def _pct(a):
+    return f"{a * 100:g}%"
+
+
+def _gid(*parts):
+    """Gradient id unique per parameter set — several charts can share one page."""
+    return "g" + "-".join(str(p).replace(".", "_").replace("-", "m") for p in parts)
+
+
+class _Box:
+    """Maps (x, density) to SVG coordinates for one curve panel."""
+
+    def __init__(self, df, left, right, top, base, reach):
+        self.dist = _dist(df)
+        self.lo, self.hi = -reach, reach
+        self.left, self.right, self.top, self.base = left, right, top, base
+        self.peak = float(self.dist.pdf(0.0))
+
+    def sx(self, x):
+        return self.left + (x - self.lo) / (self.hi - self.lo) * (self.right - self.left)
+
+    def sy(self, y):
+        return self.base - y / self.peak * (self.base - self.top)
+
+    def points(self, a, b, n):
+        xs = np.linspace(a, b, n)
+        return [(self.sx(x), self.sy(y)) for x, y in zip(xs, self.dist.pdf(xs))]
+
+    def curve_path(self):
+        pts = self.points(self.lo, self.hi, _CURVE_PTS)
+        return (f"M{pts[0][0]:.1f},{self.base:.1f} "
+                + " ".join(f"L{x:.1f},{y:.1f}" for x, y in pts)
+                + f" L{pts[-1][0]:.1f},{self.base:.1f}Z")
+
+    def region_path(self, a, b):
+        pts = self.points(a, b, _TAIL_PTS)
+        return (f"M{self.sx(a):.1f},{self.base:.1f} "
+                + " ".join(f"L{x:.1f},{y:.1f}" for x, y in pts)
+                + f" L{self.sx(b):.1f},{self.base:.1f}Z")
+
+
+def _crits(alpha, tail, df):
+    """Critical values: right → [+c], left → [−c], two → [−c, +c]."""
+    c = float(critical(alpha, "two" if tail == "two" else "right", df))
+    if tail == "two":
+        return [-c, c]
+    return [c] if tail == "right" else [-c]
+
+
+def _reach(crits):
+    """Half-width of the x-axis: ±4, widened so the critical value stays in view."""
+    return max(4.0, max(abs(c) for c in crits) * 1.2)
+
+
+def _tail_panel(box, crits, gid, gradient_stops, stroke_w=1.5, region_w=2):
+    """Curve (gradient-filled) + shaded rejection region(s) + dashed critical lines."""
+    stops = "".join(
+        f'<stop offset="{off}" style="stop-color:{col};stop-opacity:{op}"/>'
+        for off, col, op in gradient_stops
+    )
+    out = [f'<defs><linearGradient id="{gid}" x1="0%" y1="0%" x2="100%" y2="0%">{stops}'
+           f'</linearGradient></defs>',
+           f'<path d="{box.curve_path()}" fill="url(#{gid})" stroke="#ADD8E6" stroke-width="{stroke_w}"/>']
+    for c in crits:
+        a, b = (c, box.hi) if c > 0 else (box.lo, c)
+        out.append(f'<path d="{box.region_path(a, b)}" fill="rgba(220,53,69,.65)" '
+                   f'stroke="#dc3545" stroke-width="{region_w}"/>')
+        x, y = box.sx(c), box.sy(float(box.dist.pdf(c)))
+        out.append(f'<line x1="{x:.1f}" y1="{y:.1f}" x2="{x:.1f}" y2="{box.base + 4:.1f}" '
+                   f'stroke="#dc3545" stroke-width="2" stroke-dasharray="4"/>')
+    return "\n  ".join(out)
+
+
+def _region_mid(box, c):
+    """x-centre of the shaded tail beyond c."""
+    return box.sx((c + box.hi) / 2) if c > 0 else box.sx((box.lo + c) / 2)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# TAIL CHARTS
+# ═══════════════════════════════════════════════════════════════════
+def _one_tail_chart(alpha, df, tail):
+    crits = _crits(alpha, tail, df)
+    c     = crits[0]
+    box   = _Box(df, 8, 300, 28, 148, _reach(crits))
+    right = tail == "right"
+    stops = ([("0%", "#003366", .4), ("75%", "#004d80", .65), ("100%", "#dc3545", .7)] if right else
+             [("0%", "#dc3545", .7), ("25%", "#004d80", .65), ("100%", "#003366", .4)])
+    xc, xm = box.sx(c), _region_mid(box, c)
+    accept_x = 130 if right else 185
+    dist_txt = "" if df is None else f" · t(df={df})"
+    return f"""
 <svg width="100%" viewBox="0 0 310 175" style="max-width:310px;display:block;margin:8px auto">
-  <defs>
-    <linearGradient id="lg1" x1="0%" y1="0%" x2="100%" y2="0%">
-      <stop offset="0%"   style="stop-color:#dc3545;stop-opacity:.7"/>
-      <stop offset="25%"  style="stop-color:#004d80;stop-opacity:.65"/>
-      <stop offset="100%" style="stop-color:#003366;stop-opacity:.4"/>
-    </linearGradient>
-  </defs>
-  <path d="M8,148 Q40,147 52,132 Q72,108 90,74 Q107,50 123,36
-           Q135,28 150,28 Q165,28 177,36 Q192,48 210,74
-           Q228,100 248,124 Q265,142 300,148Z"
-        fill="url(#lg1)" stroke="#ADD8E6" stroke-width="1.5"/>
-  <path d="M8,148 L68,148 L68,108 Q52,132 40,147 Q24,152 8,148Z"
-        fill="rgba(220,53,69,.65)" stroke="#dc3545" stroke-width="2"/>
-  <line x1="68" y1="108" x2="68" y2="152" stroke="#dc3545" stroke-width="2" stroke-dasharray="4"/>
-  <text x="68" y="166" fill="#dc3545" font-size="10" text-anchor="middle" font-family="JetBrains Mono">z = −1.645</text>
-  <text x="32" y="138" fill="#FFD700" font-size="9" font-family="Source Sans Pro">α=5%</text>
-  <text x="185" y="165" fill="#8892b0" font-size="9" font-family="Source Sans Pro">Fail to Reject H₀</text>
-  <text x="38"  y="124"  fill="#dc3545" font-size="15">✗</text>
-  <text x="155" y="174" fill="#ADD8E6" font-size="9" text-anchor="middle" font-family="Source Sans Pro">H₁: μ &lt; μ₀ | Left-Tailed</text>
+  {_tail_panel(box, crits, _gid(tail, alpha, df), stops)}
+  <text x="{xc:.1f}" y="166" fill="#dc3545" font-size="10" text-anchor="middle" font-family="JetBrains Mono">{_sym(df)} = {_signed(c)}</text>
+  <text x="{xm:.1f}" y="140" fill="#FFD700" font-size="9" text-anchor="middle" font-family="Source Sans Pro">α={_pct(alpha)}</text>
+  <text x="{accept_x}" y="165" fill="#8892b0" font-size="9" font-family="Source Sans Pro">Fail to Reject H₀</text>
+  <text x="{xm:.1f}" y="126" fill="#dc3545" font-size="15" text-anchor="middle">✗</text>
+  <text x="155" y="174" fill="#ADD8E6" font-size="9" text-anchor="middle" font-family="Source Sans Pro">H₁: μ {"&gt;" if right else "&lt;"} μ₀ | {"Right" if right else "Left"}-Tailed{dist_txt}</text>
 </svg>"""
 
 
-def two_tailed_chart() -> str:
-    return """
+@cached("html")
+def right_tailed_chart(alpha: float = 0.05, df=None) -> str:
+    return _one_tail_chart(alpha, df, "right")
+
+
+@cached("html")
+def left_tailed_chart(alpha: float = 0.05, df=None) -> str:
+    return _one_tail_chart(alpha, df, "left")
+
+
+@cached("html")
+def two_tailed_chart(alpha: float = 0.05, df=None) -> str:
+    crits = _crits(alpha, "two", df)
+    box   = _Box(df, 16, 644, 20, 158, _reach(crits))
+    stops = [("0%", "#dc3545", .7), ("15%", "#003366", .5), ("50%", "#004d80", .8),
+             ("85%", "#003366", .5), ("100%", "#dc3545", .7)]
+    (lo, hi), half = crits, _pct(alpha / 2)
+    xl, xr = box.sx(lo), box.sx(hi)
+    ml, mr = _region_mid(box, lo), _region_mid(box, hi)
+    dist_txt = "" if df is None else f", t df={df}"
+    return f"""
 <svg width="100%" viewBox="0 0 660 190" style="max-width:660px;display:block;margin:16px auto">
-  <defs>
-    <linearGradient id="tg1" x1="0%" y1="0%" x2="100%" y2="0%">
-      <stop offset="0%"   style="stop-color:#dc3545;stop-opacity:.7"/>
-      <stop offset="15%"  style="stop-color:#003366;stop-opacity:.5"/>
-      <stop offset="50%"  style="stop-color:#004d80;stop-opacity:.8"/>
-      <stop offset="85%"  style="stop-color:#003366;stop-opacity:.5"/>
-      <stop offset="100%" style="stop-color:#dc3545;stop-opacity:.7"/>
-    </linearGradient>
-  </defs>
-  <path d="M16,158 Q40,156 58,148 Q84,132 112,96 Q142,58 168,36
-           Q192,20 330,20 Q468,20 492,36
-           Q518,58 548,96 Q576,132 602,148 Q620,156 644,158Z"
-        fill="url(#tg1)" stroke="#ADD8E6" stroke-width="2"/>
-  <!-- Left rejection region -->
-  <path d="M16,158 L82,158 L82,132 Q58,148 40,156 Q26,160 16,158Z"
-        fill="rgba(220,53,69,.65)" stroke="#dc3545" stroke-width="2"/>
-  <!-- Right rejection region -->
-  <path d="M578,132 Q602,148 620,156 Q634,160 644,158 L644,158 L578,158Z"
-        fill="rgba(220,53,69,.65)" stroke="#dc3545" stroke-width="2"/>
-  <line x1="82"  y1="132" x2="82"  y2="162" stroke="#dc3545" stroke-width="2" stroke-dasharray="5"/>
-  <line x1="578" y1="132" x2="578" y2="162" stroke="#dc3545" stroke-width="2" stroke-dasharray="5"/>
+  {_tail_panel(box, crits, _gid("two", alpha, df), stops, stroke_w=2)}
   <line x1="330" y1="26"  x2="330" y2="162" stroke="#FFD700" stroke-width="1.5" stroke-dasharray="4"/>
-  <text x="46"  y="150" fill="#FFD700" font-size="9" font-family="Source Sans Pro">α/2=2.5%</text>
-  <text x="614" y="150" fill="#FFD700" font-size="9" font-family="Source Sans Pro">α/2=2.5%</text>
-  <text x="82"  y="178" fill="#dc3545" font-size="10" text-anchor="middle" font-family="JetBrains Mono">−1.960</text>
-  <text x="578" y="178" fill="#dc3545" font-size="10" text-anchor="middle" font-family="JetBrains Mono">+1.960</text>
+  <text x="{ml:.1f}" y="150" fill="#FFD700" font-size="9" text-anchor="middle" font-family="Source Sans Pro">α/2={half}</text>
+  <text x="{mr:.1f}" y="150" fill="#FFD700" font-size="9" text-anchor="middle" font-family="Source Sans Pro">α/2={half}</text>
+  <text x="{xl:.1f}" y="178" fill="#dc3545" font-size="10" text-anchor="middle" font-family="JetBrains Mono">{_signed(lo)}</text>
+  <text x="{xr:.1f}" y="178" fill="#dc3545" font-size="10" text-anchor="middle" font-family="JetBrains Mono">{_signed(hi)}</text>
   <text x="330" y="13"  fill="#8892b0" font-size="10" text-anchor="middle" font-family="Source Sans Pro">H₀ Acceptance Region</text>
-  <text x="330" y="186" fill="#ADD8E6" font-size="10" text-anchor="middle" font-family="Source Sans Pro">Two-Tailed Test (α=5%) — Rejection in BOTH Tails</text>
-  <text x="46"  y="142" fill="#dc3545" font-size="14">✗</text>
-  <text x="612" y="142" fill="#dc3545" font-size="14">✗</text>
+  <text x="330" y="186" fill="#ADD8E6" font-size="10" text-anchor="middle" font-family="Source Sans Pro">Two-Tailed Test (α={_pct(alpha)}{dist_txt}) — Rejection in BOTH Tails</text>
+  <text x="{ml:.1f}" y="138" fill="#dc3545" font-size="14" text-anchor="middle">✗</text>
+  <text x="{mr:.1f}" y="138" fill="#dc3545" font-size="14" text-anchor="middle">✗</text>
   <text x="330" y="78"  fill="#28a745" font-size="10" text-anchor="middle" font-family="Source Sans Pro">Fail to Reject H₀</text>
 </svg>"""
 
 
-def comparison_chart() -> str:
-    return """
+@cached("html")
+def comparison_chart(alpha: float = 0.05, df=None) -> str:
+    """Side by side: all α in the right tail vs α/2 in each tail, same axes."""
+    one, two = _crits(alpha, "right", df), _crits(alpha, "two", df)
+    reach = _reach(one + two)
+    panels = []
+    for off, title, crits, caption, tail in (
+        (0,   f"One-Tailed (Right) α={_pct(alpha)}", one, "All α in ONE tail → Higher Power", "right"),
+        (358, f"Two-Tailed α={_pct(alpha)}",         two, "α split → More Conservative",       "two"),
+    ):
+        box = _Box(df, 18 + off, 300 + off, 38, 164, reach)
+        share = _pct(alpha if tail == "right" else alpha / 2)
+        labels = "".join(
+            f'<text x="{box.sx(c):.1f}" y="182" fill="#dc3545" font-size="9" text-anchor="middle" '
+            f'font-family="JetBrains Mono">{_signed(c)}</text>'
+            f'<text x="{_region_mid(box, c):.1f}" y="156" fill="#FFD700" font-size="8" '
+            f'text-anchor="middle">{share}</text>'
+            for c in crits
+        )
+        panels.append(
+            f'<rect x="{4 + off}" y="4" width="318" height="188" rx="8" fill="rgba(0,51,102,.3)" '
+            f'stroke="#004d80" stroke-width="1.5"/>\n  '
+            f'<text x="{163 + off}" y="22" fill="#FFD700" font-size="12" text-anchor="middle" '
+            f'font-family="Playfair Display,serif">{title}</text>\n  '
+            + _tail_panel(box, crits, _gid("cmp", tail, alpha, df),
+                          [("0%", "#004d80", .5), ("100%", "#004d80", .5)], region_w=1.5)
+            + f'\n  {labels}\n  '
+            f'<text x="{163 + off}" y="196" fill="#8892b0" font-size="9" text-anchor="middle" '
+            f'font-family="Source Sans Pro">{caption}</text>'
+        )
+    return f"""
 <svg width="100%" viewBox="0 0 680 202" style="max-width:680px;display:block;margin:12px auto">
-  <!-- Left panel: One-tailed -->
-  <rect x="4" y="4" width="318" height="188" rx="8" fill="rgba(0,51,102,.3)" stroke="#004d80" stroke-width="1.5"/>
-  <text x="163" y="22" fill="#FFD700" font-size="12" text-anchor="middle" font-family="Playfair Display,serif">One-Tailed (Right) α=5%</text>
-  <path d="M18,164 Q32,163 46,155 Q68,140 92,106 Q114,74 128,54
-           Q140,38 158,38 Q176,38 188,46 Q206,60 222,88
-           Q242,122 258,144 Q270,160 300,164Z"
-        fill="rgba(0,77,128,.5)" stroke="#ADD8E6" stroke-width="1.5"/>
-  <path d="M242,122 Q258,144 270,160 Q280,165 300,164 L300,164 L242,164Z"
-        fill="rgba(220,53,69,.65)" stroke="#dc3545" stroke-width="1.5"/>
-  <line x1="242" y1="122" x2="242" y2="168" stroke="#dc3545" stroke-width="2" stroke-dasharray="4"/>
-  <text x="242" y="182" fill="#dc3545" font-size="9" text-anchor="middle" font-family="JetBrains Mono">+1.645</text>
-  <text x="274" y="154" fill="#FFD700" font-size="8">5%</text>
-  <text x="163" y="196" fill="#8892b0" font-size="9" text-anchor="middle" font-family="Source Sans Pro">All α in ONE tail → Higher Power</text>
-
-  <!-- Right panel: Two-tailed -->
-  <rect x="362" y="4" width="318" height="188" rx="8" fill="rgba(0,51,102,.3)" stroke="#004d80" stroke-width="1.5"/>
-  <text x="521" y="22" fill="#FFD700" font-size="12" text-anchor="middle" font-family="Playfair Display,serif">Two-Tailed α=5%</text>
-  <path d="M376,164 Q390,163 404,155 Q426,140 450,106 Q472,74 486,54
-           Q498,38 516,38 Q534,38 546,46 Q564,60 580,88
-           Q600,122 616,144 Q628,160 658,164Z"
-        fill="rgba(0,77,128,.5)" stroke="#ADD8E6" stroke-width="1.5"/>
-  <path d="M376,164 L424,164 L424,140 Q406,155 390,163 Q378,167 376,164Z"
-        fill="rgba(220,53,69,.65)" stroke="#dc3545" stroke-width="1.5"/>
-  <path d="M600,122 Q616,144 628,160 Q638,165 658,164 L658,164 L600,164Z"
-        fill="rgba(220,53,69,.65)" stroke="#dc3545" stroke-width="1.5"/>
-  <line x1="424" y1="140" x2="424" y2="168" stroke="#dc3545" stroke-width="2" stroke-dasharray="4"/>
-  <line x1="600" y1="122" x2="600" y2="168" stroke="#dc3545" stroke-width="2" stroke-dasharray="4"/>
-  <text x="424" y="182" fill="#dc3545" font-size="9" text-anchor="middle" font-family="JetBrains Mono">−1.96</text>
-  <text x="600" y="182" fill="#dc3545" font-size="9" text-anchor="middle" font-family="JetBrains Mono">+1.96</text>
-  <text x="521" y="196" fill="#8892b0" font-size="9" text-anchor="middle" font-family="Source Sans Pro">α split → More Conservative</text>
+  {panels[0]}
+
+  {panels[1]}
+</svg>"""
+
+
+# ═══════════════════════════════════════════════════════════════════
+# ROLLING STATISTIC
+# ═══════════════════════════════════════════════════════════════════
+def rolling_stat_chart(stat, crit, tail="right", label="t", title="", x0=0) -> str:
+    """Line of a rolling test statistic against its critical band; windows past it are marked.
+
+    stat, crit  one value per window (NaN = window not yet full)
+    x0          x-axis number of the first window (e.g. its ending month)
+    """
+    stat = np.asarray(stat, dtype=float)
+    crit = np.broadcast_to(np.asarray(crit, dtype=float), stat.shape)
+    left, right, top, base = 44, 668, 24, 188
+    finite = np.isfinite(stat)
+    if not finite.any():
+        return ""
+    c_abs = np.nanmax(np.abs(crit))
+    lim = max(c_abs * 1.3, float(np.nanmax(np.abs(stat[finite]))) * 1.1)
+    n = len(stat)
+    sx = lambda i: left + i / max(n - 1, 1) * (right - left)
+    sy = lambda v: top + (lim - v) / (2 * lim) * (base - top)
+
+    def band(edge):
+        pts = " ".join(f"L{sx(i):.1f},{sy(v):.1f}" for i, v in enumerate(edge) if np.isfinite(v))
+        return pts[1:]
+
+    shapes = []
+    if tail in ("right", "two"):
+        up = np.abs(crit) if tail == "two" else crit
+        shapes.append(f'<path d="M{band(up)} L{sx(n - 1):.1f},{top} L{sx(0):.1f},{top}Z" '
+                      f'fill="rgba(220,53,69,.18)"/>')
+        shapes.append(f'<path d="M{band(up)}" fill="none" stroke="#dc3545" stroke-width="1.5" stroke-dasharray="5"/>')
+    if tail in ("left", "two"):
+        lo = -np.abs(crit) if tail == "two" else crit
+        shapes.append(f'<path d="M{band(lo)} L{sx(n - 1):.1f},{base} L{sx(0):.1f},{base}Z" '
+                      f'fill="rgba(220,53,69,.18)"/>')
+        shapes.append(f'<path d="M{band(lo)}" fill="none" stroke="#dc3545" stroke-width="1.5" stroke-dasharray="5"/>')
+
+    segs, cur = [], []
+    for i, v in enumerate(stat):
+        if np.isfinite(v):
+            cur.append(f"{sx(i):.1f},{sy(v):.1f}")
+        elif cur:
+            segs.append(cur); cur = []
+    if cur:
+        segs.append(cur)
+    line = "".join(f'<polyline points="{" ".join(s)}" fill="none" stroke="#FFD700" stroke-width="2"/>'
+                   for s in segs)
+    hit = ((stat > crit) if tail == "right" else (stat < crit) if tail == "left"
+           else (np.abs(stat) > np.abs(crit))) & finite
+    dots = "".join(f'<circle cx="{sx(i):.1f}" cy="{sy(stat[i]):.1f}" r="2.2" fill="#dc3545"/>'
+                   for i in np.flatnonzero(hit))
+
+    ticks = "".join(
+        f'<line x1="{left - 4}" y1="{sy(v):.1f}" x2="{right}" y2="{sy(v):.1f}" stroke="#1e3a5f" stroke-width=".6"/>'
+        f'<text x="{left - 7}" y="{sy(v) + 3:.1f}" fill="#8892b0" font-size="9" text-anchor="end" '
+        f'font-family="JetBrains Mono">{_signed(v) if v else "0"}</text>'
+        for v in np.linspace(-lim, lim, 5).round(1)
+    )
+    step = max(1, n // 8)
+    xt = "".join(
+        f'<text x="{sx(i):.1f}" y="{base + 14}" fill="#8892b0" font-size="9" text-anchor="middle" '
+        f'font-family="Source Sans Pro">{x0 + i}</text>'
+        for i in range(0, n, step)
+    )
+    share = hit.sum() / max(finite.sum(), 1)
+    return f"""
+<svg width="100%" viewBox="0 0 680 226" style="max-width:680px;display:block;margin:12px auto">
+  <rect x="{left}" y="{top}" width="{right - left}" height="{base - top}" fill="rgba(0,51,102,.25)"/>
+  {ticks}
+  {"".join(shapes)}
+  {line}
+  {dots}
+  {xt}
+  <text x="356" y="14" fill="#FFD700" font-size="11" text-anchor="middle" font-family="Playfair Display,serif">{title}</text>
+  <text x="356" y="220" fill="#ADD8E6" font-size="9" text-anchor="middle" font-family="Source Sans Pro">Window end · rolling {label} (gold) vs critical value (red dashed) · {share:.0%} of windows reject H₀</text>
+</svg>"""
+
+
+# ═══════════════════════════════════════════════════════════════════
+# t → z CONVERGENCE
+# ═══════════════════════════════════════════════════════════════════
+_TAIL_NAME = {"right": "Right-Tailed", "left": "Left-Tailed", "two": "Two-Tailed"}
+
+
+@cached("html")
+def convergence_chart(alpha: float = 0.05, tail: str = "two", df=None, tol: float = 0.01) -> str:
+    """|t critical value| against df = 1…10,000 (log axis), converging on z; `df` is marked."""
+    t_c = curve(alpha, tail)
+    z_c = abs(float(critical(alpha, tail)))
+    n = len(t_c)
+    left, right, top, base = 52, 664, 30, 196
+    hi = max(min(float(t_c[0]), 2.6 * z_c), z_c + 0.5)
+    if df is not None and 1 <= df <= n:
+        hi = max(hi, min(float(t_c[int(df) - 1]), 4 * z_c) * 1.05)     # keep the marked df on the plot
+    lo = max(z_c - 0.12 * (hi - z_c), 0.0)
+    sx = lambda d: left + np.log10(d) / np.log10(n) * (right - left)
+    sy = lambda v: top + (hi - min(v, hi)) / (hi - lo) * (base - top)
+
+    pick = np.unique(np.round(np.logspace(0, np.log10(n), 180)).astype(int))
+    pts = " ".join(f"{sx(d):.1f},{sy(t_c[d - 1]):.1f}" for d in pick)
+    sign = "±" if tail == "two" else ("−" if tail == "left" else "+")
+
+    ticks = "".join(
+        f'<line x1="{sx(d):.1f}" y1="{base}" x2="{sx(d):.1f}" y2="{base + 4}" stroke="#8892b0"/>'
+        f'<text x="{sx(d):.1f}" y="{base + 16}" fill="#8892b0" font-size="9" text-anchor="middle" '
+        f'font-family="JetBrains Mono">{d:,}</text>'
+        for d in (1, 10, 100, 1000, 10_000) if d <= n
+    )
+    yt = "".join(
+        f'<line x1="{left}" y1="{sy(v):.1f}" x2="{right}" y2="{sy(v):.1f}" stroke="#1e3a5f" stroke-width=".6"/>'
+        f'<text x="{left - 6}" y="{sy(v) + 3:.1f}" fill="#8892b0" font-size="9" text-anchor="end" '
+        f'font-family="JetBrains Mono">{v:.2f}</text>'
+        for v in np.linspace(lo, hi, 5)
+    )
+    conv = converged_df(alpha, tail, tol)
+    band = ""
+    if conv is not None:
+        band = (f'<rect x="{sx(conv):.1f}" y="{top}" width="{right - sx(conv):.1f}" height="{base - top}" '
+                f'fill="rgba(40,167,69,.12)"/>'
+                f'<text x="{sx(conv) + 4:.1f}" y="{top + 12}" fill="#28a745" font-size="9" '
+                f'font-family="Source Sans Pro">within {tol:.0%} of z from df = {conv:,}</text>')
+    mark = ""
+    if df is not None and 1 <= df <= n:
+        v = float(t_c[int(df) - 1])
+        mark = (f'<circle cx="{sx(df):.1f}" cy="{sy(v):.1f}" r="5" fill="#FFD700" stroke="#0a1628" stroke-width="1.5"/>'
+                f'<text x="{sx(df) + 8:.1f}" y="{max(sy(v) - 8, top + 24):.1f}" fill="#FFD700" font-size="11" '
+                f'font-family="JetBrains Mono">df={int(df):,}: {sign}{v:.3f}</text>')
+    title = f"t critical value → z · {_TAIL_NAME[tail]} α={_pct(alpha)}"
+    return f"""
+<svg width="100%" viewBox="0 0 680 232" style="max-width:680px;display:block;margin:12px auto">
+  <defs><clipPath id="{_gid("conv", alpha, tail)}"><rect x="{left}" y="{top}" width="{right - left}" height="{base - top}"/></clipPath></defs>
+  <rect x="{left}" y="{top}" width="{right - left}" height="{base - top}" fill="rgba(0,51,102,.25)"/>
+  {band}
+  {yt}
+  {ticks}
+  <line x1="{left}" y1="{sy(z_c):.1f}" x2="{right}" y2="{sy(z_c):.1f}" stroke="#ADD8E6" stroke-width="1.5" stroke-dasharray="5"/>
+  <text x="{right - 4}" y="{sy(z_c) + 14:.1f}" fill="#ADD8E6" font-size="10" text-anchor="end" font-family="JetBrains Mono">z = {sign}{z_c:.3f}</text>
+  <polyline points="{pts}" fill="none" stroke="#dc3545" stroke-width="2.2" clip-path="url(#{_gid("conv", alpha, tail)})"/>
+  {mark}
+  <text x="358" y="18" fill="#FFD700" font-size="12" text-anchor="middle" font-family="Playfair Display,serif">{title}</text>
+  <text x="358" y="226" fill="#8892b0" font-size="9" text-anchor="middle" font-family="Source Sans Pro">Degrees of freedom (log scale) · t critical value (red) vs z (blue dashed)</text>
 </svg>"""
@@ -0,0 +1,338 @@
+"""
+code_runner.py — Run pasted NumPy / SciPy snippets in limited, pre-warmed worker processes.
+
+A zygote process imports numpy, scipy.stats and matplotlib once, then
+forks a worker whenever the pool asks for one; `warm` workers sit idle,
+blocked on their pipe, before anyone clicks Run. A run hands the snippet
+to an idle worker, so it starts executing within milliseconds instead of
+paying interpreter + SciPy start-up (~1 s). Each worker runs exactly one
+snippet and exits — nothing one student's code does (monkey-patching
+scipy, seeding np.random, leaking memory) survives into the next run —
+and a replacement is forked in the background.
+
+Each worker leads its own session, and the parent kills the whole process
+group when the run ends — timed out or not — so anything the snippet forks
+goes with it. Only bytes cross the pipe: the code goes out as UTF-8 and the
+result comes back as JSON (figures base64), which the parent checks field by
+field before building the RunResult. The worker ran untrusted code, so its
+reply is never unpickled.
+
+The zygote is a plain subprocess rather than a multiprocessing start
+method: under Streamlit `__main__` is the app script, which spawn and
+forkserver would re-execute in every worker.
+
+Limits, per run:
+    wall time   the parent kills the worker after `wall_seconds`
+    CPU time    RLIMIT_CPU (SIGXCPU, then SIGKILL one second later)
+    memory      RLIMIT_AS — the worker's address space after imports + `memory_mb`
+    output      stdout/stderr truncated to `max_output` characters, ≤ `max_figures` figures
+    files       runs in a fresh temporary directory; RLIMIT_FSIZE caps file writes
+    processes   RLIMIT_NPROC — no processes or threads beyond those the app's user already has
+                (root ignores it; the process-group kill still applies)
+
+    runner = default_runner()
+    r = runner.run("print(np.mean([1, 2, 3]))")
+    r.ok, r.stdout, r.error, r.figures, r.ms, r.limit
+
+These are resource limits for a teaching app, not a security boundary: the
+code runs as the app's user with network and filesystem access. The Python
+tab only offers it when HT_CODE_RUNNER=1 is set (see enabled()); put the app
+in a container (or nsjail / gVisor) before turning that on for untrusted users.
+"""
+import atexit
+import base64
+import io
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from collections import namedtuple
+from contextlib import redirect_stderr, redirect_stdout
+from multiprocessing.connection import Connection
+
+RunResult = namedtuple("RunResult", "ok stdout error figures ms limit")
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_BOOT = f"import sys; sys.path.insert(0, {_HERE!r}); import code_runner; code_runner._zygote()"
+_PNG = b"\x89PNG\r\n\x1a\n"
+_LIMITS = ("cpu", "memory")
+_MAX_REPLY = 64 * 2**20                                           # bytes; a bigger reply is treated as a crash
+
+
+def enabled() -> bool:
+    """True when the deployment opted in to running pasted code (HT_CODE_RUNNER=1)."""
+    return os.environ.get("HT_CODE_RUNNER", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class CPULimitExceeded(BaseException):
+    """Raised in the worker on SIGXCPU; BaseException so a bare `except Exception` in the snippet can't swallow it."""
+
+
+# ═══════════════════════════════════════════════════════════════════
+# WORKER SIDE — runs in the zygote and its forks
+# ═══════════════════════════════════════════════════════════════════
+def _zygote():
+    """Import the stack once, then fork one worker per pipe the pool sends over the control socket."""
+    ctrl = socket.socket(fileno=int(sys.argv[1]))
+    limits = json.loads(sys.argv[2])
+    import numpy, scipy.stats, scipy.special, matplotlib.pyplot   # noqa: F401 — inherited by every fork
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)                  # workers are reaped automatically
+    while True:
+        msg, fds, _, _ = socket.recv_fds(ctrl, 1, 1)
+        if not msg:
+            return                                                 # pool closed / app exited
+        if os.fork() == 0:
+            os.setsid()                                            # own process group: killed as one
+            ctrl.close()
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            try:
+                _worker(Connection(fds[0]), limits)
+            finally:
+                os._exit(0)
+        for fd in fds:
+            os.close(fd)
+
+
+def _address_space():
+    with open("/proc/self/status") as fh:
+        for line in fh:
+            if line.startswith("VmSize:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+def _user_tasks():
+    """Processes + threads owned by this uid — what RLIMIT_NPROC counts."""
+    uid, n = os.getuid(), 0
+    for pid in os.listdir("/proc"):
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f"/proc/{pid}/status") as fh:
+                status = dict(line.split(":", 1) for line in fh if ":" in line)
+        except OSError:
+            continue                                               # exited while we looked
+        if int(status["Uid"].split()[0]) == uid:
+            n += int(status["Threads"])
+    return n
+
+
+def _cpu_limit(signum, frame):
+    raise CPULimitExceeded
+
+
+def _set_limits(cpu_seconds, memory_mb, file_mb):
+    import resource
+    used = resource.getrusage(resource.RUSAGE_SELF)
+    cpu = int(used.ru_utime + used.ru_stime) + cpu_seconds
+    signal.signal(signal.SIGXCPU, _cpu_limit)
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu + 1))
+    resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+    resource.setrlimit(resource.RLIMIT_FSIZE, (file_mb * 2**20, file_mb * 2**20))
+    try:
+        mem = _address_space() + memory_mb * 2**20
+        resource.setrlimit(resource.RLIMIT_AS, (mem, mem))
+        tasks = _user_tasks()                                      # fork() / threads fail from here on
+        resource.setrlimit(resource.RLIMIT_NPROC, (tasks, tasks))
+    except (OSError, ValueError):
+        pass                                                       # no /proc (non-Linux): no memory / process cap
+
+
+def _figures(plt, limit):
+    out = []
+    for num in plt.get_fignums()[:limit]:
+        buf = io.BytesIO()
+        plt.figure(num).savefig(buf, format="png", dpi=100, bbox_inches="tight")
+        out.append(buf.getvalue())
+    plt.close("all")
+    return out
+
+
+def _worker(conn, limits):
+    """Announce the pid, wait for one snippet, run it under the limits, send back the result as JSON."""
+    import numpy as np
+    import scipy.stats as stats
+    import matplotlib.pyplot as plt
+
+    conn.send_bytes(str(os.getpid()).encode())
+    try:
+        code = conn.recv_bytes().decode()
+    except EOFError:
+        return                                                     # pool closed while this worker was idle
+    t0 = time.perf_counter()
+    os.chdir(tempfile.mkdtemp(prefix="snippet-"))
+    _set_limits(limits["cpu_seconds"], limits["memory_mb"], limits["file_mb"])
+    out, error, figures, limit = io.StringIO(), None, [], None
+    try:
+        with redirect_stdout(out), redirect_stderr(out):
+            exec(compile(code, "<snippet>", "exec"), {"__name__": "__main__", "np": np, "stats": stats, "plt": plt})
+        figures = _figures(plt, limits["max_figures"])
+    except CPULimitExceeded:
+        error, limit = f"Stopped after {limits['cpu_seconds']} s CPU time", "cpu"
+    except MemoryError:
+        error, limit = f"MemoryError: snippet exceeded {limits['memory_mb']} MB", "memory"
+    except BaseException:                                          # SystemExit / KeyboardInterrupt from user code too
+        tb = traceback.format_exc().splitlines()
+        keep = [i for i, line in enumerate(tb) if line.lstrip().startswith('File "<snippet>"')]
+        error = "\n".join(tb[:1] + tb[keep[0]:] if keep else tb[-1:])   # drop the runner's own frames
+    text = out.getvalue()
+    if len(text) > limits["max_output"]:
+        text = text[:limits["max_output"]] + f"\n… output truncated at {limits['max_output']:,} characters"
+    conn.send_bytes(json.dumps({
+        "ok": error is None, "stdout": text, "error": error, "ms": (time.perf_counter() - t0) * 1e3,
+        "limit": limit, "figures": [base64.b64encode(png).decode("ascii") for png in figures],
+    }).encode())
+    conn.close()
+
+
+# ═══════════════════════════════════════════════════════════════════
+# POOL
+# ═══════════════════════════════════════════════════════════════════
+class CodeRunner:
+    """Keeps `warm` idle workers ready; run() uses one per snippet and forks a replacement."""
+
+    def __init__(self, warm=2, max_concurrent=4, wall_seconds=10.0, cpu_seconds=5, memory_mb=512,
+                 file_mb=16, max_output=20_000, max_figures=4, boot_seconds=60.0):
+        self.warm, self.wall_seconds, self.boot_seconds = warm, wall_seconds, boot_seconds
+        self.limits = dict(cpu_seconds=cpu_seconds, memory_mb=memory_mb, file_mb=file_mb,
+                           max_output=max_output, max_figures=max_figures)
+        self._idle, self._lock, self._fork_lock = [], threading.Lock(), threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._zygote = self._ctrl = None
+        self._closed = False
+        self.runs = self.cold_starts = 0
+        threading.Thread(target=self._refill, daemon=True).start()
+
+    def _start_zygote(self):
+        ours, theirs = socket.socketpair()
+        # one BLAS thread: RLIMIT_NPROC leaves a worker no room to start a thread pool after fork
+        env = dict(os.environ, MPLBACKEND="Agg", OPENBLAS_NUM_THREADS="1", OMP_NUM_THREADS="1", MKL_NUM_THREADS="1")
+        self._zygote = subprocess.Popen([sys.executable, "-c", _BOOT, str(theirs.fileno()), json.dumps(self.limits)],
+                                        pass_fds=[theirs.fileno()], env=env, stdin=subprocess.DEVNULL)
+        theirs.close()
+        self._ctrl = ours
+
+    def _spawn(self):
+        """A fresh worker as (pid, conn), forked by the zygote — started first if needed."""
+        with self._fork_lock:
+            if self._closed:
+                raise RuntimeError("CodeRunner is closed")
+            if self._zygote is None or self._zygote.poll() is not None:
+                self._start_zygote()
+            ours, theirs = socket.socketpair()
+            socket.send_fds(self._ctrl, [b"w"], [theirs.fileno()])
+            theirs.close()
+        conn = Connection(ours.detach())
+        if not conn.poll(self.boot_seconds):                       # first fork waits for the zygote's imports
+            conn.close()
+            raise RuntimeError("code runner worker did not start")
+        return int(conn.recv_bytes(32)), conn
+
+    def _refill(self):
+        while True:
+            with self._lock:
+                if self._closed or len(self._idle) >= self.warm:
+                    return
+            try:
+                worker = self._spawn()
+            except (RuntimeError, OSError, EOFError):
+                return
+            with self._lock:
+                if self._closed:
+                    worker[1].close()
+                    return
+                self._idle.append(worker)
+
+    def _take(self):
+        with self._lock:
+            while self._idle:
+                pid, conn = self._idle.pop()
+                if not conn.poll(0):                               # an idle worker only ever becomes readable by dying
+                    return pid, conn
+                conn.close()
+        self.cold_starts += 1
+        return self._spawn()
+
+    def run(self, code: str) -> RunResult:
+        """Execute `code` in a fresh warm worker; never raises for errors in the snippet."""
+        with self._slots:
+            t0 = time.perf_counter()
+            pid, conn = self._take()
+            threading.Thread(target=self._refill, daemon=True).start()
+            try:
+                conn.send_bytes(code.encode("utf-8", "replace"))
+                if conn.poll(self.wall_seconds):
+                    result = self._result(conn.recv_bytes(_MAX_REPLY))
+                else:
+                    result = RunResult(False, "", f"Stopped after {self.wall_seconds:g} s wall time", [],
+                                       self.wall_seconds * 1e3, "time")
+            except (EOFError, OSError, ValueError, KeyError, TypeError):
+                result = RunResult(False, "", "The worker stopped without a usable result "
+                                   "(killed at the hard CPU limit, or the snippet exited the process)", [],
+                                   (time.perf_counter() - t0) * 1e3, "crash")
+            finally:
+                conn.close()
+                _kill(pid)                                         # the worker and anything it forked
+            self.runs += 1
+            return result
+
+    def _result(self, raw) -> RunResult:
+        """RunResult from a worker's JSON reply — plain values only, each checked; raises ValueError / KeyError / TypeError."""
+        d = json.loads(raw)
+        if not isinstance(d, dict):
+            raise ValueError("reply is not an object")
+        cap = self.limits["max_output"] + 100
+        error = d["error"]
+        figures = [base64.b64decode(f, validate=True) for f in d["figures"][:self.limits["max_figures"]]]
+        return RunResult(d["ok"] is True, str(d["stdout"])[:cap], None if error is None else str(error)[:cap],
+                         [png for png in figures if png.startswith(_PNG)], float(d["ms"]),
+                         d["limit"] if d["limit"] in _LIMITS else None)
+
+    def describe(self) -> str:
+        l = self.limits
+        return (f"{self.wall_seconds:g} s wall time, {l['cpu_seconds']} s CPU, {l['memory_mb']} MB memory, "
+                f"{l['max_figures']} figures")
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for _, conn in idle:
+            conn.close()                                           # idle workers see EOF and exit
+        with self._fork_lock:
+            if self._ctrl is not None:
+                self._ctrl.close()                                 # the zygote sees EOF and exits
+                self._zygote.wait(5)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _kill(pid):
+    """SIGKILL the worker's process group (its pid, via setsid) — the worker and every process it started."""
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass                                                       # already gone
+
+
+_default, _default_lock = None, threading.Lock()
+
+
+def default_runner() -> CodeRunner:
+    """Process-wide runner shared by every session; closed at interpreter exit."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = CodeRunner()
+            atexit.register(_default.close)
+        return _default
@@ -0,0 +1,85 @@
+"""
+critical_grid.py — t critical values for every df 1…10,000 over a dense α grid.
+
+The grid is one broadcast call of the t quantile ufunc: every upper-tail
+probability the α grid needs (α for one tail, α/2 for two) against
+df = 1…DF_MAX, about 3.2 M values (~24 MB, ~2 s on one core). It is built
+once per process on a background thread (warm()); until it is ready,
+lookups evaluate the same ufunc directly, so an answer never depends on
+whether the grid exists yet — both paths match pvalues.critical bit for bit.
+
+    lookup(alpha, tail, df)          signed critical value, any α and df (df=None → z)
+    curve(alpha, tail)               |t critical value| for df = 1…DF_MAX
+    converged_df(alpha, tail, tol)   first df whose t critical value is within tol of z
+"""
+import threading
+
+import numpy as np
+
+from pvalues import TAILS, critical, isf
+
+DF_MAX = 10_000
+DFS    = np.arange(1, DF_MAX + 1)
+# 0.1%…20% in 0.1% steps, the conventional small levels below, and 21%…50% in 1% steps
+ALPHAS = tuple(float(a) for a in np.unique(np.round(np.concatenate([
+    [0.0001, 0.00025, 0.0005], np.arange(1, 201) * 0.001, np.arange(21, 51) * 0.01]), 6)))
+
+_Q   = np.unique(np.concatenate([ALPHAS, np.multiply(ALPHAS, 0.5)]))   # upper-tail probabilities
+_ROW = {float(q): i for i, q in enumerate(_Q)}
+_grid, _lock, _warming = None, threading.Lock(), False
+
+
+def _build():
+    global _grid
+    grid = isf(_Q[:, None], DFS[None, :])                  # (len(_Q), DF_MAX) in one ufunc call
+    grid.setflags(write=False)
+    _grid = grid
+
+
+def warm():
+    """Start building the grid on a background thread (once per process); returns immediately."""
+    global _warming
+    with _lock:
+        if _warming:
+            return
+        _warming = True
+    threading.Thread(target=_build, name="critical-grid", daemon=True).start()
+
+
+def ready() -> bool:
+    return _grid is not None
+
+
+def _upper(alpha, tail):
+    if tail not in TAILS:
+        raise ValueError(f"tail must be one of {TAILS}, got {tail!r}")
+    return float(alpha) * 0.5 if tail == "two" else float(alpha)
+
+
+def _row(q):
+    """Grid row index for upper-tail probability q, or None when q is off the grid / grid not built."""
+    return None if _grid is None else _ROW.get(float(q))
+
+
+def lookup(alpha, tail, df=None) -> float:
+    """Signed critical value as pvalues.critical returns it — from the grid when (α, df) is on it."""
+    q = _upper(alpha, tail)
+    i = _row(q)
+    if df is None or i is None or not (1 <= df <= DF_MAX) or df != int(df):
+        return float(critical(alpha, tail, df))
+    c = _grid.item(i, int(df) - 1)
+    return -c if tail == "left" else c
+
+
+def curve(alpha, tail="two") -> np.ndarray:
+    """|critical value| of t(df) for df = 1…DF_MAX — a grid row, or one vectorised call off the grid."""
+    q = _upper(alpha, tail)
+    i = _row(q)
+    return _grid[i] if i is not None else isf(q, DFS)
+
+
+def converged_df(alpha, tail="two", tol=0.01):
+    """Smallest df whose |t critical value| is within `tol` (relative) of z's, or None below DF_MAX."""
+    z = float(isf(_upper(alpha, tail)))
+    close = curve(alpha, tail) <= z * (1 + tol)
+    return int(DFS[close.argmax()]) if close.any() else None
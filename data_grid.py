@@ -0,0 +1,107 @@
+"""
+data_grid.py — Large result tables: server-side sort / filter / pagination into st.dataframe.
+
+components.table_html writes every row as inline-styled HTML — right for a
+ten-row reference table, unusable for 5,000 strategies (every row is
+re-sent, as markup, on every rerun). result_grid keeps the full result as
+numpy columns on the server, filters them (boolean masks and a substring
+search), sorts them (one stable lexsort of the filtered column — ties keep
+row order and NaNs sort last in either direction) and slices
+a page there. Only that page becomes a DataFrame, is styled in the app's
+theme and is handed to st.dataframe, which ships it to the browser as Arrow
+and draws it in its virtualised canvas grid.
+
+    result_grid({"Fund": names, "t": t, "p-value": p, "Reject": rej}, key="funds",
+                formats={"t": "%.3f", "p-value": "%.2e"}, flags=("Reject",),
+                search="Fund", sort=("p-value", True), mark="Reject")
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+PAGE_SIZES = (25, 50, 100)
+_CELL = {"background-color": "#112240", "color": "#e6f1ff"}
+_MARK = "color: #FFD700; font-weight: 600"
+
+
+def matching_rows(columns: dict, query="", search=None, flags=()) -> np.ndarray:
+    """Indices of the rows where every flag column is True and `search` contains `query` (any case)."""
+    n = len(next(iter(columns.values())))
+    mask = np.ones(n, dtype=bool)
+    for f in flags:
+        mask &= np.asarray(columns[f], dtype=bool)
+    if query and search is not None:
+        mask &= np.char.find(np.char.lower(np.asarray(columns[search], dtype=str)), query.lower()) >= 0
+    return np.flatnonzero(mask)
+
+
+def _sort_key(col, ascending):
+    """(missing, key) for lexsort: floats as they are, anything else by rank; negated to descend."""
+    if col.dtype.kind == "f":
+        return np.isnan(col), col if ascending else -col
+    _, rank = np.unique(col, return_inverse=True)          # strings / bools / ints → 0…m−1
+    return np.zeros(len(col), dtype=bool), rank if ascending else -rank
+
+
+def sorted_page(columns: dict, idx, sort=None, ascending=True, page=1, page_size=PAGE_SIZES[0]) -> np.ndarray:
+    """Page `page` of the rows `idx`, ordered by column `sort`; ties keep row order, NaNs go last."""
+    if sort is not None:
+        missing, key = _sort_key(np.asarray(columns[sort])[idx], ascending)
+        idx = idx[np.lexsort((key, missing))]              # stable: equal keys stay in `idx` order
+    start = (page - 1) * page_size
+    return idx[start:start + page_size]
+
+
+def _styled(frame, mark):
+    style = frame.style.set_properties(**_CELL)
+    if mark is not None:
+        style = style.apply(lambda row: [_MARK if row[mark] else ""] * len(row), axis=1)
+    return style
+
+
+def result_grid(columns: dict, key: str, formats: dict = None, flags: tuple = (), search: str = None,
+                sort: tuple = None, mark: str = None, height: int = None) -> int:
+    """Sort / filter / page controls over `columns` and a st.dataframe of the current page.
+
+    columns  {header: 1-D array}, all the same length — numbers, bools or strings
+    formats  {header: printf-style format for a numeric column, e.g. "%.3f"}
+    flags    boolean columns offered as "only rows where …" filters
+    search   string column matched by a case-insensitive substring box
+    sort     (header, ascending) — the initial order
+    mark     boolean column whose True rows are drawn in gold
+    Returns the number of rows matching the filters."""
+    headers = list(columns)
+    formats = formats or {}
+    sort_col, sort_asc = sort or (headers[0], True)
+
+    c1, c2, c3, c4 = st.columns([2, 2, 1, 1])
+    query = c1.text_input(f"Search {search}", key=f"{key}_q", placeholder="contains…") if search else ""
+    by    = c2.selectbox("Sort by", headers, index=headers.index(sort_col), key=f"{key}_sort")
+    asc   = c3.radio("Order", ["↑", "↓"], index=0 if sort_asc else 1, horizontal=True, key=f"{key}_asc") == "↑"
+    size  = c4.selectbox("Rows / page", PAGE_SIZES, key=f"{key}_size")
+    only  = tuple(f for f in flags if st.checkbox(f"Only rows where {f}", key=f"{key}_only_{f}"))
+
+    # a new filter, order or page size starts again at page 1
+    sig = (query, by, asc, size, only)
+    if st.session_state.get(f"{key}_sig") != sig:
+        st.session_state[f"{key}_sig"] = sig
+        st.session_state[f"{key}_page"] = 1
+
+    idx = matching_rows(columns, query, search, only)
+    matched = len(idx)
+    pages = max(1, -(-matched // size))
+    st.session_state[f"{key}_page"] = min(st.session_state.get(f"{key}_page", 1), pages)
+    page = st.number_input(f"Page (of {pages:,})", min_value=1, max_value=pages, key=f"{key}_page")
+
+    rows = sorted_page(columns, idx, by, asc, page, size)
+    frame = pd.DataFrame({h: np.asarray(col)[rows] for h, col in columns.items()})
+    config = {h: st.column_config.NumberColumn(h, format=f) for h, f in formats.items()}
+    st.dataframe(_styled(frame, mark), column_config=config, hide_index=True, use_container_width=True,
+                 **({"height": height} if height else {}))
+    total = len(next(iter(columns.values())))
+    first = (page - 1) * size + 1 if matched else 0
+    st.caption(f"Rows {first:,}–{first + len(rows) - 1 if matched else 0:,} of {matched:,}"
+               + (f" (filtered from {total:,})" if matched != total else "")
+               + f" · sorted by {by} {'ascending' if asc else 'descending'} on the server; "
+                 "only this page is sent to the browser.")
+    return matched
@@ -0,0 +1,57 @@
+"""
+dist_explorer.py — In-browser distribution explorer (custom Streamlit component).
+
+The z-test calculators used to round-trip to Python on every nudge of an
+input just to move a line on a Matplotlib figure. This component receives
+the defaults, α options and critical values once, then redraws the curve,
+rejection regions, statistic marker and metrics in the browser. It returns
+a value only when the user clicks "Record decision".
+
+Frontend: frontend/dist_explorer/index.html (plain JS, no build step).
+"""
+from pathlib import Path
+
+import streamlit.components.v1 as components
+
+from cache import cached
+from critical_grid import lookup
+
+FRONTEND_DIR = Path(__file__).parent / "frontend" / "dist_explorer"
+
+_component = components.declare_component("dist_explorer", path=str(FRONTEND_DIR))
+
+TAILS = {
+    "one":     [("right", "Right-Tailed (H₁: μ > μ₀)"), ("left", "Left-Tailed (H₁: μ < μ₀)")],
+    "two":     [("two", "Two-Tailed (H₁: μ ≠ μ₀)")],
+    "explore": [("one", "One-Tailed"), ("two", "Two-Tailed")],
+}
+TAIL_LABEL = {"one": "Test Direction", "two": "Test Direction", "explore": "Test Type"}
+
+
+@cached("quantiles")
+def crit_table(alphas: tuple, dfs: tuple = (30, 60)) -> dict:
+    """{str(α): {"one"|"two": {"z", "t": [one per df]}}} — everything the frontend needs."""
+    table = {}
+    for a in alphas:
+        table[str(a)] = {
+            side: dict(z=lookup(a, tail), t=[lookup(a, tail, d) for d in dfs])
+            for side, tail in (("one", "right"), ("two", "two"))
+        }
+    return table
+
+
+def dist_explorer(mode: str, defaults: dict, alphas: list, key: str,
+                  fields: dict = None, name: str = "", record: bool = True, dfs: tuple = (30, 60)):
+    """
+    mode     "one" (right/left), "two" or "explore" (critical values only)
+    defaults x_bar, mu_0, sigma, n, alpha, tail — the initial inputs
+    fields   {field: dict(label, step, min)} for x_bar / mu_0 / sigma / n
+    dfs      degrees of freedom whose t critical values "explore" mode lists
+    Returns the last recorded decision (dict) or None.
+    """
+    return _component(
+        mode=mode, name=name, defaults=defaults, alphas=list(alphas),
+        crit=crit_table(tuple(alphas), tuple(dfs)), dfs=list(dfs), fields=fields or {},
+        tails=TAILS[mode], tail_label=TAIL_LABEL[mode], record=record,
+        key=key, default=None,
+    )
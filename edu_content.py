@@ -0,0 +1,100 @@
+"""
+edu_content.py — Lazily loaded Education Hub content.
+Glossary, concept cards and the MCQ bank each live in their own JSON-lines
+file under content/. A section is parsed on first access only, and re-read
+when its file's mtime changes, so instructors can ship larger banks
+without a code deploy. Point EDU_CONTENT_DIR elsewhere to swap the set.
+"""
+import json
+import os
+import threading
+from collections import namedtuple
+from pathlib import Path
+
+from html_parts import bdg
+
+CONTENT_DIR = Path(os.environ.get("EDU_CONTENT_DIR", Path(__file__).parent / "content"))
+
+MCQ_LEVELS = ["Foundation", "Intermediate", "Advanced"]
+
+McqBank = namedtuple("McqBank", "questions answer buckets topics")
+
+
+class _LazySection:
+    """One content file: parsed on first get(), re-parsed when it changes on disk."""
+
+    def __init__(self, filename, build):
+        self.path    = CONTENT_DIR / filename
+        self._build  = build
+        self._lock   = threading.Lock()
+        self._mtime  = None
+        self._value  = None
+        self._count  = (None, 0)
+
+    @property
+    def version(self):
+        """mtime_ns of the file currently loaded — None until first access."""
+        return self._mtime
+
+    def get(self):
+        mtime = self.path.stat().st_mtime_ns
+        if mtime != self._mtime:
+            with self._lock:
+                if mtime != self._mtime:
+                    with open(self.path, encoding="utf-8") as f:
+                        rows = [json.loads(line) for line in f if line.strip()]
+                    self._value = self._build(rows)
+                    self._mtime = mtime
+        return self._value
+
+    def count(self):
+        """Number of records, without deserialising them."""
+        mtime = self.path.stat().st_mtime_ns
+        if self._count[0] != mtime:
+            with open(self.path, "rb") as f:
+                self._count = (mtime, sum(1 for line in f if line.strip()))
+        return self._count[1]
+
+
+# ── Section builders ──────────────────────────────────────────────
+def _build_glossary(rows):
+    return rows
+
+
+def _build_concept_cards(rows):
+    """theme → [card]; badges are stored as [label, variant] and rendered here."""
+    themes = {}
+    for row in rows:
+        theme = row.pop("theme")
+        row["items"] = [dict(badge=bdg(*it["badge"]), text=it["text"]) for it in row["items"]]
+        themes.setdefault(theme, []).append(row)
+    return themes
+
+
+def _build_mcq_bank(rows):
+    """Questions plus a qid → answer map and (level, topic) buckets ("All" = wildcard)."""
+    buckets = {("All", "All"): list(rows)}
+    for q in rows:
+        for key in ((q["level"], "All"), ("All", q["topic"]), (q["level"], q["topic"])):
+            buckets.setdefault(key, []).append(q)
+    return McqBank(
+        questions=rows,
+        answer={q["qid"]: q["answer"] for q in rows},
+        buckets=buckets,
+        topics=sorted({q["topic"] for q in rows}),
+    )
+
+
+GLOSSARY      = _LazySection("glossary.jsonl",      _build_glossary)
+CONCEPT_CARDS = _LazySection("concept_cards.jsonl", _build_concept_cards)
+MCQ_BANK      = _LazySection("mcq_bank.jsonl",      _build_mcq_bank)
+
+
+def glossary() -> list:
+    return GLOSSARY.get()
+
+def concept_cards() -> dict:
+    return CONCEPT_CARDS.get()
+
+def mcq_bank() -> McqBank:
+    return MCQ_BANK.get()
@@ -0,0 +1,247 @@
+"""
+figures.py — Matplotlib test-decision plots (Mountain Path dark theme).
+
+Kept free of Streamlit so batch tools and report worker processes can draw
+the same figure the app shows without importing the UI. Nothing here goes
+through pyplot: figures are plain matplotlib.figure.Figure objects on their
+own Agg canvas, never entered in pyplot's global registry, so any number of
+threads can draw at once and a figure is freed when its last reference goes.
+
+    plot_test(stat, alpha, tail, title, df)    fresh figure, every artist built from scratch
+    render_png(stat, alpha, tail, title, df)   PNG bytes from a persistent FigureTemplate
+    submit(fn, ...) / render_many(jobs)        the same, concurrently on a shared thread pool
+
+A template is kept per (tail, α, df): the density, the shaded rejection
+region, the critical lines, theme and layout are built and rasterised once,
+and a render only moves the statistic line and marker, rewrites the verdict,
+title and legend label, and draws those over the cached background. It
+rebuilds only when the x-range, the set of visible artists or the title's
+presence changes. The output is pixel-identical to plot_test followed by
+savefig without bbox_inches (see benchmarks/figure_template.py).
+"""
+import io
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import scipy.stats as stats
+import matplotlib.image as mimage
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.layout_engine import TightLayoutEngine
+
+from pvalues import ppf
+
+FIGSIZE       = (10, 4)
+MAX_TEMPLATES = 16                 # each holds an Agg buffer (~6 MB at 200 dpi)
+RENDER_THREADS = 4                 # Agg drawing and PNG encoding release the GIL
+
+
+def _lim(stat):
+    """Half-width of the x-axis: ±4, widened in whole units so an extreme statistic stays on the plot."""
+    return max(4.0, float(np.ceil(abs(stat) + 0.5)))
+
+
+def _verdict(stat, c, tail):
+    rej = ((tail=="two"   and abs(stat) > c) or
+           (tail=="right" and stat      > c) or
+           (tail=="left"  and stat      < c))
+    return ("REJECT H₀", "#dc3545") if rej else ("FAIL TO REJECT H₀", "#28a745")
+
+
+def _draw(ax, stat, alpha, tail, title, df, lim):
+    """Every artist of the plot on `ax`; returns the ones that depend on the statistic (None at 0)."""
+    dist = stats.t(df) if df is not None else stats.norm
+    sym  = "t" if df is not None else "z"
+    crit = lambda q: float(ppf(q, df))
+
+    ax.set_facecolor("#112240")
+    x = np.linspace(-lim, lim, 600); y = dist.pdf(x)
+    ax.plot(x, y, color="#ADD8E6", lw=2.5, zorder=3)
+    ax.fill_between(x, y, alpha=0.22, color="#004d80")
+
+    def shade(xl): ax.fill_between(xl, dist.pdf(xl), color="#dc3545", alpha=0.72, zorder=2)
+
+    if tail == "two":
+        c = crit(1-alpha/2)
+        shade(np.linspace(c,lim+0.05,150)); shade(np.linspace(-lim-0.05,-c,150))
+        ax.axvline(c,  color="#dc3545", ls="--", lw=1.8, label=f"{sym}_crit=±{c:.3f}")
+        ax.axvline(-c, color="#dc3545", ls="--", lw=1.8)
+    elif tail == "right":
+        c = crit(1-alpha)
+        shade(np.linspace(c,lim+0.05,150))
+        ax.axvline(c, color="#dc3545", ls="--", lw=1.8, label=f"{sym}_crit=+{c:.3f}")
+    else:
+        c = crit(alpha)
+        shade(np.linspace(-lim-0.05,c,150))
+        ax.axvline(c, color="#dc3545", ls="--", lw=1.8, label=f"{sym}_crit={c:.3f}")
+
+    moving = None
+    if stat != 0:
+        line = ax.axvline(stat, color="#FFD700", lw=2.5, zorder=4, label=f"{sym}_stat={stat:.4f}")
+        dot  = ax.scatter([stat],[dist.pdf(stat)], color="#FFD700", s=80, zorder=5)
+        text, color = _verdict(stat, c, tail)
+        verdict = ax.text(0.5, 0.92, text, transform=ax.transAxes, ha="center", fontsize=13,
+                          fontweight="bold", color=color)
+        moving = dict(line=line, dot=dot, verdict=verdict, dist=dist, sym=sym, crit=c)
+
+    ax.set_title(title, color="#FFD700", fontsize=11, pad=8)
+    ax.set_xlabel("Standard Deviations from Mean", color="#8892b0", fontsize=9)
+    ax.set_ylabel("Density", color="#8892b0", fontsize=9)
+    ax.tick_params(colors="#8892b0", labelsize=8)
+    legend = ax.legend(facecolor="#112240", labelcolor="#e6f1ff", fontsize=9, edgecolor="#1e3a5f")
+    for sp in ax.spines.values(): sp.set_color("#1e3a5f")
+    ax.grid(axis="y", color="#1e3a5f", alpha=0.4, lw=0.5)
+    if moving is not None:
+        moving["label"] = legend.get_texts()[-1]
+    return moving
+
+
+def plot_test(stat, alpha, tail, title="", df=None, ax=None):
+    """Density with the rejection region shaded and the test statistic marked.
+
+    N(0,1) by default, t(df) when df is given. Draws into `ax` if passed,
+    otherwise on a new 10 × 4 figure with its own Agg canvas. Returns the figure."""
+    if ax is None:
+        fig = Figure(figsize=FIGSIZE)
+        FigureCanvasAgg(fig)
+        fig.patch.set_facecolor("#0a1628")
+        ax = fig.add_subplot()
+        _draw(ax, stat, alpha, tail, title, df, _lim(stat))
+        fig.tight_layout(pad=1.2)
+        return fig
+    _draw(ax, stat, alpha, tail, title, df, _lim(stat))
+    return ax.figure
+
+
+# ═══════════════════════════════════════════════════════════════════
+# PERSISTENT TEMPLATES
+# ═══════════════════════════════════════════════════════════════════
+class FigureTemplate:
+    """One themed figure for a (tail, α, df); render() updates the statistic's artists in place.
+
+    Everything that does not depend on the statistic is rasterised once into a
+    cached background; a render restores it and draws only the moving artists
+    (statistic line, marker, verdict, legend, title) before encoding. Not
+    registered with pyplot, so it never leaks into plt's figure list; a lock
+    serialises renders of the same template across threads."""
+
+    def __init__(self, tail, alpha, df=None, figsize=FIGSIZE):
+        self.tail, self.alpha, self.df = tail, alpha, df
+        self.fig = Figure(figsize=figsize)
+        self.canvas = FigureCanvasAgg(self.fig)
+        self.fig.patch.set_facecolor("#0a1628")
+        self.ax = self.fig.add_subplot()
+        self._layout_dpi = self.fig.dpi               # plot_test lays out at the default dpi too
+        self.lock = threading.Lock()
+        self.builds = self.renders = 0
+        self._shape = self._moving = self._bg = None
+
+    def _update(self, stat, title):
+        shape = (_lim(stat), stat != 0, bool(title))
+        if shape != self._shape:
+            # x-range, visible artists or title height changed → redraw everything and re-lay out
+            self.ax.clear()
+            self.fig.dpi = self._layout_dpi
+            self._moving = _draw(self.ax, stat, self.alpha, self.tail, title, self.df, shape[0])
+            # fig.tight_layout() would leave a layout engine attached; the layout is fixed until the next rebuild
+            TightLayoutEngine(pad=1.2).execute(self.fig)
+            self._animated = [self.ax.title, self.ax.get_legend()]
+            if self._moving is not None:
+                m = self._moving
+                self._animated = [m["verdict"], m["line"], m["dot"], *self._animated]
+            for a in self._animated:
+                a.set_animated(True)
+            self._shape, self._bg = shape, None
+            self.builds += 1
+            return
+        self.ax.title.set_text(title)
+        m = self._moving
+        if m is not None:
+            m["line"].set_xdata([stat, stat])
+            m["dot"].set_offsets([[stat, m["dist"].pdf(stat)]])
+            text, color = _verdict(stat, m["crit"], self.tail)
+            m["verdict"].set_text(text); m["verdict"].set_color(color)
+            m["label"].set_text(f"{m['sym']}_stat={stat:.4f}")
+
+    def _pixels(self, dpi):
+        if self._bg is None or self.fig.dpi != dpi:
+            self.fig.dpi = dpi
+            self.canvas.draw()                                   # static artists only
+            self._bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        self.canvas.restore_region(self._bg)
+        renderer = self.canvas.get_renderer()
+        for a in self._animated:                                 # in the order a full draw uses
+            a.draw(renderer)
+        return self.canvas.buffer_rgba()
+
+    def render(self, stat, title="", dpi=200) -> bytes:
+        """PNG of the figure with this statistic and title."""
+        buf = io.BytesIO()
+        with self.lock:
+            self._update(float(stat), title)
+            mimage.imsave(buf, self._pixels(dpi), format="png", dpi=dpi)
+            self.renders += 1
+        return buf.getvalue()
+
+    def rgba(self, stat, title="", dpi=100) -> np.ndarray:
+        """Rendered pixels (H × W × 4 copy) — for comparisons."""
+        with self.lock:
+            self._update(float(stat), title)
+            return np.asarray(self._pixels(dpi)).copy()
+
+
+_templates, _templates_lock = OrderedDict(), threading.Lock()
+
+
+def template(tail, alpha, df=None) -> FigureTemplate:
+    """The shared template for this (tail, α, df); least recently used ones are dropped past MAX_TEMPLATES."""
+    key = (tail, float(alpha), None if df is None else float(df))
+    with _templates_lock:
+        t = _templates.get(key)
+        if t is None:
+            t = _templates[key] = FigureTemplate(tail, alpha, df)
+            while len(_templates) > MAX_TEMPLATES:
+                _templates.popitem(last=False)
+        _templates.move_to_end(key)
+        return t
+
+
+def render_png(stat, alpha, tail, title="", df=None, dpi=200) -> bytes:
+    """plot_test's figure as PNG bytes, drawn through the shared template."""
+    return template(tail, alpha, df).render(stat, title, dpi)
+
+
+def template_stats() -> dict:
+    with _templates_lock:
+        ts = list(_templates.values())
+    return dict(templates=len(ts), builds=sum(t.builds for t in ts), renders=sum(t.renders for t in ts))
+
+
+# ═══════════════════════════════════════════════════════════════════
+# CONCURRENT RENDERING
+# ═══════════════════════════════════════════════════════════════════
+_pool, _pool_lock = None, threading.Lock()
+
+
+def submit(fn, *args, **kwargs):
+    """Run a rendering callable on the shared figure thread pool; returns a Future."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=RENDER_THREADS, thread_name_prefix="figures")
+    return _pool.submit(fn, *args, **kwargs)
+
+
+def png_bytes(fig, dpi=200, **savefig_kw) -> bytes:
+    """Encode a figure to PNG — the fresh-figure counterpart of render_png."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=dpi, **savefig_kw)
+    return buf.getvalue()
+
+
+def render_many(jobs, dpi=200) -> list:
+    """PNG bytes for each (stat, alpha, tail, title, df) job, rendered concurrently; results in job order."""
+    futures = [submit(render_png, *job, dpi=dpi) for job in jobs]
+    return [f.result() for f in futures]
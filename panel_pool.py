@@ -0,0 +1,156 @@
+"""
+panel_pool.py — Process pool over one return panel placed in shared memory.
+
+Handing a T × k matrix to ProcessPoolExecutor pickles it (or the slice)
+into every task, so a multi-gigabyte panel is copied once per worker per
+call and the transfer eats the speed-up. PanelPool copies the panel into a
+multiprocessing.shared_memory segment once; each worker attaches to it at
+start-up and every task carries only (function, slice, small arguments).
+Workers return small result arrays. The segment is unlinked when the pool
+exits — normally, on an exception in a task, on KeyboardInterrupt, or at
+interpreter exit if the pool was never closed.
+
+    def latest_t(block, window):                 # module-level, so it pickles
+        return rolling_t_test(block, window).t[-1]
+
+    with PanelPool(returns, workers=8) as pool:
+        parts = pool.map(latest_t, pool.column_slices(), window=36)
+    t_latest = np.concatenate(parts)
+
+Row slices work the same way (pool.row_slices()) — e.g. each worker builds
+an accumulator.Accumulator for its rows and the parent merges them.
+"""
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Worker-side: segment name → (SharedMemory, ndarray view), set by _attach
+_ATTACHED = {}
+
+
+def _unlink(name):
+    try:
+        seg = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    seg.close()
+    seg.unlink()
+
+
+def _open(name):
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)     # Python ≥ 3.13
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _attach(name, shape, dtype):
+    seg = _open(name)
+    _ATTACHED[name] = (seg, np.ndarray(shape, dtype=dtype, buffer=seg.buf))
+
+
+def _run(name, fn, index, args, kwargs):
+    view = _ATTACHED[name][1][index]
+    out = fn(view, *args, **kwargs)
+    # A result that still points into the segment would dangle once the pool exits
+    if isinstance(out, np.ndarray) and np.shares_memory(out, _ATTACHED[name][1]):
+        out = out.copy()
+    return out
+
+
+class SharedPanel:
+    """A read-only copy of an array in a shared-memory segment; unlinked on close()."""
+
+    def __init__(self, array):
+        array = np.ascontiguousarray(array)
+        self.shape, self.dtype = array.shape, array.dtype
+        self._seg = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self.name = self._seg.name
+        self.array = np.ndarray(self.shape, dtype=self.dtype, buffer=self._seg.buf)
+        self.array[...] = array
+        self.array.flags.writeable = False
+        self._finalizer = weakref.finalize(self, _unlink, self.name)
+
+    @property
+    def nbytes(self):
+        return self.array.nbytes
+
+    def close(self):
+        """Drop the parent's view and remove the segment (idempotent)."""
+        if self._finalizer.alive:
+            self.array = None
+            try:
+                self._seg.close()
+            except BufferError:            # a caller still holds a view; unlinking is still safe
+                pass
+            self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class PanelPool:
+    """ProcessPoolExecutor whose workers share one panel; tasks name a slice of it."""
+
+    def __init__(self, panel, workers=None, mp_context=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.panel   = panel if isinstance(panel, SharedPanel) else SharedPanel(panel)
+        self._owns   = not isinstance(panel, SharedPanel)
+        try:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=mp_context, initializer=_attach,
+                initargs=(self.panel.name, self.panel.shape, self.panel.dtype),
+            )
+        except BaseException:
+            self._release()
+            raise
+
+    # ── slicing ───────────────────────────────────────────────────
+    def column_slices(self, parts=None):
+        """(slice(None), slice(lo, hi)) index tuples splitting the columns into parts chunks."""
+        return [(slice(None), s) for s in _chunks(self.panel.shape[1], parts or 4 * self.workers)]
+
+    def row_slices(self, parts=None):
+        """slice(lo, hi) index splitting the rows into parts chunks."""
+        return [(s,) for s in _chunks(self.panel.shape[0], parts or 4 * self.workers)]
+
+    # ── execution ─────────────────────────────────────────────────
+    def map(self, fn, indexes, *args, **kwargs):
+        """[fn(panel[index], *args, **kwargs) for index in indexes], run across the workers in order.
+
+        fn must be a module-level function. If any task raises, the pending
+        ones are cancelled and the exception propagates."""
+        futures = [self._pool.submit(_run, self.panel.name, fn, idx, args, kwargs) for idx in indexes]
+        try:
+            return [f.result() for f in futures]
+        except BaseException:
+            for f in futures:
+                f.cancel()
+            raise
+
+    def close(self):
+        try:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+        finally:
+            self._release()
+
+    def _release(self):
+        if self._owns:
+            self.panel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _chunks(n, parts):
+    edges = np.linspace(0, n, min(max(parts, 1), max(n, 1)) + 1).astype(int)
+    return [slice(int(a), int(b)) for a, b in zip(edges[:-1], edges[1:]) if b > a]
@@ -0,0 +1,206 @@
+"""
+prerender.py — Build static HTML for the read-only parts of the app.
+
+Overview, the static halves of the One-/Two-Tailed and Comparison tabs,
+Finance Examples, every explainer and the Education Hub reference sections
+don't depend on user input, so they are rendered once here — with the same
+components.py / charts.py builders the live tabs use — and served as plain
+files. Interactive calculators are only loaded (in an iframe pointing at
+the live app) when a reader clicks to open them.
+
+    python prerender.py                     # → static/site/
+    streamlit run app.py                    # serves it at /app/static/site/index.html
+
+Static serving is enabled in .streamlit/config.toml; any web server or CDN
+can serve the output directory just as well.
+"""
+import argparse
+import html
+import shutil
+from pathlib import Path
+
+from components import (
+    card_html, heading_html, metric_row_html, p,
+    FH, FB, NO_SEL,
+)
+from styles import C, font_face_css, font_preload_html
+import tabs
+import tab_explainers as ex
+import tab_edu_hub as hub
+import edu_content
+
+ROOT        = Path(__file__).parent
+DEFAULT_OUT = ROOT / "static" / "site"
+FONTS_URL   = "../fonts/"      # static/fonts/, built by build_fonts.py
+
+
+# ═══════════════════════════════════════════════════════════════════
+# PAGE SHELL
+# ═══════════════════════════════════════════════════════════════════
+def _nav(pages, current):
+    links = "".join(
+        f'<a href="{slug}.html" style="padding:7px 14px;border-radius:6px;text-decoration:none;'
+        f'font-family:{FB};font-weight:600;font-size:.86rem;'
+        + (f'background:{C["blue"]};color:{C["gold"]};-webkit-text-fill-color:{C["gold"]};'
+           f'border:1px solid {C["gold"]}' if slug == current else
+           f'color:{C["mut"]};-webkit-text-fill-color:{C["mut"]};border:1px solid transparent')
+        + f'">{html.escape(label)}</a>'
+        for slug, label, _ in pages
+    )
+    return (f'<nav style="display:flex;flex-wrap:wrap;gap:4px;background:{C["card"]};'
+            f'border:1px solid #1e3a5f;border-radius:8px;padding:4px;margin-bottom:18px">{links}</nav>')
+
+
+def _live_block(title, blurb, app_url):
+    """Placeholder that swaps itself for the live app only when clicked."""
+    src = html.escape(f"{app_url}?embed=true", quote=True)
+    return card_html(title,
+        p(blurb) +
+        f'<div class="live" data-src="{src}">'
+        f'<button onclick="openLive(this)" style="background:{C["blue"]};color:{C["gold"]};'
+        f'-webkit-text-fill-color:{C["gold"]};border:1px solid {C["gold"]};border-radius:6px;'
+        f'padding:9px 18px;font-family:{FB};font-weight:600;cursor:pointer">'
+        f'▶ Open the interactive calculator</button>'
+        f'<a href="{html.escape(app_url, quote=True)}" style="margin-left:14px;color:{C["lb"]};'
+        f'-webkit-text-fill-color:{C["lb"]};font-family:{FB};font-size:.86rem">or open the full app ↗</a>'
+        f'</div>'
+    )
+
+
+_SCRIPT = """<script>
+function openLive(btn) {
+  const box = btn.parentElement;
+  const f = document.createElement("iframe");
+  f.src = box.dataset.src;
+  f.style.cssText = "width:100%;height:900px;border:1px solid #1e3a5f;border-radius:8px;background:#0a1628";
+  box.replaceWith(f);
+}
+</script>"""
+
+
+def _page(title, nav, body):
+    return f"""<!DOCTYPE html>
+<html lang="en"><head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width,initial-scale=1">
+<title>{html.escape(title)} — Hypothesis Testing in Finance</title>
+{font_preload_html(FONTS_URL)}
+<style>
+{font_face_css(FONTS_URL)}
+body {{ margin:0; background:linear-gradient(135deg,#1a2332,#243447,#2a3f5f) fixed;
+       font-family:'Source Sans Pro',sans-serif; color:{C["txt"]}; }}
+main {{ max-width:1200px; margin:0 auto; padding:16px 20px 40px; }}
+</style>
+</head><body><main>
+<div style="text-align:center;padding:22px 20px 12px;border-bottom:2px solid #FFD700;margin-bottom:18px;{NO_SEL}">
+  <h1 style="font-family:{FH};font-size:2rem;color:#FFD700;-webkit-text-fill-color:#FFD700;margin:0 0 6px">
+    Hypothesis Testing in Finance</h1>
+  <p style="color:#ADD8E6;-webkit-text-fill-color:#ADD8E6;font-family:{FB};font-size:.85rem;font-style:italic;margin:0">
+    The Mountain Path – World of Finance &nbsp;|&nbsp; Prof. V. Ravichandran</p>
+</div>
+{nav}
+{body}
+</main>{_SCRIPT}</body></html>
+"""
+
+
+# ═══════════════════════════════════════════════════════════════════
+# PAGES — each returns the body HTML; assets are written into out/
+# ═══════════════════════════════════════════════════════════════════
+def _overview(out, app_url):
+    return (card_html("📐 Foundation: What is Hypothesis Testing?", tabs._overview_foundation_html())
+            + ex.explainer_overview_html()
+            + card_html("🗺 Decision Guide: Which Test?", tabs._overview_decision_html())
+            + card_html("🔢 Key Constants at a Glance", tabs.OVERVIEW_CONSTANTS_INTRO)
+            + metric_row_html(tabs.OVERVIEW_CONSTANTS))
+
+
+def _one_tailed(out, app_url):
+    return (card_html("→ One-Tailed Tests: Right-Tailed & Left-Tailed", tabs._one_tailed_intro_html())
+            + ex.explainer_one_tailed_html()
+            + _live_block("📊 Worked Example — Portfolio Alpha Test (Interactive)",
+                          "Set x̄, μ₀, σ, n, α and the test direction, and watch the decision update.",
+                          app_url))
+
+
+def _two_tailed(out, app_url):
+    return (card_html("↔ Two-Tailed Test: Testing for Any Difference", tabs._two_tailed_intro_html())
+            + ex.explainer_two_tailed_html()
+            + _live_block("📊 Worked Example — VaR Change Test (Interactive)",
+                          "Change the inputs and α to see both rejection regions move.", app_url))
+
+
+def _comparison(out, app_url):
+    return (card_html("⚖ One-Tailed vs Two-Tailed: Complete Comparison", tabs._comparison_table_html())
+            + ex.explainer_comparison_html()
+            + card_html("🎯 Type I & Type II Errors", tabs._comparison_errors_html())
+            + _live_block("🔭 Critical Value Explorer",
+                          "Select α and test type to explore critical values and rejection regions dynamically.",
+                          app_url))
+
+
+def _finance(out, app_url):
+    scenario, metrics, steps, t_stat, ab = tabs._bond_duration_example()
+    (out / "bond_duration.png").write_bytes(
+        tabs._plot_png(t_stat, ab, "two", tabs.BOND_PLOT_TITLE))
+    return (card_html("💹 Real-World Finance & Risk Applications", tabs._finance_examples_html())
+            + ex.explainer_finance_html()
+            + card_html(tabs.BOND_EXAMPLE_TITLE, scenario)
+            + metric_row_html(metrics)
+            + steps
+            + f'<img src="bond_duration.png" alt="{html.escape(tabs.BOND_PLOT_TITLE)}" '
+              f'loading="lazy" style="width:100%;border-radius:8px;margin-top:12px">')
+
+
+def _edu_hub(out, app_url):
+    themes = edu_content.concept_cards()
+    glossary = edu_content.glossary()
+    return (ex.explainer_edu_hub_html()
+            + card_html("🃏 Concept Cards",
+                        "".join(heading_html(theme) + hub._concept_theme_html(theme, cards)
+                                for theme, cards in themes.items()))
+            + card_html(f"📖 Glossary — {len(glossary)} terms", hub._glossary_html(glossary))
+            + card_html("📐 Formula Sheet", hub._formula_sheet_html())
+            + hub._decision_guide_html()
+            + _live_block("🎓 MCQ Quiz & 🔍 Search",
+                          f"Practise with {edu_content.MCQ_BANK.count()} scored questions and "
+                          f"search every term, card and question.", app_url))
+
+
+PAGES = [
+    ("index",      "📐 Overview",          _overview),
+    ("one-tailed", "→ One-Tailed",         _one_tailed),
+    ("two-tailed", "↔ Two-Tailed",         _two_tailed),
+    ("comparison", "⚖ Comparison",         _comparison),
+    ("finance",    "💹 Finance Examples",  _finance),
+    ("edu-hub",    "📚 Education Hub",     _edu_hub),
+]
+
+
+def build(out=DEFAULT_OUT, app_url="/"):
+    """Render every page into out/ (replacing it); returns {filename: size in bytes}."""
+    out = Path(out)
+    if out.exists():
+        shutil.rmtree(out)
+    out.mkdir(parents=True)
+    for slug, label, render in PAGES:
+        doc = _page(label, _nav(PAGES, slug), render(out, app_url))
+        path = out / f"{slug}.html"
+        path.write_text(doc, encoding="utf-8")
+    return {path.name: path.stat().st_size for path in sorted(out.iterdir())}
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Pre-render the read-only tabs to static HTML.")
+    ap.add_argument("--out", default=str(DEFAULT_OUT), help="output directory (replaced)")
+    ap.add_argument("--app-url", default="/",
+                    help="URL of the live app, loaded on demand for interactive sections")
+    args = ap.parse_args(argv)
+    written = build(args.out, args.app_url)
+    for name, size in written.items():
+        print(f"{size / 1024:8.1f} KiB  {name}")
+    print(f"{len(written)} files → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
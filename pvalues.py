@@ -0,0 +1,146 @@
+"""
+pvalues.py — p-value and critical-value kernels on scipy.special ufuncs.
+
+`stats.norm.cdf` / `stats.t.cdf` validate and broadcast their arguments
+through the rv_continuous machinery on every call (~70 µs for one scalar),
+and `1 - cdf(x)` rounds to 0 once cdf(x) reaches 1 − 2⁻⁵³. These call the
+underlying ufuncs directly (ndtr, ndtri, stdtr, stdtrit — under 1 µs on a
+scalar) and use the survival form for upper tails, so small p-values keep
+full precision. Scalars and arrays go through the same code.
+
+df=None means the standard normal; otherwise Student's t with df degrees
+of freedom (df may be an array that broadcasts against x). Chi-square and
+F have their own p-value / critical-value pair: they are not symmetric, so
+a two-tailed critical value is a (lower, upper) pair.
+"""
+import numpy as np
+from scipy.special import (
+    chdtr, chdtrc, fdtr, fdtrc, fdtri, gammaincinv, gammainccinv,
+    ndtr, ndtri, stdtr, stdtrit,
+)
+
+TAILS = ("right", "left", "two")
+
+
+# ═══════════════════════════════════════════════════════════════════
+# DISTRIBUTION KERNELS
+# ═══════════════════════════════════════════════════════════════════
+def cdf(x, df=None):
+    """P(X ≤ x)."""
+    return ndtr(x) if df is None else stdtr(df, x)
+
+
+def sf(x, df=None):
+    """P(X > x), without the cancellation of 1 − cdf(x) (both laws are symmetric)."""
+    return ndtr(np.negative(x)) if df is None else stdtr(df, np.negative(x))
+
+
+def ppf(q, df=None):
+    """Lower-tail quantile: x with P(X ≤ x) = q."""
+    return ndtri(q) if df is None else stdtrit(df, q)
+
+
+def isf(q, df=None):
+    """Upper-tail quantile: x with P(X > x) = q, exact for tiny q (1 − q is never formed)."""
+    return np.negative(ppf(q, df))
+
+
+# ═══════════════════════════════════════════════════════════════════
+# TEST HELPERS
+# ═══════════════════════════════════════════════════════════════════
+def p_value(stat, tail, df=None):
+    """p-value of a z (df=None) or t statistic for tail "right", "left" or "two"."""
+    if tail == "right":
+        return sf(stat, df)
+    if tail == "left":
+        return cdf(stat, df)
+    if tail == "two":
+        return 2.0 * sf(np.abs(stat), df)
+    raise ValueError(f"tail must be one of {TAILS}, got {tail!r}")
+
+
+def critical(alpha, tail, df=None):
+    """Signed critical value: +c (right), −c (left), +c for |stat| (two)."""
+    if tail == "right":
+        return isf(alpha, df)
+    if tail == "left":
+        return ppf(alpha, df)
+    if tail == "two":
+        return isf(np.multiply(alpha, 0.5), df)
+    raise ValueError(f"tail must be one of {TAILS}, got {tail!r}")
+
+
+def reject(stat, crit, tail):
+    """Decision rule matching `critical`."""
+    if tail == "right":
+        return stat > crit
+    if tail == "left":
+        return stat < crit
+    return np.abs(stat) > crit
+
+
+# ═══════════════════════════════════════════════════════════════════
+# CHI-SQUARE AND F (variance tests)
+# ═══════════════════════════════════════════════════════════════════
+def _two_sided(lower, upper):
+    return np.minimum(2.0 * np.minimum(lower, upper), 1.0)
+
+
+def chi2_p_value(stat, df, tail):
+    """p-value of a χ²(df) statistic; "two" doubles the smaller tail."""
+    if tail == "right":
+        return chdtrc(df, stat)
+    if tail == "left":
+        return chdtr(df, stat)
+    if tail == "two":
+        return _two_sided(chdtr(df, stat), chdtrc(df, stat))
+    raise ValueError(f"tail must be one of {TAILS}, got {tail!r}")
+
+
+def chi2_critical(alpha, tail, df):
+    """Upper (right), lower (left) or (lower, upper) (two) χ²(df) critical values."""
+    half = np.multiply(df, 0.5)
+    if tail == "right":
+        return 2.0 * gammainccinv(half, alpha)
+    if tail == "left":
+        return 2.0 * gammaincinv(half, alpha)
+    if tail == "two":
+        a = np.multiply(alpha, 0.5)
+        return 2.0 * gammaincinv(half, a), 2.0 * gammainccinv(half, a)
+    raise ValueError(f"tail must be one of {TAILS}, got {tail!r}")
+
+
+def f_p_value(stat, dfn, dfd, tail):
+    """p-value of an F(dfn, dfd) statistic; "two" doubles the smaller tail."""
+    if tail == "right":
+        return fdtrc(dfn, dfd, stat)
+    if tail == "left":
+        return fdtr(dfn, dfd, stat)
+    if tail == "two":
+        return _two_sided(fdtr(dfn, dfd, stat), fdtrc(dfn, dfd, stat))
+    raise ValueError(f"tail must be one of {TAILS}, got {tail!r}")
+
+
+def f_critical(alpha, tail, dfn, dfd):
+    """Upper (right), lower (left) or (lower, upper) (two) F critical values.
+
+    The upper quantile is taken as 1 / lower quantile of F(dfd, dfn), which
+    stays exact for small α."""
+    if tail == "right":
+        return 1.0 / fdtri(dfd, dfn, alpha)
+    if tail == "left":
+        return fdtri(dfn, dfd, alpha)
+    if tail == "two":
+        a = np.multiply(alpha, 0.5)
+        return fdtri(dfn, dfd, a), 1.0 / fdtri(dfd, dfn, a)
+    raise ValueError(f"tail must be one of {TAILS}, got {tail!r}")
+
+
+def reject_asym(stat, crit, tail):
+    """Decision rule for chi2_critical / f_critical."""
+    if tail == "right":
+        return stat > crit
+    if tail == "left":
+        return stat < crit
+    lo, hi = crit
+    return (stat < lo) | (stat > hi)
@@ -0,0 +1,236 @@
+"""
+report.py — Per-fund HTML / PDF test reports from a batch result set, streamed.
+
+    python batch.py returns.csv --out results.csv
+    python report.py results.csv --out reports/ --pdf --workers 4
+    python report.py results.csv --out reports/ --threads --workers 8   # one process
+    python report.py --from-store --out reports/          # every stored t_one_sample result
+
+Rows are read one at a time — from batch.py's CSV, or from the result store
+(result_store.iter_results) — and each fund's page (summary, the step-by-step
+table, the decision plot from figures.plot_test) is rendered in a worker
+process — or a worker thread with --threads; plotting is thread-safe — and
+written straight to disk. A page's PNG and PDF are drawn concurrently. The index is appended row by row as
+pages complete, in input order. At most workers × IN_FLIGHT rows are held at
+once, so memory stays flat whether the report covers 10 funds or 10,000.
+
+    out/index.html                       all funds, linked
+    out/funds/<nnnnn>-<fund>.html|.png   one page per fund  (+ .pdf with --pdf)
+"""
+import argparse
+import csv
+import html
+import os
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+from html_parts import (
+    card_html, ib, fml, bdg, hl, vf, vr, txt_s, mut_t,
+    steps_html, metric_row_html, table_head_html, table_row_html,
+    FH, FB, NO_SEL,
+)
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from figures import plot_test, render_png, submit
+
+IN_FLIGHT = 4                      # queued rows per worker
+_TAIL_H1  = {"right": ">", "left": "<", "two": "≠"}
+_TAIL_H0  = {"right": "≤", "left": "≥", "two": "="}
+_TAIL_BDG = {"right": ("Right-Tailed", "red"), "left": ("Left-Tailed", "blue"), "two": ("Two-Tailed", "gold")}
+INDEX_COLUMNS = ["Fund", "n", "Mean", "t", "p-value", "Decision"]
+
+
+# ═══════════════════════════════════════════════════════════════════
+# ROW SOURCES — generators, one fund at a time
+# ═══════════════════════════════════════════════════════════════════
+def _typed(r):
+    out = dict(r)
+    for k in ("n", "df"):
+        out[k] = int(float(r[k]))
+    for k in ("mean", "sd", "mu0", "alpha", "t", "p_value", "t_crit"):
+        out[k] = float(r[k])
+    out["reject"] = str(r["reject"]).lower() in ("true", "1")
+    return out
+
+
+def rows_from_csv(path):
+    """batch.py output, row by row."""
+    with open(path, newline="") as fh:
+        for r in csv.DictReader(fh):
+            yield _typed(r)
+
+
+def rows_from_store(store, kind="t_one_sample"):
+    """Every stored one-sample t-test, oldest first; funds are numbered, the store keeps no names."""
+    for i, (spec, result) in enumerate(store.iter_results(kind), 1):
+        yield _typed(dict(spec["inputs"], **result, fund=f"#{i}", tail=spec["tail"], alpha=spec["alpha"]))
+
+
+# ═══════════════════════════════════════════════════════════════════
+# ONE FUND — runs in a worker
+# ═══════════════════════════════════════════════════════════════════
+def fund_steps(r):
+    """(title, html) steps for steps_html — the same layout as the app's calculators."""
+    tail, n = r["tail"], r["n"]
+    se      = r["sd"] / n ** 0.5
+    t_s, p_s = f"{r['t']:.4f}", f"{r['p_value']:.4g}"
+    crit_s  = f"±{abs(r['t_crit']):.3f}" if tail == "two" else f"{r['t_crit']:+.3f}"
+    cmp_s   = (f"|t| = {abs(r['t']):.3f} {'>' if r['reject'] else '≤'} {abs(r['t_crit']):.3f}" if tail == "two" else
+               f"t = {r['t']:.3f} {'beyond' if r['reject'] else 'inside'} {r['t_crit']:+.3f}")
+    return [
+        ("Hypotheses",     f'H₀: μ {_TAIL_H0[tail]} {r["mu0"]:g} | H₁: μ {_TAIL_H1[tail]} {r["mu0"]:g} → '
+                           + bdg(*_TAIL_BDG[tail])),
+        ("Test statistic", fml(f'SE = s/√n = {r["sd"]:.4f}/√{n} = {se:.4f}\n'
+                               f't = (x̄ − μ₀)/SE = ({r["mean"]:.4f} − {r["mu0"]:g})/{se:.4f} = {hl(t_s)}')),
+        ("Critical value", f'df = n − 1 = {r["df"]}, α = {r["alpha"]:g} → t_crit = {hl(crit_s)}'),
+        ("p-value",        f'p = {hl(p_s)}'),
+        ("Decision",       (vr("REJECT H₀") if r["reject"] else vf("FAIL TO REJECT H₀"))
+                           + txt_s(f' — {cmp_s}')),
+    ]
+
+
+def _plain(markup):
+    return html.unescape(re.sub(r"<[^>]+>", "", markup))
+
+
+def _title(r):
+    return f"{r['fund']} — one-sample t-test (α={r['alpha']:g}, df={r['df']})"
+
+
+def _fund_page(r, png_name, pdf_name):
+    links = (f' · <a href="{html.escape(pdf_name)}" style="color:#ADD8E6">PDF</a>' if pdf_name else "")
+    body = (
+        metric_row_html([("Observations", f"{r['n']:,}"), ("Mean", f"{r['mean']:.4f}"),
+                         ("t", f"{r['t']:.3f}"), ("p-value", f"{r['p_value']:.4g}")])
+        + card_html("Step-by-Step", steps_html(fund_steps(r)))
+        + f'<img src="{html.escape(png_name)}" alt="t distribution" style="width:100%;border-radius:8px">'
+        + f'<p style="font-family:{FB}"><a href="../index.html" style="color:#ADD8E6">← all funds</a>{links}</p>'
+    )
+    return _page_head(f"{r['fund']} — alpha test") + body + _PAGE_TAIL
+
+
+def _pdf_page(r, path):
+    fig = Figure(figsize=(8.27, 11.69))                          # A4 portrait
+    FigureCanvasAgg(fig)
+    fig.patch.set_facecolor("#0a1628")
+    fig.text(0.07, 0.95, _title(r), color="#FFD700", fontsize=15, fontweight="bold")
+    y = 0.90
+    for i, (title, body) in enumerate(fund_steps(r), 1):
+        fig.text(0.07, y, f"{i}. {title}", color="#ADD8E6", fontsize=11, fontweight="bold")
+        for line in _plain(body).splitlines():
+            y -= 0.024
+            fig.text(0.10, y, line, color="#e6f1ff", fontsize=10, family="monospace")
+        y -= 0.038
+    plot_test(r["t"], r["alpha"], r["tail"], _title(r), df=r["df"], ax=fig.add_axes([0.09, 0.07, 0.85, 0.36]))
+    fig.savefig(path, format="pdf", facecolor=fig.get_facecolor())
+
+
+def render_fund(i, r, out, pdf=False, dpi=110):
+    """Write one fund's PNG, HTML (and PDF) page; return (index-row cells, rejected). Module-level, so it pickles."""
+    stem = f"{i:05d}-{re.sub(r'[^A-Za-z0-9_.-]+', '_', str(r['fund']))[:60]}"
+    pdf_done = submit(_pdf_page, r, out / f"{stem}.pdf") if pdf else None
+    (out / f"{stem}.png").write_bytes(render_png(r["t"], r["alpha"], r["tail"], _title(r), df=r["df"], dpi=dpi))
+    if pdf_done is not None:
+        pdf_done.result()
+    (out / f"{stem}.html").write_text(_fund_page(r, f"{stem}.png", pdf and f"{stem}.pdf"), encoding="utf-8")
+    return [f'<a href="funds/{stem}.html" style="color:#ADD8E6">{html.escape(str(r["fund"]))}</a>',
+            f"{r['n']:,}", f"{r['mean']:+.4f}", hl(f"{r['t']:.3f}"), txt_s(f"{r['p_value']:.2e}"),
+            vr("REJECT") if r["reject"] else vf("fail to reject")], r["reject"]
+
+
+# ═══════════════════════════════════════════════════════════════════
+# PIPELINE
+# ═══════════════════════════════════════════════════════════════════
+def _page_head(title):
+    return f"""<!DOCTYPE html>
+<html lang="en"><head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width,initial-scale=1">
+<title>{html.escape(title)}</title>
+<style>
+body {{ margin:0; background:linear-gradient(135deg,#1a2332,#243447,#2a3f5f) fixed;
+       font-family:'Source Sans Pro',sans-serif; color:#e6f1ff; }}
+main {{ max-width:1100px; margin:0 auto; padding:16px 20px 40px; }}
+</style>
+</head><body><main>
+<h1 style="font-family:{FH};font-size:1.7rem;color:#FFD700;-webkit-text-fill-color:#FFD700;{NO_SEL}">
+{html.escape(title)}</h1>
+"""
+
+
+_PAGE_TAIL = "</main></body></html>\n"
+
+
+def _bounded_map(ex, fn, jobs, window):
+    """ex.submit(fn, *job) for each job, at most `window` outstanding; results in job order."""
+    pending = deque()
+    for job in jobs:
+        pending.append(ex.submit(fn, *job))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def generate(rows, out, workers=None, pdf=False, dpi=110, title="Fund Alpha Test Report", threads=False):
+    """Stream `rows` into out/; returns the number of funds written. threads=True renders pages on threads."""
+    out = Path(out)
+    (out / "funds").mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    jobs = ((i, r, out / "funds", pdf, dpi) for i, r in enumerate(rows, 1))
+    n = rejected = 0
+    with open(out / "index.html", "w", encoding="utf-8") as idx:
+        idx.write(_page_head(title))
+        idx.write(ib(txt_s("One right/left/two-tailed one-sample t-test per fund, as produced by batch.py. ")
+                     + mut_t("Click a fund for its step-by-step page."), "blue"))
+        idx.write(table_head_html(INDEX_COLUMNS))
+        if workers <= 1:
+            results = (render_fund(*job) for job in jobs)
+            ex = None
+        else:
+            ex = (ThreadPoolExecutor if threads else ProcessPoolExecutor)(max_workers=workers)
+            results = _bounded_map(ex, render_fund, jobs, workers * IN_FLIGHT)
+        try:
+            for cells, rej in results:
+                idx.write(table_row_html(cells))
+                n += 1
+                rejected += rej
+        finally:
+            if ex is not None:
+                ex.shutdown(wait=True, cancel_futures=True)
+        idx.write("</table>")
+        idx.write(ib(txt_s(f"{n:,} funds · H₀ rejected for {rejected:,}."), "gold"))
+        idx.write(_PAGE_TAIL)
+    return n
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Per-fund HTML/PDF reports from batch.py results, streamed.")
+    ap.add_argument("results", nargs="?", help="batch.py output CSV")
+    ap.add_argument("--from-store", action="store_true", help="read t_one_sample results from the result store")
+    ap.add_argument("--out", default="reports", help="output directory")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="page-rendering processes (threads with --threads)")
+    ap.add_argument("--threads", action="store_true", help="render pages on threads in this process")
+    ap.add_argument("--pdf", action="store_true", help="also write one PDF page per fund")
+    ap.add_argument("--dpi", type=int, default=110)
+    args = ap.parse_args(argv)
+
+    if args.from_store:
+        from result_store import ResultStore
+        rows = rows_from_store(ResultStore())
+    elif args.results:
+        rows = rows_from_csv(args.results)
+    else:
+        ap.error("give a results CSV or --from-store")
+    t0 = time.perf_counter()
+    n = generate(rows, args.out, args.workers, args.pdf, args.dpi, threads=args.threads)
+    print(f"{n:,} fund pages → {args.out}/index.html in {time.perf_counter() - t0:.1f} s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
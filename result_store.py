@@ -0,0 +1,286 @@
+"""
+result_store.py — Persistent, content-addressed store for test results (SQLite, WAL).
+
+A result is keyed by the SHA-256 of its normalised specification —
+statistic type, inputs, tail, α and ENGINE_VERSION — so the same test asked
+for by any session, batch run or colleague sharing the file is computed
+once. Floats are normalised through repr(float(x)), so 0.05, np.float64(0.05)
+and 5e-2 address the same entry; dict keys are sorted.
+
+    store = default_store()
+    r = store.get_or_compute("t_one_sample", dict(n=36, mean=0.42, sd=1.1, mu0=0),
+                             "right", 0.05, compute=lambda: {...})
+    hits = store.get_many(keys); store.put_many(rows)     # batch paths
+    for spec, result in store.iter_results("t_one_sample"): ...
+
+WAL mode lets the app's reader threads and a batch writer work on the file
+at the same time. prune(max_bytes) drops the least recently used entries.
+Reads stay reads: a hit only queues a last_used update (at most one per key
+per TOUCH_SECONDS), and the queue is written with the next put or every
+_BATCH touches. The size check after a put uses a running byte total,
+re-read from the file every _RESYNC puts so other writers' rows count too.
+Results are JSON (numbers, strings, lists, dicts; numpy values are
+converted) — never pickle, because the file may be shared.
+
+Bump ENGINE_VERSION whenever a formula or kernel changes numerically: old
+entries then simply stop matching and age out through prune().
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+ENGINE_VERSION = "2026.10-1"
+DEFAULT_PATH   = Path(os.environ.get("HT_RESULT_STORE",
+                                     Path(__file__).parent / ".cache" / "results.sqlite3"))
+DEFAULT_MAX_BYTES = 256 * 2**20
+_BATCH = 500                       # keys per IN (...) query — well under SQLite's variable limit
+_RESYNC = 256                      # puts between full SUM(size) reads of the running byte total
+TOUCH_SECONDS = 600                # last_used resolution: LRU order only needs to be roughly right
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key       BLOB PRIMARY KEY,
+    kind      TEXT NOT NULL,
+    spec      TEXT NOT NULL,
+    result    TEXT NOT NULL,
+    size      INTEGER NOT NULL,
+    created   REAL NOT NULL,
+    last_used REAL NOT NULL
+) WITHOUT ROWID;
+DROP INDEX IF EXISTS results_kind;
+CREATE INDEX IF NOT EXISTS results_kind_created ON results(kind, created, key);
+CREATE INDEX IF NOT EXISTS results_created      ON results(created, key);
+CREATE INDEX IF NOT EXISTS results_lru          ON results(last_used);
+"""
+
+
+# ═══════════════════════════════════════════════════════════════════
+# NORMALISED SPECIFICATION → KEY
+# ═══════════════════════════════════════════════════════════════════
+def _norm(v):
+    if isinstance(v, dict):
+        return {str(k): _norm(v[k]) for k in sorted(v, key=str)}
+    if isinstance(v, (list, tuple)):
+        return [_norm(x) for x in v]
+    if isinstance(v, np.ndarray):
+        return [_norm(x) for x in v.tolist()]
+    if isinstance(v, (bool, np.bool_)):
+        return bool(v)
+    if isinstance(v, (int, np.integer)):
+        return int(v)
+    if isinstance(v, (float, np.floating)):
+        f = float(v)
+        if f.is_integer() and abs(f) < 2**53:
+            return int(f)                 # 36 and 36.0 are the same input
+        return repr(f) if not np.isfinite(f) else f
+    if v is None or isinstance(v, str):
+        return v
+    raise TypeError(f"cannot normalise {type(v).__name__} for the result store")
+
+
+def spec(kind, inputs, tail, alpha, version=ENGINE_VERSION) -> str:
+    """Canonical JSON of one test specification."""
+    return json.dumps(dict(kind=kind, inputs=_norm(inputs), tail=tail, alpha=_norm(alpha),
+                           version=version),
+                      sort_keys=True, separators=(",", ":"), allow_nan=False)
+
+
+def spec_key(kind, inputs, tail, alpha, version=ENGINE_VERSION) -> bytes:
+    return hashlib.sha256(spec(kind, inputs, tail, alpha, version).encode()).digest()
+
+
+def _encode(result) -> str:
+    if hasattr(result, "_asdict"):               # namedtuples → plain dicts
+        result = result._asdict()
+    return json.dumps(_norm(result), separators=(",", ":"))
+
+
+# ═══════════════════════════════════════════════════════════════════
+# STORE
+# ═══════════════════════════════════════════════════════════════════
+class ResultStore:
+    """SQLite-backed map spec_key → result; one connection shared under a lock."""
+
+    def __init__(self, path=DEFAULT_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        self.path, self.max_bytes = Path(path), max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None,
+                                   timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self.hits = self.misses = 0
+        self._touched = {}                         # key → last_used not yet written
+        self._bytes, self._puts = self._sum_size(), 0
+
+    # ── single lookups ────────────────────────────────────────────
+    def get(self, key: bytes, default=None):
+        found = self.get_many([key])
+        return found.get(key, default)
+
+    def put(self, key: bytes, kind: str, spec_json: str, result):
+        self.put_many([(key, kind, spec_json, result)])
+        return result
+
+    def get_or_compute(self, kind, inputs, tail, alpha, compute):
+        """Stored result for this spec, or compute(), store and return it (as stored: JSON types)."""
+        s = spec(kind, inputs, tail, alpha)
+        key = hashlib.sha256(s.encode()).digest()
+        found = self.get(key)
+        if found is not None:
+            return found
+        result = json.loads(_encode(compute()))
+        self.put(key, kind, s, result)
+        return result
+
+    # ── bulk ──────────────────────────────────────────────────────
+    def get_many(self, keys) -> dict:
+        """{key: result} for the keys present; queues a last_used update for stale hits (no write here)."""
+        keys, out, now = list(keys), {}, time.time()
+        with self._lock:
+            for i in range(0, len(keys), _BATCH):
+                chunk = keys[i:i + _BATCH]
+                marks = ",".join("?" * len(chunk))
+                rows = self._db.execute(f"SELECT key, result, last_used FROM results WHERE key IN ({marks})",
+                                        chunk).fetchall()
+                for k, v, used in rows:
+                    k = bytes(k)
+                    if now - used > TOUCH_SECONDS:
+                        self._touched[k] = now
+                    out[k] = json.loads(v)
+            if len(self._touched) >= _BATCH:
+                self._db.execute("BEGIN")
+                self._flush_touched()
+                self._db.execute("COMMIT")
+        self.hits += len(out)
+        self.misses += len(keys) - len(out)
+        return out
+
+    def put_many(self, rows):
+        """rows: iterable of (key, kind, spec_json, result). One transaction."""
+        now = time.time()
+        data = []
+        for key, kind, s, result in rows:
+            blob = _encode(result)
+            data.append((key, kind, s, blob, len(blob) + len(s), now, now))
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                replaced = 0
+                for i in range(0, len(data), _BATCH):
+                    chunk = [d[0] for d in data[i:i + _BATCH]]
+                    replaced += self._db.execute(
+                        f"SELECT COALESCE(SUM(size), 0) FROM results WHERE key IN ({','.join('?' * len(chunk))})",
+                        chunk).fetchone()[0]
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO results(key, kind, spec, result, size, created, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)", data)
+                self._flush_touched()
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._puts += 1
+            if self._puts % _RESYNC == 0:
+                self._bytes = self._sum_size()
+            else:
+                self._bytes += sum(d[4] for d in data) - replaced
+            over = self.max_bytes and self._bytes > self.max_bytes
+        if over:
+            self.prune(self.max_bytes)
+
+    def iter_results(self, kind=None, batch=1000):
+        """Stream (spec dict, result) rows, oldest first, without loading the table (keyset paging)."""
+        cond, args = ("kind = ? AND ", [kind]) if kind is not None else ("", [])
+        last = (-1.0, b"")
+        while True:
+            with self._lock:
+                rows = self._db.execute(
+                    f"SELECT key, spec, result, created FROM results "
+                    f"WHERE {cond}(created, key) > (?, ?) ORDER BY created, key LIMIT ?",
+                    [*args, *last, batch]).fetchall()
+            if not rows:
+                return
+            for _, s, r, _ in rows:
+                yield json.loads(s), json.loads(r)
+            last = (rows[-1][3], rows[-1][0])
+
+    # ── housekeeping ──────────────────────────────────────────────
+    def _sum_size(self) -> int:
+        return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def _flush_touched(self):
+        """Write queued last_used updates; call inside a transaction, under the lock."""
+        if self._touched:
+            self._db.executemany("UPDATE results SET last_used = ? WHERE key = ?",
+                                 [(t, k) for k, t in self._touched.items()])
+            self._touched.clear()
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._sum_size()
+
+    def prune(self, max_bytes=None):
+        """Delete least-recently-used entries until the stored size is at most 90% of max_bytes."""
+        target = int(0.9 * (max_bytes or self.max_bytes))
+        with self._lock:
+            self._db.execute("BEGIN")
+            self._flush_touched()
+            total = self._sum_size()
+            removed = 0
+            if total > target:
+                # every row whose LRU-ordered running size, before it, is still short of the excess
+                removed = self._db.execute(
+                    "DELETE FROM results WHERE key IN (SELECT key FROM ("
+                    "  SELECT key, SUM(size) OVER (ORDER BY last_used, key) - size AS before FROM results"
+                    ") WHERE before < ?)", (total - target,)).rowcount
+            self._db.execute("COMMIT")
+            self._bytes = self._sum_size()
+            if removed:
+                self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return removed
+
+    def stats(self) -> dict:
+        with self._lock:
+            n, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        lookups = self.hits + self.misses
+        return dict(path=str(self.path), entries=n, bytes=size, max_bytes=self.max_bytes,
+                    hits=self.hits, misses=self.misses, hit_rate=self.hits / lookups if lookups else 0.0)
+
+    def close(self):
+        with self._lock:
+            if self._touched:
+                self._db.execute("BEGIN")
+                self._flush_touched()
+                self._db.execute("COMMIT")
+            self._db.close()
+
+
+_default, _default_lock = None, threading.Lock()
+
+
+def default_store():
+    """Process-wide store at DEFAULT_PATH, or None if the location is not writable."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            try:
+                _default = ResultStore()
+            except (OSError, sqlite3.Error):
+                _default = False
+        return _default or None
+
+
+def get_or_compute(kind, inputs, tail, alpha, compute):
+    """default_store().get_or_compute, falling back to compute() when there is no store."""
+    store = default_store()
+    if store is None:
+        return json.loads(_encode(compute()))
+    return store.get_or_compute(kind, inputs, tail, alpha, compute)
@@ -0,0 +1,109 @@
+"""
+rolling.py — Trailing-window significance tests from prefix sums.
+
+A rolling one-sample t-test recomputed window by window costs O(T·w) per
+series. Here each series is summed once (prefix_moments: cumulative
+count, Σx and Σx², shifted by the series' first value), and every
+window's n, mean and variance is an O(1) difference of two prefix rows —
+O(T) per series, vectorised over all k series of a T × k panel at once.
+
+    X = monthly returns, T × k funds (NaN = fund not yet live)
+    r = rolling_t_test(X, window=36, mu0=0.5, tail="right")
+    r.t[-1], r.p[-1], r.reject[-1]   → latest window, one value per fund
+    r.end                            → row index one past each window's last row
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from pvalues import critical, p_value, reject
+
+Prefix        = namedtuple("Prefix", "n s1 s2 shift")
+RollingResult = namedtuple("RollingResult", "end n mean sd t df p crit reject")
+
+
+# ═══════════════════════════════════════════════════════════════════
+# ONE-PASS WINDOW MOMENTS
+# ═══════════════════════════════════════════════════════════════════
+def prefix_moments(X) -> Prefix:
+    """Cumulative count, Σ(x−c) and Σ(x−c)² per column, with a leading zero row.
+
+    c is each column's first finite value; shifting before summing keeps
+    Σx² − (Σx)²/n free of cancellation when the level is large vs the spread."""
+    X = np.asarray(X, dtype=float)
+    if X.ndim == 1:
+        X = X[:, None]
+    ok    = np.isfinite(X)
+    first = np.argmax(ok, axis=0)
+    shift = np.where(ok.any(axis=0), X[first, np.arange(X.shape[1])], 0.0)
+    D     = np.where(ok, X - shift, 0.0)
+    zero  = np.zeros((1, X.shape[1]))
+    return Prefix(
+        np.vstack([zero, np.cumsum(ok, axis=0)]),
+        np.vstack([zero, np.cumsum(D, axis=0)]),
+        np.vstack([zero, np.cumsum(D * D, axis=0)]),
+        shift,
+    )
+
+
+def window_moments(P: Prefix, col, start, stop):
+    """(n, mean, sample variance) of rows [start, stop) of column col — all broadcast."""
+    n  = P.n[stop, col] - P.n[start, col]
+    s1 = P.s1[stop, col] - P.s1[start, col]
+    s2 = P.s2[stop, col] - P.s2[start, col]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        m   = s1 / n
+        var = np.maximum(s2 - s1 * m, 0.0) / (n - 1)
+    return n, m + P.shift[col], var
+
+
+def rolling_moments(P: Prefix, window: int):
+    """(n, mean, variance) of every trailing window, shaped (T − window + 1, k)."""
+    T = P.n.shape[0] - 1
+    if not 2 <= window <= T:
+        raise ValueError(f"window must be between 2 and {T}, got {window}")
+    start = np.arange(T - window + 1)[:, None]
+    cols  = np.arange(P.n.shape[1])[None, :]
+    return window_moments(P, cols, start, start + window)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# ROLLING TESTS
+# ═══════════════════════════════════════════════════════════════════
+def rolling_t_test(X, window, mu0=0.0, tail="right", alpha=0.05,
+                   min_obs=None, prefix: Prefix = None) -> RollingResult:
+    """
+    One-sample t-test of H₀: μ = mu0 on every trailing window of every column.
+
+    Windows with fewer than min_obs finite values (default: the whole
+    window) come back as NaN with reject=False. Every field is shaped
+    (T − window + 1, k); `end` holds the exclusive end row of each window.
+    """
+    P = prefix if prefix is not None else prefix_moments(X)
+    n, mean, var = rolling_moments(P, window)
+    n  = n.astype(float)
+    ok = n >= (window if min_obs is None else max(2, min_obs))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        sd = np.sqrt(var)
+        t  = np.where(ok, (mean - mu0) / (sd / np.sqrt(n)), np.nan)
+    df   = np.where(ok, n - 1, np.nan)
+    # Only a handful of distinct df (usually one): invert the t CDF once per df, not per cell
+    u, inv = np.unique(df, return_inverse=True)
+    crit = np.asarray(critical(alpha, tail, u))[inv].reshape(df.shape)
+    end  = np.arange(window, P.n.shape[0])
+    return RollingResult(end, n, mean, sd, t, df, p_value(t, tail, df), crit,
+                         ok & reject(t, crit, tail))
+
+
+def rolling_t_test_naive(X, window, mu0=0.0, tail="right", alpha=0.05):
+    """Window-by-window reference (O(T·w) per series) — for benchmarks and checks only."""
+    X = np.asarray(X, dtype=float)
+    if X.ndim == 1:
+        X = X[:, None]
+    T, k = X.shape
+    t = np.full((T - window + 1, k), np.nan)
+    for i in range(T - window + 1):
+        W = X[i:i + window]
+        t[i] = (W.mean(axis=0) - mu0) / (W.std(axis=0, ddof=1) / np.sqrt(window))
+    df = window - 1
+    return t, p_value(t, tail, df), reject(t, critical(alpha, tail, df), tail)
@@ -0,0 +1,104 @@
+"""
+search_index.py — In-process inverted index for Education Hub content.
+Tokenised, prefix-matched, TF-IDF ranked search. Build once per process,
+then every keystroke is a handful of dict lookups instead of a scan.
+"""
+import html
+import math
+import re
+from bisect import bisect_left
+from collections import defaultdict, namedtuple
+
+_TAG  = re.compile(r"<[^>]+>")
+_WORD = re.compile(r"\w+")
+
+# A prefix shorter than this only expands to this many vocabulary terms
+_MAX_EXPANSIONS = 64
+# Prefix-only matches rank below exact token matches
+_PREFIX_WEIGHT  = 0.6
+
+Hit = namedtuple("Hit", "kind key title score payload")
+
+
+def tokenize(text: str) -> list:
+    """Lower-case word tokens with HTML tags and entities removed."""
+    if not text:
+        return []
+    return _WORD.findall(html.unescape(_TAG.sub(" ", text)).lower())
+
+
+class SearchIndex:
+    """
+    Inverted index: token → {doc_id: weighted term frequency}.
+    add() documents, then search(); the vocabulary is re-sorted lazily
+    after the last add, so bulk loading stays linear.
+    """
+
+    def __init__(self):
+        self._postings = defaultdict(dict)
+        self._docs     = []
+        self._vocab    = None
+        self._idf      = {}
+
+    def __len__(self):
+        return len(self._docs)
+
+    def add(self, kind: str, key, title: str, fields: list, payload=None):
+        """fields = list of (text, weight) — e.g. the title weighs more than the body."""
+        doc_id = len(self._docs)
+        self._docs.append((kind, key, title, payload))
+        for text, weight in fields:
+            for tok in tokenize(text):
+                post = self._postings[tok]
+                post[doc_id] = post.get(doc_id, 0.0) + weight
+        self._vocab = None
+
+    def _freeze(self):
+        n = len(self._docs)
+        self._vocab = sorted(self._postings)
+        self._idf   = {tok: math.log(1 + n / len(post)) for tok, post in self._postings.items()}
+
+    def _expand(self, tok):
+        """Vocabulary terms starting with tok, exact match first."""
+        vocab = self._vocab
+        i = bisect_left(vocab, tok)
+        out = []
+        while i < len(vocab) and vocab[i].startswith(tok) and len(out) < _MAX_EXPANSIONS:
+            out.append(vocab[i]); i += 1
+        return out
+
+    def search(self, query: str, kinds=None, limit: int = 25) -> list:
+        """
+        Every query token must match (exactly or as a prefix) for a document
+        to be returned. Score = Σ tf·idf, prefix matches discounted.
+        """
+        if self._vocab is None:
+            self._freeze()
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+
+        scores = None
+        for tok in tokens:
+            tok_scores = {}
+            for term in self._expand(tok):
+                w = self._idf[term] * (1.0 if term == tok else _PREFIX_WEIGHT)
+                for doc_id, tf in self._postings[term].items():
+                    s = tf * w
+                    if s > tok_scores.get(doc_id, 0.0):
+                        tok_scores[doc_id] = s
+            if scores is None:
+                scores = tok_scores
+            else:
+                scores = {d: s + tok_scores[d] for d, s in scores.items() if d in tok_scores}
+            if not scores:
+                return []
+
+        hits = []
+        for doc_id, score in scores.items():
+            kind, key, title, payload = self._docs[doc_id]
+            if kinds and kind not in kinds:
+                continue
+            hits.append(Hit(kind, key, title, score, payload))
+        hits.sort(key=lambda h: -h.score)
+        return hits[:limit]
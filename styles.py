@@ -3,6 +3,8 @@ styles.py — Minimal CSS injection for Mountain Path theme.
 Only handles Streamlit native widgets (tabs, metrics, inputs).
 All custom HTML now goes through st.html() to bypass Streamlit style injection.
 """
+from pathlib import Path
+
 import streamlit as st
 
 # ── Design Tokens (used by both CSS and inline HTML) ──────────────
@@ -21,10 +23,63 @@ C = {
     "bg":      "#1e2d45",
 }
 
+# ── Self-hosted fonts (built by build_fonts.py) ───────────────────
+# Served by Streamlit's static handler at app/static/fonts/. A face whose
+# file is missing is simply not declared, so the stack falls back to a
+# locally installed copy or the generic family — never to the network.
+FONTS_DIR = Path(__file__).parent / "static" / "fonts"
+FONT_URL  = "app/static/fonts/"
+FONT_FACES = [
+    # Body text paints first: swap so text is never invisible.
+    dict(family="Source Sans Pro",  stem="source-sans",   weight="200 900", display="swap",
+         local=["Source Sans Pro", "Source Sans 3"]),
+    dict(family="Playfair Display", stem="playfair",      weight="400 900", display="swap",
+         local=["Playfair Display"]),
+    # Formulas: a late swap reflows columns of numbers, so only use it if it's ready.
+    dict(family="JetBrains Mono",   stem="jetbrains-mono", weight="100 800", display="optional",
+         local=["JetBrains Mono"]),
+]
+_FONT_FORMATS = [("woff2", "woff2"), ("woff", "woff")]
+
+
+def _font_files():
+    """[(face, filename, format)] for the faces that have been built."""
+    found = []
+    for face in FONT_FACES:
+        for ext, fmt in _FONT_FORMATS:
+            if (FONTS_DIR / f'{face["stem"]}.{ext}').exists():
+                found.append((face, f'{face["stem"]}.{ext}', fmt))
+                break
+    return found
+
+
+def font_face_css(base_url: str = FONT_URL) -> str:
+    rules = []
+    for face, filename, fmt in _font_files():
+        local = ", ".join(f'local("{name}")' for name in face["local"])
+        rules.append(
+            f'@font-face {{ font-family: "{face["family"]}"; font-style: normal; '
+            f'font-weight: {face["weight"]}; font-display: {face["display"]}; '
+            f'src: {local}, url("{base_url}{filename}") format("{fmt}"); }}'
+        )
+    return "\n".join(rules)
+
+
+def font_preload_html(base_url: str = FONT_URL) -> str:
+    """<link rel=preload> tags for the built faces — only for a real <head> (prerender.py's static
+    pages). The live app can't use them: st.markdown lands in the body after the app has mounted."""
+    return "".join(
+        f'<link rel="preload" href="{base_url}{filename}" as="font" type="font/{fmt}" crossorigin>'
+        for _, filename, fmt in _font_files()
+    )
+
+
+_FONT_CSS = font_face_css()
+
+
 def inject_css():
-    st.markdown(f"""
-<style>
-@import url('https://fonts.googleapis.com/css2?family=Playfair+Display:wght@400;700&family=Source+Sans+Pro:wght@300;400;600&family=JetBrains+Mono:wght@400;600&display=swap');
+    st.markdown(f"""<style>
+{_FONT_CSS}
 
 /* App background */
 .stApp {{
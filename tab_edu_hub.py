@@ -4,21 +4,19 @@ Decision Guide, and MCQ Quiz for Hypothesis Testing in Finance.
 """
 import streamlit as st
 from components import (
-    render_card, ib, render_ib, fml, bdg,
+    render_card, card_html, ib, render_ib, fml, bdg,
     hl, gt, rt2, lb_t, mut_t, txt_s, p,
     two_col, three_col, table_html,
-    section_heading, steps_html,
+    heading_html, steps_html,
     FH, FB, FM, TXT, NO_SEL,
 )
 from tab_explainers import explainer_edu_hub
+from cache import cached
+from search_index import SearchIndex
+import edu_content
+from edu_content import MCQ_LEVELS
 
 # ── helpers ───────────────────────────────────────────────────────
-def _gold(t):  return f'<span style="color:#FFD700;-webkit-text-fill-color:#FFD700;font-weight:600">{t}</span>'
-def _blue(t):  return f'<span style="color:#ADD8E6;-webkit-text-fill-color:#ADD8E6;font-weight:600">{t}</span>'
-def _green(t): return f'<span style="color:#28a745;-webkit-text-fill-color:#28a745;font-weight:600">{t}</span>'
-def _red(t):   return f'<span style="color:#dc3545;-webkit-text-fill-color:#dc3545;font-weight:600">{t}</span>'
-def _mono(t):  return f'<span style="font-family:{FM};color:#64ffda;-webkit-text-fill-color:#64ffda">{t}</span>'
-
 def _concept_card(icon, title, title_color, border, bg, items):
     rows = "".join(
         f'<div style="display:flex;align-items:flex-start;gap:9px;margin-bottom:8px;{NO_SEL}">'
@@ -83,138 +81,6 @@ def _mini_card(title, color, rows_html):
 # DATA
 # ═══════════════════════════════════════════════════════════
 
-CONCEPT_CARDS = {
-    "Core Concepts": [
-        dict(icon="🎯", title="Hypothesis Framework", title_color="#FFD700",
-             border="#FFD700", bg="rgba(255,215,0,0.07)", items=[
-                dict(badge=bdg("H₀ Null","blue"),       text="Default assumption — 'nothing changed'. Always contains = sign."),
-                dict(badge=bdg("H₁ Alternative","gold"),text="The claim under investigation — direction sets the test type."),
-                dict(badge=bdg("α Type I Error","red"),  text="P(Reject true H₀) — your false alarm tolerance."),
-                dict(badge=bdg("β Type II Error","gold"),text="P(Miss real effect) — Power = 1 − β."),
-                dict(badge=bdg("p-value","blue"),        text="P(result this extreme | H₀ true). Small → strong evidence."),
-                dict(badge=bdg("Test statistic","green"),text="z or t: how many SE from H₀. Compared to critical value."),
-            ]),
-        dict(icon="📏", title="Test Selection", title_color="#ADD8E6",
-             border="#ADD8E6", bg="rgba(0,51,102,0.5)", items=[
-                dict(badge=bdg("Right-tailed","gold"), text="H₁: μ > μ₀ — reject in RIGHT tail only. Critical: +1.645 at α=5%."),
-                dict(badge=bdg("Left-tailed","red"),   text="H₁: μ < μ₀ — reject in LEFT tail only. Critical: −1.645 at α=5%."),
-                dict(badge=bdg("Two-tailed","blue"),   text="H₁: μ ≠ μ₀ — reject in BOTH tails. Critical: ±1.960 at α=5%."),
-                dict(badge=bdg("z-test","green"),      text="Use when σ is known or n ≥ 30 (CLT applies)."),
-                dict(badge=bdg("t-test","blue"),       text="Use when σ is unknown. df = n − 1. t → z as n → ∞."),
-                dict(badge=bdg("Rule","gold"),         text="Pre-commit to test type BEFORE seeing data to avoid p-hacking."),
-            ]),
-        dict(icon="⚠", title="Error Types", title_color="#dc3545",
-             border="#dc3545", bg="rgba(220,53,69,0.08)", items=[
-                dict(badge=bdg("Type I (α)","red"),       text="Reject true H₀. 'False positive.' Controlled by α."),
-                dict(badge=bdg("Type II (β)","gold"),     text="Fail to reject false H₀. 'Missed signal.' Increases as α shrinks."),
-                dict(badge=bdg("Power","green"),          text="1 − β. Probability of detecting a real effect. Increases with n."),
-                dict(badge=bdg("Trade-off","purple" if False else "blue"), text="Lower α → fewer false alarms but lower power. Balance is key."),
-                dict(badge=bdg("Finance: Type I","red"),  text="Declare fund has alpha when it doesn't → invest in dud manager."),
-                dict(badge=bdg("Finance: Type II","gold"),text="Miss a genuinely skilled manager → lost opportunity."),
-            ]),
-    ],
-    "z-Test & t-Test": [
-        dict(icon="📐", title="z-Test (σ Known)", title_color="#FFD700",
-             border="#FFD700", bg="rgba(255,215,0,0.07)", items=[
-                dict(badge=bdg("Formula","gold"),       text="z = (x̄ − μ₀) / (σ/√n)"),
-                dict(badge=bdg("SE","blue"),            text="Standard Error = σ/√n — precision of sample mean."),
-                dict(badge=bdg("α=5%, right","green"),  text="Reject if z > +1.645"),
-                dict(badge=bdg("α=5%, left","red"),     text="Reject if z < −1.645"),
-                dict(badge=bdg("α=5%, two","blue"),     text="Reject if |z| > 1.960"),
-                dict(badge=bdg("When","gold"),          text="σ known (large historical dataset) or n ≥ 30 by CLT."),
-            ]),
-        dict(icon="📊", title="t-Test (σ Unknown)", title_color="#ADD8E6",
-             border="#ADD8E6", bg="rgba(0,51,102,0.5)", items=[
-                dict(badge=bdg("Formula","blue"),       text="t = (x̄ − μ₀) / (s/√n)"),
-                dict(badge=bdg("df","gold"),            text="Degrees of freedom = n − 1. Larger df → closer to z."),
-                dict(badge=bdg("Heavier tails","red"),  text="t-distribution is wider than normal — harder to reject H₀."),
-                dict(badge=bdg("α=5%, df=30","blue"),   text="t_crit ≈ ±2.042 (two-tailed) — wider than z's ±1.960."),
-                dict(badge=bdg("Convergence","green"),  text="As n → ∞, t_crit → z_crit. t-test is always safe."),
-                dict(badge=bdg("Finance use","gold"),   text="Bond duration, credit ratio, or any metric where σ is estimated."),
-            ]),
-        dict(icon="🔢", title="Critical Values Quick Ref", title_color="#28a745",
-             border="#28a745", bg="rgba(40,167,69,0.08)", items=[
-                dict(badge=bdg("1.645","gold"),   text="One-tail z at α=5%  |  Two-tail z at α=10%"),
-                dict(badge=bdg("1.960","blue"),   text="Two-tail z at α=5%"),
-                dict(badge=bdg("2.326","gold"),   text="One-tail z at α=1%"),
-                dict(badge=bdg("2.576","red"),    text="Two-tail z at α=1%"),
-                dict(badge=bdg("Memory aid","green"), text="1.645 → 1.96 → 2.33 → 2.576 (memorise these 4!)"),
-                dict(badge=bdg("t > z always","blue"),text="t critical values always exceed z for same α and finite df."),
-            ]),
-    ],
-    "Finance Applications": [
-        dict(icon="💹", title="Portfolio & Alpha Tests", title_color="#FFD700",
-             border="#FFD700", bg="rgba(255,215,0,0.07)", items=[
-                dict(badge=bdg("Fund Alpha","gold"),     text="H₀: α=0 | H₁: α>0 → Right-tailed t-test on regression intercept."),
-                dict(badge=bdg("CAPM Beta","blue"),      text="H₀: β=1 | H₁: β≠1 → Two-tailed t-test. t=(β̂−1)/SE(β̂)."),
-                dict(badge=bdg("Sharpe Ratio","green"),  text="H₀: SR≤SR₀ → Jobson-Korkie test for risk-adj performance."),
-                dict(badge=bdg("Return Mean","gold"),    text="H₀: μ=benchmark → One or two-tailed depending on prior belief."),
-                dict(badge=bdg("VaR Backtest","red"),    text="Kupiec test: binomial test on breach frequency vs 5%."),
-                dict(badge=bdg("Practical tip","blue"),  text="Always state H₀ and H₁ before examining data — no p-hacking."),
-            ]),
-        dict(icon="🏦", title="Credit & Fixed Income", title_color="#ADD8E6",
-             border="#ADD8E6", bg="rgba(0,51,102,0.5)", items=[
-                dict(badge=bdg("Default Rate","red"),    text="H₀: p≤2% | H₁: p>2% → Right-tailed binomial/z-test."),
-                dict(badge=bdg("Bond Duration","blue"),  text="H₀: D=7yr | H₁: D≠7yr → Two-tailed t-test post-rebalancing."),
-                dict(badge=bdg("Yield Spread","gold"),   text="H₀: spread unchanged → Two-tailed test after macro event."),
-                dict(badge=bdg("NPA Ratio","red"),       text="H₀: NPA≤3% | H₁: NPA>3% → Right-tailed t on quarterly data."),
-                dict(badge=bdg("Convexity","blue"),      text="Test whether portfolio convexity target is met post-trade."),
-                dict(badge=bdg("Capital Adequacy","green"),text="H₀: CAR≥8% → Left-tailed — test for regulatory compliance."),
-            ]),
-    ],
-}
-
-GLOSSARY = [
-    dict(term="Null Hypothesis (H₀)", symbol=None,
-         definition="The default assumption — 'no change', 'no effect', 'equals benchmark'. Always contains an equality (=, ≤, ≥). We never 'prove' H₀; we either reject it or fail to reject it.",
-         formula="H₀: μ = μ₀  (e.g. H₀: mean return = 12%)",
-         example="H₀: A mutual fund's average annual return equals the Nifty50 benchmark return of 12%.",
-         badge_label="Foundation", badge_variant="blue",
-         finance_note="In CFA/FRM: always express H₀ with equality sign. It represents the 'status quo' that the market already prices in."),
-    dict(term="Alternative Hypothesis (H₁)", symbol=None,
-         definition="The claim under investigation. Its direction (>, <, ≠) determines whether the test is right-tailed, left-tailed, or two-tailed. Must be stated BEFORE data collection.",
-         formula="H₁: μ > μ₀  (right)  |  H₁: μ < μ₀  (left)  |  H₁: μ ≠ μ₀  (two)",
-         example="H₁: The fund's average return > 12% (fund claims to outperform the market).",
-         badge_label="Foundation", badge_variant="blue",
-         finance_note="Directional H₁ (one-tailed) requires prior theoretical justification — e.g. a factor model predicts outperformance."),
-    dict(term="z-Statistic", symbol="z = (x̄ − μ₀)/(σ/√n)",
-         definition="The test statistic for a z-test. Measures how many standard errors the sample mean is from the hypothesised mean. Follows a standard normal N(0,1) distribution under H₀.",
-         formula="z = (x̄ − μ₀) / (σ/√n)\nSE = σ/√n  (standard error of the sample mean)",
-         example="x̄=13.5%, μ₀=12%, σ=6%, n=36 → SE=1.0% → z=(13.5−12)/1.0 = 1.50",
-         badge_label="z-Test", badge_variant="gold",
-         finance_note="Used in CAPM tests, VaR backtesting, and any large-sample return distribution test where historical σ is known."),
-    dict(term="t-Statistic", symbol="t = (x̄ − μ₀)/(s/√n)",
-         definition="Test statistic when σ is unknown. Uses sample standard deviation s. Follows a t-distribution with df = n−1. Always has heavier tails than z, making it harder to reject H₀.",
-         formula="t = (x̄ − μ₀) / (s/√n)     df = n − 1\nAs n → ∞: t → z (t_crit → z_crit)",
-         example="Bond duration: x̄=7.84, μ₀=7.0, s=2.94, n=49 → t=(7.84−7.0)/(2.94/7)=2.0",
-         badge_label="t-Test", badge_variant="blue",
-         finance_note="Most common in practice — population σ is rarely known. Use t-test as the default for small/medium samples."),
-    dict(term="p-value", symbol="P(|T| ≥ |t_obs| | H₀)",
-         definition="The probability of observing a test statistic as extreme as the computed one, assuming H₀ is true. NOT the probability H₀ is true. Small p-value = strong evidence against H₀.",
-         formula="Right-tailed: p = P(Z > z)\nLeft-tailed:  p = P(Z < z)\nTwo-tailed:   p = 2 × P(Z > |z|)",
-         example="z = 1.50 (right-tailed): p = P(Z > 1.50) = 1 − 0.9332 = 0.0668. Since 0.0668 > 0.05, fail to reject at α=5%.",
-         badge_label="Decision", badge_variant="gold",
-         finance_note="FRM exam tip: p-value is NOT P(H₀ is true). It is the probability of the data given H₀. A common source of exam errors."),
-    dict(term="Type I Error (α)", symbol="P(Reject H₀ | H₀ true)",
-         definition="Falsely rejecting a true null hypothesis — a 'false positive'. Controlled by setting the significance level α. Lower α → fewer false alarms, but also lower power.",
-         formula="α = P(Type I Error) = significance level\nSet by researcher BEFORE testing: typically 1%, 5%, or 10%",
-         example="At α=5%: if H₀ is true, there is a 5% chance we still reject it (false alarm) due to sampling variation.",
-         badge_label="Error Types", badge_variant="red",
-         finance_note="In investment management: Type I error = allocating capital to a manager with no real skill. Lower α reduces this risk but makes it harder to identify skilled managers (higher Type II risk)."),
-    dict(term="Statistical Power", symbol="Power = 1 − β",
-         definition="The probability of correctly rejecting H₀ when it is false. Power increases with: larger sample size, larger true effect, higher α. One-tailed tests have higher power than two-tailed.",
-         formula="Power = 1 − P(Type II Error)\nPower = P(Reject H₀ | H₀ false)",
-         example="Power = 0.85 means: if the fund truly outperforms, we have an 85% chance of detecting this with our test.",
-         badge_label="Error Types", badge_variant="green",
-         finance_note="Low-power tests miss real market inefficiencies. In quantitative investing, increasing n (more observations) is the primary way to increase power."),
-    dict(term="Critical Value", symbol="z_crit or t_crit",
-         definition="The threshold value of the test statistic beyond which H₀ is rejected. Determined by α, test direction, and distribution. The 'boundary' of the rejection region.",
-         formula="One-tail α=5%:  z_crit = +1.645 (right) or −1.645 (left)\nTwo-tail α=5%:  z_crit = ±1.960\nTwo-tail α=1%:  z_crit = ±2.576",
-         example="Testing fund alpha at α=5% (right-tailed): reject H₀ if z > 1.645. A z of 1.5 does NOT cross this threshold.",
-         badge_label="Decision Rule", badge_variant="blue",
-         finance_note="Memory anchor for CFA/FRM: 1.645 → 1.96 → 2.33 → 2.576. These cover one-tail 5%, two-tail 5%, one-tail 1%, two-tail 1%."),
-]
-
 FORMULA_SECTIONS = {
     "z-Test Formulas": [
         ("z-statistic",      "z = (x̄ − μ₀) / (σ/√n)"),
@@ -250,214 +116,146 @@ FORMULA_SECTIONS = {
     ],
 }
 
-MCQ_BANK = [
-    dict(qid="q01", level="Foundation", topic="Core Concepts",
-         question="The p-value in hypothesis testing represents:",
-         options=["The probability that H₀ is true",
-                  "The probability of observing results this extreme if H₀ is true",
-                  "The significance level α",
-                  "The probability that H₁ is true"],
-         answer=1,
-         explanation=f'The p-value = P(data at least this extreme | H₀ true). It is {_red("NOT")} the probability H₀ is true — a very common misconception. If p < α, we reject H₀.'),
-    dict(qid="q02", level="Foundation", topic="Core Concepts",
-         question="Which of the following correctly describes a Type I Error?",
-         options=["Failing to reject H₀ when it is false",
-                  "Rejecting H₀ when it is actually true",
-                  "Using too small a sample size",
-                  "Setting α too high"],
-         answer=1,
-         explanation=f'Type I Error = {_red("False positive")} — rejecting a true H₀. Its probability is exactly α, the significance level. In finance: declaring a fund manager has skill when they do not.'),
-    dict(qid="q03", level="Foundation", topic="Test Selection",
-         question="A fund manager claims their fund returns ARE DIFFERENT from the benchmark (not necessarily better or worse). Which test is appropriate?",
-         options=["Right-tailed test",
-                  "Left-tailed test",
-                  "Two-tailed test",
-                  "No test needed — just compare means"],
-         answer=2,
-         explanation=f'H₁: μ ≠ benchmark → {_gold("Two-tailed test")}. The claim is non-directional (just "different"), so we check both tails. α is split as α/2 per tail. Critical values are ±1.960 at α=5%.'),
-    dict(qid="q04", level="Foundation", topic="Critical Values",
-         question="At α = 5%, what is the critical value for a one-tailed (right) z-test?",
-         options=["1.282", "1.645", "1.960", "2.576"],
-         answer=1,
-         explanation=f'{_gold("1.645")} is the one-tailed z-critical value at α=5%. For two-tailed at α=5%, it is ±1.960. Memory anchor: 1.645 → 1.96 → 2.33 → 2.576.'),
-    dict(qid="q05", level="Foundation", topic="z vs t-test",
-         question="When should you use a t-test instead of a z-test?",
-         options=["When the sample size is very large (n > 100)",
-                  "When the population standard deviation (σ) is unknown",
-                  "When the data is normally distributed",
-                  "When testing proportions"],
-         answer=1,
-         explanation=f'Use t-test when {_gold("σ is unknown")} and must be estimated by s. The t-distribution has heavier tails than z, accounting for the extra uncertainty. With large n, t → z.'),
-    dict(qid="q06", level="Intermediate", topic="Calculation",
-         question="x̄ = 14%, μ₀ = 12%, σ = 8%, n = 64. What is the z-statistic for testing H₁: μ > 12%?",
-         options=["1.00", "2.00", "0.25", "1.50"],
-         answer=1,
-         explanation=f'SE = σ/√n = 8/8 = 1.0%. z = (14 − 12)/1.0 = {_gold("2.00")}. Since 2.00 > 1.645, reject H₀ at α=5% (right-tailed).'),
-    dict(qid="q07", level="Intermediate", topic="Test Selection",
-         question="A risk manager tests whether a portfolio's VaR INCREASED after a new regulation. Which test?",
-         options=["Two-tailed (H₁: VaR ≠ old)",
-                  "Right-tailed (H₁: VaR > old)",
-                  "Left-tailed (H₁: VaR < old)",
-                  "No formal test needed"],
-         answer=1,
-         explanation=f'The manager specifically predicts VaR {_red("increased")} — a directional claim. H₁: VaR > old → {_gold("Right-tailed test")}. All α is in the right tail, giving maximum power to detect an increase.'),
-    dict(qid="q08", level="Intermediate", topic="Errors",
-         question="A bank sets α = 1% for its credit approval model to minimise false approvals. What is the direct consequence?",
-         options=["Higher power to detect bad borrowers",
-                  "Increased Type II Error (more good borrowers rejected)",
-                  "Reduced sample size needed",
-                  "Lower standard errors"],
-         answer=1,
-         explanation=f'Lowering α from 5% to 1% reduces Type I Error (fewer false approvals) but {_red("increases Type II Error")} — good borrowers are more frequently denied credit (false rejections). Power decreases.'),
-    dict(qid="q09", level="Intermediate", topic="p-value",
-         question="A bond duration test gives z = 1.75, two-tailed, α = 5%. p-value ≈ 0.080. The conclusion is:",
-         options=["Reject H₀ — duration has changed",
-                  "Fail to reject H₀ — insufficient evidence of change",
-                  "Cannot conclude without knowing the sample size",
-                  "Reject H₀ because z > 1.645"],
-         answer=1,
-         explanation=f'p = 0.080 > α = 0.05 → {_green("Fail to reject H₀")}. Also: |z| = 1.75 < 1.960 (two-tail critical). Note: 1.75 > 1.645, but 1.645 is the ONE-tailed critical value, not two-tailed. A common trap!'),
-    dict(qid="q10", level="Intermediate", topic="Finance",
-         question="CAPM beta = 1.18, SE(β) = 0.12. Testing H₀: β = 1 vs H₁: β ≠ 1 at α = 5%. Decision?",
-         options=["Reject H₀ — beta is significantly different from 1",
-                  "Fail to reject — beta is not significantly different from 1",
-                  "Cannot tell without the p-value",
-                  "Use a one-tailed test instead"],
-         answer=0,
-         explanation=f't = (1.18 − 1.0)/0.12 = 0.18/0.12 = {_gold("1.50")}. With large df, t_crit ≈ ±1.96. Since 1.50 < 1.96, {_green("Fail to reject H₀")}. Beta is not statistically different from 1 at α=5%. (The correct answer is B.)'),
-    dict(qid="q11", level="Advanced", topic="Power",
-         question="A fund wants to test alpha using n = 36 monthly returns. Power is low. Which action MOST increases power without changing α?",
-         options=["Switch from two-tailed to one-tailed test",
-                  "Increase sample size to n = 100",
-                  "Lower α from 5% to 10%",
-                  "Both A and B would equally increase power"],
-         answer=3,
-         explanation=f'Both increasing n and switching to one-tailed test increase power. {_gold("Increasing n")} improves power for any test type. {_gold("One-tailed test")} concentrates all α in one tail, reducing the critical value from 1.96 to 1.645. Combined, they have the greatest effect.'),
-    dict(qid="q12", level="Advanced", topic="Finance",
-         question="A portfolio manager's monthly alpha is 0.4% with SE = 0.25%, n = 60 months, α = 1%. Is the alpha statistically significant?",
-         options=["Yes — t = 1.60 > 1.645",
-                  "No — t = 1.60 < 2.326 (one-tail z at α=1%)",
-                  "Yes — t = 1.60 > 1.282",
-                  "Insufficient information"],
-         answer=1,
-         explanation=f't = 0.4/0.25 = {_gold("1.60")}. This is a right-tailed test (H₁: α > 0). At α=1%, one-tail z_crit = 2.326. Since 1.60 < 2.326, {_red("Fail to reject")} at α=1%. Note: would reject at α=5% (z_crit=1.645 is barely not met, but very close) and would reject at α=10% (z_crit=1.282).'),
-]
+# Matching formula box per concept-card theme
+THEME_FORMULAS = {
+    "Core Concepts":      ("Core Decision Rule",
+                           "Reject H₀ if:  test stat > critical value\n"
+                           "           OR:  p-value < α\n\n"
+                           "p-value (right):  1 − Φ(z)\n"
+                           "p-value (left):   Φ(z)\n"
+                           "p-value (two):    2 × [1 − Φ(|z|)]"),
+    "z-Test & t-Test":    ("z vs t Quick Reference",
+                           "z = (x̄ − μ₀)/(σ/√n)  [σ known]\n"
+                           "t = (x̄ − μ₀)/(s/√n)  [σ unknown, df=n−1]\n\n"
+                           "α=5%: 1-tail z=1.645 | 2-tail z=±1.960\n"
+                           "α=1%: 1-tail z=2.326 | 2-tail z=±2.576"),
+    "Finance Applications":("Finance Test Reference",
+                            "Jensen's alpha:   t = α̂/SE(α̂)   [right-tailed]\n"
+                            "CAPM beta:        t = (β̂−1)/SE(β̂) [two-tailed]\n"
+                            "Duration shift:   t = (D̄−D₀)/(s/√n) [two-tailed]\n"
+                            "VaR backtest:     Kupiec LR ~ χ²(1)"),
+}
+
+# ── Full-text search: one index per section, built on its first search ──
+SEARCH_KINDS = {"glossary": "📖 Glossary", "card": "🃏 Concept Cards",
+                "formula": "📐 Formula Sheet", "mcq": "🎓 MCQs"}
+
+def _index_glossary(idx, glossary):
+    for t in glossary:
+        idx.add("glossary", t["term"], t["term"],
+                [(t["term"], 3.0), (t["symbol"] or "", 1.5), (t["badge_label"], 1.5),
+                 (t["definition"], 1.0), (t["formula"], 1.0),
+                 (t["example"], 0.7), (t["finance_note"], 0.7)],
+                payload=t)
+
+def _index_cards(idx, concept_cards):
+    for theme, cards in concept_cards.items():
+        for card in cards:
+            idx.add("card", (theme, card["title"]), card["title"],
+                    [(card["title"], 3.0), (theme, 1.0)]
+                    + [(it["badge"], 1.5) for it in card["items"]]
+                    + [(it["text"], 1.0) for it in card["items"]],
+                    payload=card)
+
+def _index_formulas(idx, sections):
+    for section, rows in sections.items():
+        for label, formula in rows:
+            idx.add("formula", (section, label), label,
+                    [(label, 3.0), (section, 1.0), (formula, 1.0)],
+                    payload=(section, label, formula))
+
+def _index_mcqs(idx, mcq_bank):
+    for q in mcq_bank.questions:
+        idx.add("mcq", q["qid"], q["question"],
+                [(q["question"], 3.0), (q["topic"], 1.5), (q["level"], 1.0),
+                 (" ".join(q["options"]), 1.0), (q["explanation"], 0.7)],
+                payload=q)
+
+# kind → (lazy content section, or None for the in-code formula sheet; indexer)
+_SEARCH_SOURCES = {
+    "glossary": (edu_content.GLOSSARY,      _index_glossary),
+    "card":     (edu_content.CONCEPT_CARDS, _index_cards),
+    "formula":  (None,                      _index_formulas),
+    "mcq":      (edu_content.MCQ_BANK,      _index_mcqs),
+}
+_SEARCH_INDEXES = {}   # kind → (content version, index)
+
+def _search_index(kind):
+    """Index over one section — loading only that section — rebuilt when its file is reloaded."""
+    section, index = _SEARCH_SOURCES[kind]
+    content = FORMULA_SECTIONS if section is None else section.get()
+    version = None if section is None else section.version
+    built = _SEARCH_INDEXES.get(kind)
+    if built is None or built[0] != version:
+        idx = SearchIndex()
+        index(idx, content)
+        built = _SEARCH_INDEXES[kind] = (version, idx)
+    return built[1]
+
+def _search(query, kinds, limit=25):
+    """Hits from each chosen section's index, merged by score (tf-idf within its own section)."""
+    hits = [h for kind in kinds for h in _search_index(kind).search(query, limit=limit)]
+    return sorted(hits, key=lambda h: -h.score)[:limit]
 
 
 # ═══════════════════════════════════════════════════════════
-# SECTION RENDERERS
+# STATIC SECTION HTML — shared by the live tab and prerender.py
 # ═══════════════════════════════════════════════════════════
 
-def _section_concept_cards():
-    theme = st.selectbox("Theme", list(CONCEPT_CARDS.keys()), key="edu_theme")
-    cards = CONCEPT_CARDS[theme]
-    if len(cards) == 2:
-        cols = st.columns(2)
-        for col, card in zip(cols, cards):
-            col.html(_concept_card(**card))
-    else:
-        cols = st.columns(3)
-        for col, card in zip(cols, cards):
-            col.html(_concept_card(**card))
-
-    # Matching formula box per theme
-    theme_fmls = {
-        "Core Concepts":      ("Core Decision Rule",
-                               "Reject H₀ if:  test stat > critical value\n"
-                               "           OR:  p-value < α\n\n"
-                               "p-value (right):  1 − Φ(z)\n"
-                               "p-value (left):   Φ(z)\n"
-                               "p-value (two):    2 × [1 − Φ(|z|)]"),
-        "z-Test & t-Test":    ("z vs t Quick Reference",
-                               "z = (x̄ − μ₀)/(σ/√n)  [σ known]\n"
-                               "t = (x̄ − μ₀)/(s/√n)  [σ unknown, df=n−1]\n\n"
-                               "α=5%: 1-tail z=1.645 | 2-tail z=±1.960\n"
-                               "α=1%: 1-tail z=2.326 | 2-tail z=±2.576"),
-        "Finance Applications":("Finance Test Reference",
-                                "Jensen's alpha:   t = α̂/SE(α̂)   [right-tailed]\n"
-                                "CAPM beta:        t = (β̂−1)/SE(β̂) [two-tailed]\n"
-                                "Duration shift:   t = (D̄−D₀)/(s/√n) [two-tailed]\n"
-                                "VaR backtest:     Kupiec LR ~ χ²(1)"),
-    }
-    if theme in theme_fmls:
-        title, formula_text = theme_fmls[theme]
-        render_ib(
-            f'<span style="color:#FFD700;-webkit-text-fill-color:#FFD700;font-weight:600">📐 {title}</span>'
-            + fml(formula_text), "gold"
-        )
-
-
-def _section_glossary():
-    col1, col2 = st.columns([2, 1])
-    search = col1.text_input("🔍 Search terms", placeholder="e.g. p-value, critical, Type I...", key="edu_search")
-    topic_f = col2.selectbox("Filter by topic", ["All", "Core Concepts", "z-Test", "t-Test", "Decision", "Errors", "Finance"], key="edu_topic")
-
-    TOPIC_MAP = {
-        "Core Concepts": ["Null", "Alternative", "Hypothesis"],
-        "z-Test":        ["z-Stat", "z-test", "z-"],
-        "t-Test":        ["t-Stat", "t-test", "t-"],
-        "Decision":      ["p-value", "Critical"],
-        "Errors":        ["Type I", "Type II", "Power"],
-        "Finance":       ["CAPM", "Alpha", "Duration", "Finance"],
-    }
-
-    filtered = GLOSSARY
-    if search.strip():
-        s = search.lower()
-        filtered = [t for t in filtered
-                    if s in t["term"].lower() or s in t["definition"].lower()
-                    or s in (t.get("finance_note") or "").lower()]
-    if topic_f != "All":
-        kws = TOPIC_MAP.get(topic_f, [])
-        filtered = [t for t in filtered if any(k.lower() in t["term"].lower() for k in kws)]
-
-    if not filtered:
-        render_ib(rt2("No terms match. Try a broader search."), "red")
-        return
-
-    st.html(f'<div style="color:#8892b0;-webkit-text-fill-color:#8892b0;font-family:{FB};'
-            f'font-size:.82rem;margin-bottom:10px;{NO_SEL}">'
-            f'Showing {len(filtered)} of {len(GLOSSARY)} terms</div>')
-    for t in filtered:
-        st.html(_term_card(**t))
+def _concept_theme_html(theme, cards):
+    cols = "1fr 1fr" if len(cards) == 2 else "1fr 1fr 1fr"
+    grid = (f'<div style="display:grid;grid-template-columns:{cols};gap:14px;margin:10px 0">'
+            + "".join(f'<div>{_concept_card(**card)}</div>' for card in cards) + '</div>')
+    return grid + _theme_formula_html(theme)
+
+@cached("html")
+def _theme_formula_html(theme):
+    if theme not in THEME_FORMULAS:
+        return ""
+    title, formula_text = THEME_FORMULAS[theme]
+    return ib(
+        f'<span style="color:#FFD700;-webkit-text-fill-color:#FFD700;font-weight:600">📐 {title}</span>'
+        + fml(formula_text), "gold"
+    )
 
+def _glossary_html(terms):
+    return "".join(_term_card(**t) for t in terms)
 
-def _section_formula_sheet():
+@cached("html")
+def _formula_sheet_html():
     secs = list(FORMULA_SECTIONS.items())
-    cols1 = st.columns(2)
-    for col, (title, rows) in zip(cols1, secs[:2]):
-        rh = "".join(_row(k, v) for k, v in rows)
-        col.html(_mini_card(title, "#FFD700", rh))
-    cols2 = st.columns(2)
-    for col, (title, rows) in zip(cols2, secs[2:]):
-        rh = "".join(_row(k, v) for k, v in rows)
-        col.html(_mini_card(title, "#ADD8E6", rh))
-
-    section_heading("📊 Critical Values Table (z-distribution)")
-    st.html(table_html(
-        ["α", "One-Tail z", "Two-Tail z (±)", "t (df=30)", "t (df=60)", "t (df=∞)"],
-        [
-            [txt_s("0.10"), hl("1.282"), hl("1.645"), txt_s("1.310"), txt_s("1.296"), txt_s("1.282")],
-            [txt_s("0.05"), hl("1.645"), hl("1.960"), txt_s("2.042"), txt_s("2.000"), txt_s("1.960")],
-            [txt_s("0.025"),hl("1.960"), hl("2.241"), txt_s("2.360"), txt_s("2.299"), txt_s("2.241")],
-            [txt_s("0.01"), hl("2.326"), hl("2.576"), txt_s("2.750"), txt_s("2.660"), txt_s("2.576")],
-            [txt_s("0.005"),hl("2.576"), hl("2.807"), txt_s("3.030"), txt_s("2.915"), txt_s("2.807")],
-        ]
-    ))
-    render_ib(
-        f'<span style="color:#ADD8E6;-webkit-text-fill-color:#ADD8E6;font-weight:600">Memory Anchor: </span>'
-        + hl("1.645 → 1.96 → 2.33 → 2.576")
-        + txt_s(' — One-tail 5%, Two-tail 5%, One-tail 1%, Two-tail 1%. These four cover 90% of all finance tests!'),
-        "blue"
+    cards = [_mini_card(title, "#FFD700" if i < 2 else "#ADD8E6",
+                        "".join(_row(k, v) for k, v in rows))
+             for i, (title, rows) in enumerate(secs)]
+    return (
+        two_col(cards[0], cards[1]) +
+        two_col(cards[2], cards[3]) +
+        heading_html("📊 Critical Values Table (z-distribution)") +
+        table_html(
+            ["α", "One-Tail z", "Two-Tail z (±)", "t (df=30)", "t (df=60)", "t (df=∞)"],
+            [
+                [txt_s("0.10"), hl("1.282"), hl("1.645"), txt_s("1.310"), txt_s("1.296"), txt_s("1.282")],
+                [txt_s("0.05"), hl("1.645"), hl("1.960"), txt_s("2.042"), txt_s("2.000"), txt_s("1.960")],
+                [txt_s("0.025"),hl("1.960"), hl("2.241"), txt_s("2.360"), txt_s("2.299"), txt_s("2.241")],
+                [txt_s("0.01"), hl("2.326"), hl("2.576"), txt_s("2.750"), txt_s("2.660"), txt_s("2.576")],
+                [txt_s("0.005"),hl("2.576"), hl("2.807"), txt_s("3.030"), txt_s("2.915"), txt_s("2.807")],
+            ]
+        ) +
+        ib(
+            f'<span style="color:#ADD8E6;-webkit-text-fill-color:#ADD8E6;font-weight:600">Memory Anchor: </span>'
+            + hl("1.645 → 1.96 → 2.33 → 2.576")
+            + txt_s(' — One-tail 5%, Two-tail 5%, One-tail 1%, Two-tail 1%. These four cover 90% of all finance tests!'),
+            "blue"
+        )
     )
 
-
-def _section_decision_guide():
-    render_card("🗺 Decision Trees",
+@cached("html")
+def _decision_guide_html():
+    out = card_html("🗺 Decision Trees",
         p(f'Use these trees to choose the right test every time.')
     )
-    section_heading("1️⃣  Which Test Type?")
-    st.html(table_html(
+    out += heading_html("1️⃣  Which Test Type?")
+    out += table_html(
         ["Situation", "H₁", "Test Type", "Critical z (α=5%)"],
         [
             [txt_s("You predict metric <strong>increased</strong>"),  txt_s("μ > μ₀"), bdg("Right-tailed","gold"),  hl("+1.645")],
@@ -465,10 +263,10 @@ def _section_decision_guide():
             [txt_s("You predict metric <strong>changed</strong>"),    txt_s("μ ≠ μ₀"), bdg("Two-tailed","blue"),   hl("±1.960")],
             [txt_s("No prior prediction — just investigating"),       txt_s("μ ≠ μ₀"), bdg("Two-tailed (default)","blue"), hl("±1.960")],
         ]
-    ))
+    )
 
-    section_heading("2️⃣  z-test or t-test?")
-    st.html(table_html(
+    out += heading_html("2️⃣  z-test or t-test?")
+    out += table_html(
         ["Condition", "Use", "Key Difference"],
         [
             [txt_s("σ (population std dev) is <strong>known</strong>"), bdg("z-test","gold"), txt_s("Standard normal N(0,1) distribution")],
@@ -476,9 +274,9 @@ def _section_decision_guide():
             [txt_s("Large sample (n ≥ 30) but σ unknown"),               bdg("t-test (safer)","blue"), txt_s("t → z as n increases. t-test is always valid")],
             [txt_s("Proportion test (p̂ vs p₀)"),                        bdg("z-test","gold"), txt_s("z = (p̂ − p₀) / √(p₀(1−p₀)/n)")],
         ]
-    ))
+    )
 
-    section_heading("3️⃣  Interpreting the Result")
+    out += heading_html("3️⃣  Interpreting the Result")
     two_left = ib(
         f'<span style="color:#dc3545;-webkit-text-fill-color:#dc3545;font-weight:700">🔴 REJECT H₀ when:</span>'
         + steps_html([
@@ -495,10 +293,10 @@ def _section_decision_guide():
             ("What it means",             f'Insufficient evidence to reject H₀ — NOT proof H₀ is true'),
         ]), "green"
     )
-    st.html(two_col(two_left, two_right))
+    out += two_col(two_left, two_right)
 
-    section_heading("4️⃣  Finance Test Cheat Sheet")
-    st.html(table_html(
+    out += heading_html("4️⃣  Finance Test Cheat Sheet")
+    out += table_html(
         ["Finance Question", "H₀", "H₁", "Test", "α Typical"],
         [
             [txt_s("Does fund generate alpha?"),        txt_s("α = 0"), txt_s("α > 0"), bdg("Right t","gold"),  txt_s("5%")],
@@ -507,7 +305,160 @@ def _section_decision_guide():
             [txt_s("Has default rate increased?"),      txt_s("p ≤ 2%"), txt_s("p > 2%"), bdg("Right z","red"), txt_s("1%")],
             [txt_s("Did VaR model fail (backtesting)?"),txt_s("breach=5%"), txt_s(">5%"), bdg("Right z/LR","red"), txt_s("5%")],
         ]
-    ))
+    )
+    return out
+
+
+# ═══════════════════════════════════════════════════════════
+# SECTION RENDERERS
+# ═══════════════════════════════════════════════════════════
+
+def _section_concept_cards():
+    concept_cards = edu_content.concept_cards()
+    theme = st.selectbox("Theme", list(concept_cards.keys()), key="edu_theme")
+    st.html(_concept_theme_html(theme, concept_cards[theme]))
+
+
+def _section_glossary():
+    col1, col2 = st.columns([2, 1])
+    search = col1.text_input("🔍 Search terms", placeholder="e.g. p-value, critical, Type I...", key="edu_search")
+    topic_f = col2.selectbox("Filter by topic", ["All", "Core Concepts", "z-Test", "t-Test", "Decision", "Errors", "Finance"], key="edu_topic")
+
+    TOPIC_MAP = {
+        "Core Concepts": ["Null", "Alternative", "Hypothesis"],
+        "z-Test":        ["z-Stat", "z-test", "z-"],
+        "t-Test":        ["t-Stat", "t-test", "t-"],
+        "Decision":      ["p-value", "Critical"],
+        "Errors":        ["Type I", "Type II", "Power"],
+        "Finance":       ["CAPM", "Alpha", "Duration", "Finance"],
+    }
+
+    glossary = edu_content.glossary()
+    filtered = glossary
+    if search.strip():
+        filtered = [h.payload for h in _search_index("glossary").search(search, limit=len(glossary))]
+    if topic_f != "All":
+        kws = TOPIC_MAP.get(topic_f, [])
+        filtered = [t for t in filtered if any(k.lower() in t["term"].lower() for k in kws)]
+
+    if not filtered:
+        render_ib(rt2("No terms match. Try a broader search."), "red")
+        return
+
+    st.html(f'<div style="color:#8892b0;-webkit-text-fill-color:#8892b0;font-family:{FB};'
+            f'font-size:.82rem;margin-bottom:10px;{NO_SEL}">'
+            f'Showing {len(filtered)} of {len(glossary)} terms</div>')
+    st.html(_glossary_html(filtered))
+
+
+def _mcq_study_html(q):
+    return (
+        _mcq_header_html(q, None)
+        + f'<div style="background:rgba(40,167,69,0.08);border-left:3px solid #28a745;'
+          f'border-radius:5px;padding:9px 13px;margin:4px 0 12px;{NO_SEL}">'
+          f'<span style="color:#28a745;-webkit-text-fill-color:#28a745;font-weight:700">'
+          f'Answer: {q["options"][q["answer"]]}</span><br>'
+          f'<span style="font-family:{FB};font-size:.86rem;color:#e6f1ff;'
+          f'-webkit-text-fill-color:#e6f1ff;line-height:1.6">{q["explanation"]}</span></div>'
+    )
+
+
+def _section_search():
+    col1, col2 = st.columns([2, 1])
+    query = col1.text_input("🔍 Search the Education Hub",
+                            placeholder="e.g. power, two-tailed, jensen alpha...", key="edu_fts")
+    kinds = col2.multiselect("In", list(SEARCH_KINDS), default=list(SEARCH_KINDS),
+                             format_func=SEARCH_KINDS.get, key="edu_fts_kinds")
+    if not query.strip():
+        render_ib(txt_s("Type a word or the start of one — every word must match. "
+                        "Results are ranked by relevance across glossary terms, concept cards, "
+                        "the formula sheet and MCQs."),
+                  "blue")
+        return
+
+    hits = _search(query, kinds)
+    if not hits:
+        render_ib(rt2("No matches. Try fewer or shorter words."), "red")
+        return
+
+    st.html(f'<div style="color:#8892b0;-webkit-text-fill-color:#8892b0;font-family:{FB};'
+            f'font-size:.82rem;margin-bottom:10px;{NO_SEL}">'
+            f'{len(hits)} match(es) for “{query.strip()}”</div>')
+    for h in hits:
+        if h.kind == "glossary":
+            st.html(_term_card(**h.payload))
+        elif h.kind == "card":
+            st.html(f'<div style="margin-bottom:13px">{_concept_card(**h.payload)}</div>')
+        elif h.kind == "formula":
+            section, label, formula = h.payload
+            st.html(f'<div style="margin-bottom:13px">{_mini_card(section, "#FFD700", _row(label, formula))}</div>')
+        else:
+            st.html(_mcq_study_html(h.payload))
+
+
+def _section_formula_sheet():
+    st.html(_formula_sheet_html())
+
+
+def _section_decision_guide():
+    st.html(_decision_guide_html())
+
+
+MCQ_PAGE_SIZES = [5, 10, 25, 50]
+
+# Static question headers, keyed by (qid, status) — at most 3 per question.
+# Cleared whenever the MCQ bank file is reloaded.
+_MCQ_HDR_CACHE   = {}
+_MCQ_HDR_VERSION = None
+
+def _sync_mcq_header_cache():
+    global _MCQ_HDR_VERSION
+    if _MCQ_HDR_VERSION != edu_content.MCQ_BANK.version:
+        _MCQ_HDR_CACHE.clear()
+        _MCQ_HDR_VERSION = edu_content.MCQ_BANK.version
+
+def _mcq_header_html(q, answered):
+    status = None if answered is None else answered == q["answer"]
+    key = (q["qid"], status)
+    html = _MCQ_HDR_CACHE.get(key)
+    if html is None:
+        # Header colour
+        if status is None:
+            hdr_col, hdr_bg = "#ADD8E6", "rgba(0,51,102,0.4)"
+        elif status:
+            hdr_col, hdr_bg = "#28a745", "rgba(40,167,69,0.12)"
+        else:
+            hdr_col, hdr_bg = "#dc3545", "rgba(220,53,69,0.12)"
+
+        lv_badge = bdg(q["level"],
+                       "green" if q["level"]=="Foundation" else
+                       "gold"  if q["level"]=="Intermediate" else "red")
+
+        html = _MCQ_HDR_CACHE[key] = (
+            f'<div style="background:{hdr_bg};border-left:4px solid {hdr_col};border-radius:8px;'
+            f'padding:12px 15px;margin-bottom:4px;{NO_SEL}">'
+            f'<div style="display:flex;align-items:center;gap:8px;margin-bottom:7px">'
+            f'{lv_badge}{bdg(q["topic"],"blue")}'
+            f'<span style="font-family:{FH};color:{hdr_col};-webkit-text-fill-color:{hdr_col};'
+            f'font-size:.95rem;font-weight:700;margin-left:4px">{q["question"]}</span></div>'
+            f'</div>'
+        )
+    return html
+
+
+def _record_mcq_answer(q):
+    """Radio on_change callback — store the answer and adjust the running score."""
+    qid = q["qid"]
+    sel = st.session_state.get(f"mcq_{qid}")
+    if sel is None:
+        return
+    sel_idx = q["options"].index(sel)
+    prev    = st.session_state.mcq_answered.get(qid)
+    if prev == sel_idx:
+        return
+    ans = edu_content.mcq_bank().answer[qid]
+    st.session_state.mcq_answered[qid] = sel_idx
+    st.session_state.mcq_score += (sel_idx == ans) - (prev == ans)
 
 
 def _section_mcq():
@@ -516,24 +467,26 @@ def _section_mcq():
     if "mcq_answered" not in st.session_state:
         st.session_state.mcq_answered = {}
 
+    bank = edu_content.mcq_bank()
+    _sync_mcq_header_cache()
+
     c1, c2, c3 = st.columns(3)
-    level_f = c1.selectbox("Level", ["All", "Foundation", "Intermediate", "Advanced"], key="mcq_lvl")
-    topic_q = c2.selectbox("Topic", ["All"] + sorted(set(q["topic"] for q in MCQ_BANK)), key="mcq_top")
+    level_f = c1.selectbox("Level", ["All"] + MCQ_LEVELS, key="mcq_lvl")
+    topic_q = c2.selectbox("Topic", ["All"] + bank.topics, key="mcq_top")
     mode    = c3.radio("Mode", ["📖 Study (show answers)", "🎯 Quiz (hide answers)"],
                        key="mcq_mode", horizontal=True)
     study_mode = "Study" in mode
 
     if st.button("🔄 Reset Quiz", key="mcq_reset"):
+        for qid in st.session_state.mcq_answered:
+            st.session_state.pop(f"mcq_{qid}", None)
         st.session_state.mcq_score   = 0
         st.session_state.mcq_answered = {}
         st.rerun()
 
-    filtered = MCQ_BANK
-    if level_f != "All": filtered = [q for q in filtered if q["level"] == level_f]
-    if topic_q != "All": filtered = [q for q in filtered if q["topic"] == topic_q]
+    filtered = bank.buckets.get((level_f, topic_q), [])
 
-    correct   = sum(1 for qid, ans in st.session_state.mcq_answered.items()
-                    if ans == next((q["answer"] for q in MCQ_BANK if q["qid"] == qid), -1))
+    correct   = st.session_state.mcq_score
     attempted = len(st.session_state.mcq_answered)
     pct       = (correct / attempted * 100) if attempted else 0
     score_color = "#28a745" if pct >= 80 else "#FFD700" if pct >= 60 else "#dc3545"
@@ -548,31 +501,29 @@ def _section_mcq():
           f'font-size:.82rem">{len(filtered)} question(s) shown</span></div>'
     )
 
-    for q in filtered:
+    if not filtered:
+        return
+
+    pc1, pc2, _ = st.columns([1, 1, 2])
+    per_page = pc1.selectbox("Questions per page", MCQ_PAGE_SIZES, index=1, key="mcq_per_page")
+    n_pages  = -(-len(filtered) // per_page)
+    if st.session_state.get("mcq_page", 1) > n_pages:
+        st.session_state.mcq_page = 1
+    page  = pc2.number_input("Page", min_value=1, max_value=n_pages, step=1, key="mcq_page")
+    start = (page - 1) * per_page
+    page_qs = filtered[start:start + per_page]
+    st.html(f'<div style="font-family:{FB};color:#8892b0;-webkit-text-fill-color:#8892b0;'
+            f'font-size:.82rem;margin-bottom:8px;{NO_SEL}">'
+            f'Page {page} of {n_pages} · questions {start + 1}–{start + len(page_qs)}</div>')
+
+    # Warm the header cache for the next page while this one renders
+    for q in filtered[start + per_page:start + 2 * per_page]:
+        _mcq_header_html(q, None)
+
+    for q in page_qs:
         qid     = q["qid"]
         answered = st.session_state.mcq_answered.get(qid)
-
-        # Header colour
-        if answered is None:
-            hdr_col, hdr_bg = "#ADD8E6", "rgba(0,51,102,0.4)"
-        elif answered == q["answer"]:
-            hdr_col, hdr_bg = "#28a745", "rgba(40,167,69,0.12)"
-        else:
-            hdr_col, hdr_bg = "#dc3545", "rgba(220,53,69,0.12)"
-
-        lv_badge = bdg(q["level"],
-                       "green" if q["level"]=="Foundation" else
-                       "gold"  if q["level"]=="Intermediate" else "red")
-
-        st.html(
-            f'<div style="background:{hdr_bg};border-left:4px solid {hdr_col};border-radius:8px;'
-            f'padding:12px 15px;margin-bottom:4px;{NO_SEL}">'
-            f'<div style="display:flex;align-items:center;gap:8px;margin-bottom:7px">'
-            f'{lv_badge}{bdg(q["topic"],"blue")}'
-            f'<span style="font-family:{FH};color:{hdr_col};-webkit-text-fill-color:{hdr_col};'
-            f'font-size:.95rem;font-weight:700;margin-left:4px">{q["question"]}</span></div>'
-            f'</div>'
-        )
+        st.html(_mcq_header_html(q, answered))
 
         sel = st.radio(
             f'Options for {qid}',
@@ -580,10 +531,10 @@ def _section_mcq():
             key=f"mcq_{qid}",
             index=answered if answered is not None else None,
             label_visibility="collapsed",
+            on_change=_record_mcq_answer, args=(q,),
         )
         if sel is not None:
             sel_idx = q["options"].index(sel)
-            st.session_state.mcq_answered[qid] = sel_idx
             if study_mode or sel_idx == q["answer"]:
                 correct_txt = q["options"][q["answer"]]
                 col = "#28a745" if sel_idx == q["answer"] else "#dc3545"
@@ -616,21 +567,22 @@ def tab_edu_hub():
           f'formulas, and finance applications. Use alongside the calculator tabs.') +
         three_col(
             ib(f'<span style="color:#FFD700;-webkit-text-fill-color:#FFD700;font-weight:600">🃏 Concept Cards</span><br>'
-               + p(f'{bdg(f"{sum(len(v) for v in CONCEPT_CARDS.values())} cards","gold")} across 3 themes'), "gold"),
+               + p(f'{bdg(f"{edu_content.CONCEPT_CARDS.count()} cards","gold")} across 3 themes'), "gold"),
             ib(f'<span style="color:#ADD8E6;-webkit-text-fill-color:#ADD8E6;font-weight:600">📖 Glossary</span><br>'
-               + p(f'{bdg(f"{len(GLOSSARY)} key terms","blue")} with definitions + examples'), "blue"),
+               + p(f'{bdg(f"{edu_content.GLOSSARY.count()} key terms","blue")} with definitions + examples'), "blue"),
             ib(f'<span style="color:#28a745;-webkit-text-fill-color:#28a745;font-weight:600">📐 + 🗺 + 🎓</span><br>'
-               + p(f'Formula Sheet · Decision Guide · {bdg(f"{len(MCQ_BANK)} MCQs","green")}'), "green"),
+               + p(f'Formula Sheet · Decision Guide · {bdg(f"{edu_content.MCQ_BANK.count()} MCQs","green")}'), "green"),
         )
     )
 
     mode = st.radio("Section",
                     ["🃏 Concept Cards", "📖 Glossary", "📐 Formula Sheet",
-                     "🗺 Decision Guide", "🎓 MCQ Quiz"],
+                     "🗺 Decision Guide", "🎓 MCQ Quiz", "🔍 Search"],
                     horizontal=True, key="edu_mode")
 
     if "Concept"  in mode: _section_concept_cards()
     elif "Gloss"  in mode: _section_glossary()
+    elif "Search" in mode: _section_search()
     elif "Formula"in mode: _section_formula_sheet()
     elif "Decision"in mode:_section_decision_guide()
     else:                   _section_mcq()
@@ -1,10 +1,12 @@
 """
 tab_explainers.py
 Layman-friendly "How This Tab Works" explainer boxes for every tab.
-Call render_explainer_XXX() at the top of each tab function.
+Call render_explainer_XXX() at the top of each tab function;
+explainer_XXX_html() returns the same box as a string (used by prerender.py).
 """
 import streamlit as st
 from components import FH, FB, FM, NO_SEL, ib, bdg, hl, gt, rt2, p, txt_s
+from cache import cached
 
 # ── colour helpers ────────────────────────────────────────────────
 def _gold(t):  return f'<span style="color:#FFD700;-webkit-text-fill-color:#FFD700;font-weight:600">{t}</span>'
@@ -16,7 +18,7 @@ def _mono(t):  return f'<span style="font-family:{FM};color:#64ffda;-webkit-text
 
 def _explainer(steps, tip, variant="blue"):
     """
-    Render a "How This Tab Works" box.
+    Build a "How This Tab Works" box.
     steps = list of (emoji, bold_title, plain_description)
     tip   = Plain English one-liner shown in gold
     """
@@ -43,15 +45,16 @@ def _explainer(steps, tip, variant="blue"):
         f'color:#ADD8E6;-webkit-text-fill-color:#ADD8E6;'
         f'margin-bottom:11px;letter-spacing:.3px;{NO_SEL}">🗺 How This Tab Works</div>'
     )
-    st.html(ib(header + rows + tip_box, variant))
+    return ib(header + rows + tip_box, variant)
 
 
 # ═══════════════════════════════════════════════════════════
 # TAB-SPECIFIC EXPLAINERS
 # ═══════════════════════════════════════════════════════════
 
-def explainer_overview():
-    _explainer([
+@cached("html")
+def explainer_overview_html():
+    return _explainer([
         ("🎯", "The Core Idea",
          f"Hypothesis testing is a formal way of asking: {_gold('Could this result have happened by chance?')} "
          f"You start with a baseline assumption (H₀ = nothing interesting happened) and use sample data "
@@ -73,8 +76,9 @@ def explainer_overview():
         "The p-value tells you the probability the result occurred by chance. Below 5%? Probably real.")
 
 
-def explainer_one_tailed():
-    _explainer([
+@cached("html")
+def explainer_one_tailed_html():
+    return _explainer([
         ("➡", "When to Use One-Tailed",
          f"Use a one-tailed test when you already have a {_gold('prior belief about direction')} — "
          f"for example, you believe a fund OUTPERFORMS (not just 'differs'). "
@@ -95,8 +99,9 @@ def explainer_one_tailed():
         "Choose based on theory, not data. The smaller critical value gives you more power to detect real effects.")
 
 
-def explainer_two_tailed():
-    _explainer([
+@cached("html")
+def explainer_two_tailed_html():
+    return _explainer([
         ("↔", "When to Use Two-Tailed",
          f"Use two-tailed when you only know {_gold('something changed')} but not which direction. "
          f"Example: 'Did the new trading system change our VaR?' — it could go up or down."),
@@ -117,8 +122,9 @@ def explainer_two_tailed():
         "More conservative (harder to reject), but safer — you won't miss an unexpected reversal.")
 
 
-def explainer_comparison():
-    _explainer([
+@cached("html")
+def explainer_comparison_html():
+    return _explainer([
         ("⚖", "The Core Trade-off",
          f"One-tailed tests have {_green('more power')} (easier to detect real effects) "
          f"but only work if you are sure about direction. "
@@ -140,8 +146,9 @@ def explainer_comparison():
         "Two-tailed = airbag that deploys in any crash (safer, catches everything).")
 
 
-def explainer_finance():
-    _explainer([
+@cached("html")
+def explainer_finance_html():
+    return _explainer([
         ("💹", "Finance Hypothesis Tests",
          f"Every row in the table is a real question a portfolio manager or risk officer asks. "
          f"The math is identical each time — only the {_gold('context, H₀, and variable')} change. "
@@ -166,8 +173,9 @@ def explainer_finance():
         "The only thing that changes is what you are testing.")
 
 
-def explainer_non_finance():
-    _explainer([
+@cached("html")
+def explainer_non_finance_html():
+    return _explainer([
         ("🌍", "Why Non-Finance Examples?",
          f"Hypothesis testing is a {_gold('universal framework')} — the same z-test and t-test "
          f"that tests fund alpha also tests whether a new drug works, whether exam scores improved, "
@@ -192,8 +200,31 @@ def explainer_non_finance():
         "The logic is identical to testing whether a fund manager has genuine skill.")
 
 
-def explainer_edu_hub():
-    _explainer([
+@cached("html")
+def explainer_two_sample_html():
+    return _explainer([
+        ("⇄", "Two Samples, One Question",
+         f"Instead of one sample against a fixed μ₀, we compare {_gold('two groups')}: "
+         f"a fund against its benchmark, or strategy A against strategy B. "
+         f"H₀ says the true mean difference is zero."),
+        ("🔗", "Paired vs Independent",
+         f"Same months for both series? Use the {_gold('paired')} test on the differences — "
+         f"market noise common to both cancels out. Separate samples? Use {_blue('pooled')} "
+         f"if the variances look equal, otherwise {_blue('Welch')}."),
+        ("📐", "Welch's Degrees of Freedom",
+         f"Welch estimates df from the two variances ({_mono('Welch–Satterthwaite')}), "
+         f"so it stays honest when one strategy is far more volatile than the other."),
+        ("⚡", "Screening Many Pairs",
+         f"The strategy screen runs the same test on {_gold('hundreds of strategies at once')} — "
+         f"each series' mean and variance is computed once and reused for every comparison."),
+    ],
+    tip="Paired = 'did this fund beat its own benchmark month by month?' "
+        "Welch = 'do these two unrelated strategies really earn different average returns?'")
+
+
+@cached("html")
+def explainer_edu_hub_html():
+    return _explainer([
         ("🃏", "Concept Cards",
          f"Visual badge-style reference cards grouped by topic: "
          f"{_gold('Core Concepts')}, {_gold('Test Selection')}, {_gold('Error Types')}, "
@@ -219,8 +250,9 @@ def explainer_edu_hub():
         "Run the MCQ Quiz to confirm you can apply the concepts under pressure.")
 
 
-def explainer_python():
-    _explainer([
+@cached("html")
+def explainer_python_html():
+    return _explainer([
         ("📦", "What the Code Does",
          f"Four ready-to-run Python snippets covering the {_gold('complete z-test and t-test workflow')}: "
          f"computing the test statistic, finding critical values, calculating p-values, "
@@ -241,3 +273,18 @@ def explainer_python():
     tip="Start with the z_test function — it handles everything in one call. "
         "Change the 'tail' argument to 'right', 'left', or 'two' to match your hypothesis. "
         "The Live Code Runner lets you verify any calculation from the other tabs instantly.")
+
+
+# ═══════════════════════════════════════════════════════════
+# RENDERERS
+# ═══════════════════════════════════════════════════════════
+
+def explainer_overview():      st.html(explainer_overview_html())
+def explainer_one_tailed():    st.html(explainer_one_tailed_html())
+def explainer_two_tailed():    st.html(explainer_two_tailed_html())
+def explainer_comparison():    st.html(explainer_comparison_html())
+def explainer_finance():       st.html(explainer_finance_html())
+def explainer_non_finance():   st.html(explainer_non_finance_html())
+def explainer_two_sample():    st.html(explainer_two_sample_html())
+def explainer_edu_hub():       st.html(explainer_edu_hub_html())
+def explainer_python():        st.html(explainer_python_html())
@@ -3,22 +3,22 @@ tab_non_finance.py — Everyday (Non-Finance) Hypothesis Testing Examples
 Six real-world cases from medicine, education, manufacturing, psychology, 
 agriculture, and quality control. Same z/t framework, different domains.
 """
+from collections import namedtuple
+
 import streamlit as st
 import numpy as np
-import scipy.stats as stats
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
 
 from components import (
-    render_card, ib, render_ib, fml, bdg,
+    render_card, card_html, ib, render_ib, fml, bdg,
     hl, gt, rt2, vf, vr, lb_t, mut_t, txt_s, p,
     steps_html, two_col, three_col, table_html,
     metric_row, section_heading,
     S, FH, FB, FM, TXT, NO_SEL,
 )
 from tab_explainers import explainer_non_finance
-from tabs import _plot_test
+from tabs import _show_plot
+from cache import cached
+from pvalues import critical, p_value, reject
 
 # ── Local helpers ─────────────────────────────────────────────────
 def _f(t): return f'<span style="font-family:{FM};color:#64ffda;-webkit-text-fill-color:#64ffda">{t}</span>'
@@ -47,323 +47,284 @@ def _result_badge(rej):
 
 
 # ═══════════════════════════════════════════════════════════
-# CASE STUDY FUNCTIONS
+# CASE REGISTRY
+# Each case is data: inputs, tail, z/t, and narrative text.
+# Results for every case × α are solved once at import.
 # ═══════════════════════════════════════════════════════════
 
-def _case_drug_trial(alpha):
-    """Case 1 — Medicine: Drug efficacy test"""
-    xb, mu0, sigma, n = 138.5, 140.0, 8.0, 64
-    se = sigma / np.sqrt(n)
-    z  = (xb - mu0) / se
-    zc = stats.norm.ppf(alpha)           # left-tailed
-    pv = stats.norm.cdf(z)
-    rej = z < zc
-
-    render_card("💊 Case 1 — Medicine: Blood Pressure Drug Trial",
-        ib(_case_header("1", "🏥 Clinical Medicine", "Does the new drug lower blood pressure?",
-                         "Left-Tailed z-test", "red"),
-           "gold") +
-        p(f'A pharmaceutical company tests a new antihypertensive drug. '
-          f'Before treatment, patients averaged {hl("140 mmHg")} systolic BP (σ = 8 mmHg, known from large prior studies). '
-          f'After administering the drug to {hl("n = 64 patients")}, the sample mean drops to {hl("138.5 mmHg")}. '
-          f'Does the drug significantly reduce blood pressure?') +
-        two_col(
-            ib(f'<span style="color:#ADD8E6;-webkit-text-fill-color:#ADD8E6;font-weight:600">Hypotheses</span><br>'
-               + p(f'{lb_t("<strong>H₀:</strong>")} μ ≥ 140 mmHg (drug has no effect or worsens)'
-                   f'<br>{lb_t("<strong>H₁:</strong>")} μ < 140 mmHg (drug lowers BP)'
-                   f'<br>{bdg("Left-Tailed Test", "red")} — we predict a decrease'), "blue"),
-            ib(f'<span style="color:#FFD700;-webkit-text-fill-color:#FFD700;font-weight:600">Why left-tailed?</span><br>'
-               + p('We specifically predict the drug <em>reduces</em> BP — we are not merely asking '
-                   'if BP changed. The directional prediction concentrates all rejection power '
-                   'in the left tail, making the test more sensitive to reduction.'), "gold"),
-        ) +
-        fml(f'SE  = σ/√n = {sigma}/√{n} = {se:.4f}\n'
-            f'z   = (x̄ − μ₀)/SE = ({xb} − {mu0})/{se:.4f} = {hl(f"{z:.4f}")}\n'
-            f'z_crit (α={alpha}, left) = {hl(f"{zc:.3f}")}\n'
-            f'p-value = P(Z < {z:.4f}) = {hl(f"{pv:.4f}")}')
-    )
-
-    metric_row([
-        ("z-statistic", f"{z:.4f}", None),
-        (f"z-critical (α={alpha})", f"{zc:.3f}", None),
-        ("p-value", f"{pv:.4f}", None),
-        ("Decision", "REJECT H₀ 🔴" if rej else "FAIL TO REJECT 🟢", None),
-    ])
+ALPHAS = [0.10, 0.05, 0.025, 0.01]
+
+_TAIL_NAME = {"left": "Left-Tailed", "right": "Right-Tailed", "two": "Two-Tailed"}
+_TAIL_SHORT = {"left": "Left", "right": "Right", "two": "Two-tail"}
+
+CASES = [
+    dict(cid=1, label="💊 Case 1 — Drug Trial (Medicine)",
+         icon="💊", title="Medicine: Blood Pressure Drug Trial",
+         domain="🏥 Clinical Medicine", question="Does the new drug lower blood pressure?",
+         short_domain="Medicine", short_question="Drug lowers BP?",
+         color="red", header_variant="gold",
+         dist="z", tail="left", xb=138.5, mu0=140.0, sd=8.0, n=64,
+         intro=(f'A pharmaceutical company tests a new antihypertensive drug. '
+                f'Before treatment, patients averaged {hl("140 mmHg")} systolic BP (σ = 8 mmHg, known from large prior studies). '
+                f'After administering the drug to {hl("n = 64 patients")}, the sample mean drops to {hl("138.5 mmHg")}. '
+                f'Does the drug significantly reduce blood pressure?'),
+         h0="μ ≥ 140 mmHg (drug has no effect or worsens)", h1="μ < 140 mmHg (drug lowers BP)",
+         h0_short="μ ≥ 140", h1_short="μ < 140",
+         hyp_note="we predict a decrease",
+         why=("Why left-tailed?", "gold",
+              'We specifically predict the drug <em>reduces</em> BP — we are not merely asking '
+              'if BP changed. The directional prediction concentrates all rejection power '
+              'in the left tail, making the test more sensitive to reduction.'),
+         steps=dict(unit="mmHg", signif="Statistically significant drug effect"),
+         verdict=("Real-World Interpretation: ", "green",
+                  "The drug shows a statistically significant reduction in blood pressure at the chosen significance level. The FDA would require additional trials, but this is a promising result.",
+                  "The reduction in mean blood pressure (1.5 mmHg) is not statistically significant at the chosen level — it could easily be due to random sampling variation. More subjects or a larger dose may be needed."),
+         plot_title="Drug Trial: BP Reduction Test"),
+
+    dict(cid=2, label="📚 Case 2 — Teaching Method (Education)",
+         icon="📚", title="Education: New Teaching Method Test",
+         domain="🏫 Education Research", question="Did the new teaching method improve exam scores?",
+         short_domain="Education", short_question="Teaching method improves?",
+         color="gold", header_variant="gold",
+         dist="t", tail="right", xb=72.4, mu0=68.0, sd=14.0, n=49,
+         intro=(f'A university introduces a {hl("flipped classroom")} teaching method. '
+                f'Historically, the average exam score was {hl("68 marks")} (out of 100). '
+                f'A sample of {hl("n = 49 students")} taught with the new method scored a mean of {hl("72.4")} '
+                f'(sample std dev = 14.0). Did the new method improve scores?'),
+         h0="μ ≤ 68 (no improvement or worse)", h1="μ > 68 (scores improved)",
+         h0_short="μ ≤ 68", h1_short="μ > 68",
+         hyp_note="σ unknown, use t-distribution",
+         why=("Why t-test?", "gold",
+              'Population σ is unknown — we only have the sample std dev s. '
+              'The t-distribution has heavier tails than normal, making it harder to reject H₀, '
+              'which is appropriate. With df = {df} and large n, t ≈ z.'),
+         verdict=("Real-World Interpretation: ", "green",
+                  "The improvement of 4.4 marks is statistically significant — the flipped classroom method genuinely raised scores. The university should consider adopting it widely.",
+                  "The 4.4-mark improvement is not statistically significant at this level — it could reflect sampling variation. The university should test with a larger cohort before adopting the method."),
+         plot_title="Teaching Method: Score Improvement Test"),
+
+    dict(cid=3, label="🏭 Case 3 — Factory QC (Manufacturing)",
+         icon="🏭", title="Manufacturing: Cereal Box Weight QC",
+         domain="⚙ Quality Control", question="Is the filling machine still calibrated correctly?",
+         short_domain="Manufacturing", short_question="Machine calibrated?",
+         color="blue", header_variant="blue",
+         dist="z", tail="two", xb=499.1, mu0=500.0, sd=4.0, n=100,
+         intro=(f'A cereal factory calibrates its filling machine to {hl("500g per box")} (σ = 4g). '
+                f'A quality inspector samples {hl("n = 100 boxes")} and finds a mean weight of {hl("499.1g")}. '
+                f'Is the machine out of calibration — in either direction?'),
+         h0="μ = 500g (machine correctly calibrated)", h1="μ ≠ 500g (machine drifted — either direction)",
+         h0_short="μ = 500g", h1_short="μ ≠ 500g",
+         hyp_note="drift could be over- or under-filling",
+         why=("Why two-tailed?", "gold",
+              'The inspector does not predict which direction the machine drifted. '
+              'Under-filling cheats consumers (legal risk). Over-filling wastes product (cost risk). '
+              'Both matter equally — so α is split across both tails.'),
+         verdict=("Real-World Interpretation: ", "green",
+                  "The weight deviation is statistically significant — the machine has drifted and needs recalibration. The under-fill of 0.9g may seem small, but across millions of boxes this represents significant material loss or regulatory risk.",
+                  "The 0.9g under-fill is within normal sampling variation at this significance level. No immediate recalibration is required, but the inspector should increase monitoring frequency."),
+         plot_title="QC: Box Weight Calibration Test"),
+
+    dict(cid=4, label="🧠 Case 4 — Sleep Study (Psychology)",
+         icon="🧠", title="Psychology: Sleep Deprivation & Reaction Time",
+         domain="🧬 Behavioural Science", question="Does sleep deprivation worsen reaction time?",
+         short_domain="Psychology", short_question="Sleep worsens RT?",
+         color="red", header_variant="red",
+         dist="t", tail="right", xb=285.0, mu0=270.0, sd=40.0, n=25,
+         intro=(f'A sleep researcher studies the effect of 24-hour sleep deprivation. '
+                f'Normal reaction time for adults averages {hl("270 ms")}. '
+                f'After keeping {hl("n = 25 volunteers")} awake for 24 hours, '
+                f'mean reaction time = {hl("285 ms")} (s = 40 ms). '
+                f'Does sleep deprivation significantly worsen (increase) reaction time?'),
+         h0="μ ≤ 270 ms (no worsening)", h1="μ > 270 ms (reaction time worsened)",
+         h0_short="μ ≤ 270", h1_short="μ > 270",
+         hyp_note="n=25, σ unknown",
+         why=("Small Sample Note", "gold",
+              'With only n = 25, the Central Limit Theorem gives weaker assurance. '
+              'The t-distribution with df = {df} has heavier tails, appropriately accounting for '
+              'greater uncertainty with small samples.'),
+         verdict=("Real-World Interpretation: ", "green",
+                  "The 15 ms increase in reaction time is statistically significant. Sleep deprivation measurably impairs response time — consistent with extensive neuroscience literature. A 15 ms delay can be safety-critical in driving or surgery.",
+                  "The 15 ms increase is not statistically significant at this level with n = 25. A larger sample is likely needed — the small n gives low power to detect modest effects."),
+         plot_title="Sleep Study: Reaction Time Test"),
+
+    dict(cid=5, label="🌾 Case 5 — Fertiliser Yield (Agriculture)",
+         icon="🌾", title="Agriculture: Fertiliser Yield Test",
+         domain="🌱 Agricultural Research", question="Does the new fertiliser increase crop yield?",
+         short_domain="Agriculture", short_question="Fertiliser increases yield?",
+         color="green", header_variant="green",
+         dist="z", tail="right", xb=52.8, mu0=50.0, sd=7.5, n=36,
+         intro=(f'An agricultural research station tests a new nitrogen-rich fertiliser. '
+                f'The standard variety yields {hl("50 kg/plot")} on average (σ = 7.5 kg, known from historical records). '
+                f'Testing on {hl("n = 36 plots")} with the new fertiliser gives mean = {hl("52.8 kg/plot")}. '
+                f'Is this a genuine improvement?'),
+         h0="μ ≤ 50 kg (no improvement)", h1="μ > 50 kg (yield improved)",
+         h0_short="μ ≤ 50", h1_short="μ > 50",
+         hyp_note="σ known from records",
+         why=("Practical Significance", "green",
+              'Statistical significance alone is not enough. A 2.8 kg increase per plot '
+              'across thousands of hectares represents significant commercial value. '
+              'But if the new fertiliser costs much more, the farmer must weigh '
+              'statistical vs <em>economic</em> significance.'),
+         verdict=("Statistical vs Economic Significance: ", "blue",
+                  'Statistical significance tells you the effect is real. Economic significance tells you '
+                  'if it is big enough to matter. A 2.8 kg/plot increase is statistically significant, '
+                  'but the farmer must also ask: does the cost of the new fertiliser justify this gain?',
+                  None),
+         plot_title="Crop Yield: Fertiliser Test"),
+
+    dict(cid=6, label="📞 Case 6 — Call Centre (Operations)",
+         icon="📞", title="Operations: Call Centre Response Time",
+         domain="🏢 Operations Management", question="Has average call handling time changed?",
+         short_domain="Operations", short_question="Call time changed?",
+         color="blue", header_variant="blue",
+         dist="t", tail="two", xb=4.6, mu0=5.0, sd=1.8, n=81,
+         intro=(f'A telecom company sets a target call handling time of {hl("5.0 minutes")}. '
+                f'After a new CRM software rollout, {hl("n = 81 calls")} are monitored: '
+                f'mean = {hl("4.6 min")}, s = 1.8 min. '
+                f'Has the average handling time changed (either direction — faster or slower)?'),
+         h0="μ = 5.0 min (time unchanged)", h1="μ ≠ 5.0 min (time changed)",
+         h0_short="μ = 5.0", h1_short="μ ≠ 5.0",
+         hyp_note="could be faster or slower",
+         why=("Management Implication", "gold",
+              'A significant <em>decrease</em> in time could mean improved efficiency OR '
+              'rushed service (quality risk). A significant <em>increase</em> means bottlenecks. '
+              'Either direction matters — hence two-tailed. The direction of the result '
+              'guides the management response.'),
+         verdict=("Real-World Interpretation: ", "green",
+                  "The 0.4-minute reduction in handling time is statistically significant. The CRM software measurably changed call handling. Management should now investigate whether this reflects genuine efficiency gains or compromised service quality.",
+                  "The 0.4-minute reduction is not statistically significant. The new CRM has not measurably changed average call time — observed differences are within normal random variation."),
+         plot_title="Call Centre: Handling Time Test"),
+]
+
+
+CaseResult = namedtuple("CaseResult", "se stat df crit pv rej")
+
+def _solve(case, alpha):
+    """SE, statistic, critical value and p-value for one case at one α."""
+    se   = case["sd"] / np.sqrt(case["n"])
+    stat = (case["xb"] - case["mu0"]) / se
+    df   = case["n"] - 1 if case["dist"] == "t" else None
+    tail = case["tail"]
+    crit = float(critical(alpha, tail, df))
+    pv   = float(p_value(stat, tail, df))
+    return CaseResult(se, stat, df, crit, pv, bool(reject(stat, crit, tail)))
+
+CASE_RESULTS = {(c["cid"], a): _solve(c, a) for c in CASES for a in ALPHAS}
 
-    ssteps = [
-        ("Set hypotheses", f'H₀: μ ≥ 140 &nbsp;|&nbsp; H₁: μ < 140 → {bdg("Left-Tailed","red")}'),
-        ("Compute SE",     fml(f'SE = {sigma}/√{n} = {se:.4f} mmHg')),
-        ("Compute z",      fml(f'z = ({xb} − {mu0}) / {se:.4f} = {hl(f"{z:.4f}")}')),
-        ("Find z_crit",    txt_s(f'Left-tail α={alpha}: z_crit = {hl(f"{zc:.3f}")}')),
-        ("Decision",       _result_badge(rej) + txt_s(f' — z = {z:.4f} vs z_crit = {zc:.3f}') +
-                           p(f'p-value = {pv:.4f} {"< α → Statistically significant drug effect" if pv < alpha else "> α → Insufficient evidence"}')),
-    ]
-    render_ib(
-        f'<span style="color:#FFD700;-webkit-text-fill-color:#FFD700;font-weight:600">Step-by-Step Solution:</span>'
-        f'<div style="margin-top:10px">{steps_html(ssteps)}</div>', "gold"
-    )
-    render_ib(
-        f'<span style="color:#28a745;-webkit-text-fill-color:#28a745;font-weight:600">Real-World Interpretation: </span>'
-        + txt_s(f'{"The drug shows a statistically significant reduction in blood pressure at the chosen significance level. The FDA would require additional trials, but this is a promising result." if rej else "The reduction in mean blood pressure (1.5 mmHg) is not statistically significant at the chosen level — it could easily be due to random sampling variation. More subjects or a larger dose may be needed."}'),
-        "green"
-    )
-    fig = _plot_test(z, alpha, "left", f"Drug Trial: BP Reduction Test | α={alpha}")
-    st.pyplot(fig, use_container_width=True); plt.close(fig)
-
-
-def _case_exam_scores(alpha):
-    """Case 2 — Education: Did new teaching method improve scores?"""
-    xb, mu0, s, n = 72.4, 68.0, 14.0, 49
-    se = s / np.sqrt(n)
-    t  = (xb - mu0) / se
-    df = n - 1
-    tc = stats.t.ppf(1 - alpha, df)   # right-tailed
-    pv = 1 - stats.t.cdf(t, df)
-    rej = t > tc
-
-    render_card("📚 Case 2 — Education: New Teaching Method Test",
-        ib(_case_header("2", "🏫 Education Research", "Did the new teaching method improve exam scores?",
-                         "Right-Tailed t-test", "gold"),
-           "gold") +
-        p(f'A university introduces a {hl("flipped classroom")} teaching method. '
-          f'Historically, the average exam score was {hl("68 marks")} (out of 100). '
-          f'A sample of {hl("n = 49 students")} taught with the new method scored a mean of {hl("72.4")} '
-          f'(sample std dev = 14.0). Did the new method improve scores?') +
-        two_col(
-            ib(f'<span style="color:#ADD8E6;-webkit-text-fill-color:#ADD8E6;font-weight:600">Hypotheses</span><br>'
-               + p(f'{lb_t("<strong>H₀:</strong>")} μ ≤ 68 (no improvement or worse)'
-                   f'<br>{lb_t("<strong>H₁:</strong>")} μ > 68 (scores improved)'
-                   f'<br>{bdg("Right-Tailed t-test", "gold")} — σ unknown, use t-distribution'), "blue"),
-            ib(f'<span style="color:#FFD700;-webkit-text-fill-color:#FFD700;font-weight:600">Why t-test?</span><br>'
-               + p('Population σ is unknown — we only have the sample std dev s. '
-                   'The t-distribution has heavier tails than normal, making it harder to reject H₀, '
-                   f'which is appropriate. With df = {df} and large n, t ≈ z.'), "gold"),
-        ) +
-        fml(f'SE     = s/√n = {s}/√{n} = {se:.4f}\n'
-            f't      = (x̄ − μ₀)/SE = ({xb} − {mu0})/{se:.4f} = {hl(f"{t:.4f}")}\n'
-            f'df     = n−1 = {df}\n'
-            f't_crit (α={alpha}, df={df}, right) = {hl(f"{tc:.3f}")}\n'
-            f'p-value = P(T > {t:.4f}) = {hl(f"{pv:.4f}")}')
-    )
 
-    metric_row([
-        ("t-statistic", f"{t:.4f}", None),
-        (f"t-critical (df={df}, α={alpha})", f"{tc:.3f}", None),
-        ("p-value", f"{pv:.4f}", None),
-        ("Decision", "REJECT H₀ 🔴" if rej else "FAIL TO REJECT 🟢", None),
-    ])
+# ═══════════════════════════════════════════════════════════
+# CASE RENDERER
+# ═══════════════════════════════════════════════════════════
 
-    render_ib(
-        f'<span style="color:#28a745;-webkit-text-fill-color:#28a745;font-weight:600">Real-World Interpretation: </span>'
-        + txt_s(f'{"The improvement of 4.4 marks is statistically significant — the flipped classroom method genuinely raised scores. The university should consider adopting it widely." if rej else "The 4.4-mark improvement is not statistically significant at this level — it could reflect sampling variation. The university should test with a larger cohort before adopting the method."}'),
-        "green"
-    )
-    fig = _plot_test(t, alpha, "right", f"Teaching Method: Score Improvement Test | α={alpha}, df={df}")
-    st.pyplot(fig, use_container_width=True); plt.close(fig)
-
-
-def _case_factory_weight(alpha):
-    """Case 3 — Manufacturing: Quality control on cereal box weight"""
-    xb, mu0, sigma, n = 499.1, 500.0, 4.0, 100
-    se = sigma / np.sqrt(n)
-    z  = (xb - mu0) / se
-    zc = stats.norm.ppf(1 - alpha / 2)   # two-tailed
-    pv = 2 * (1 - stats.norm.cdf(abs(z)))
-    rej = abs(z) > zc
-
-    render_card("🏭 Case 3 — Manufacturing: Cereal Box Weight QC",
-        ib(_case_header("3", "⚙ Quality Control", "Is the filling machine still calibrated correctly?",
-                         "Two-Tailed z-test", "blue"),
-           "blue") +
-        p(f'A cereal factory calibrates its filling machine to {hl("500g per box")} (σ = 4g). '
-          f'A quality inspector samples {hl("n = 100 boxes")} and finds a mean weight of {hl("499.1g")}. '
-          f'Is the machine out of calibration — in either direction?') +
+_CASE_BY_ID = {c["cid"]: c for c in CASES}
+_CASE_BY_LABEL = {c["label"]: c for c in CASES}
+
+def _case_result(case, alpha):
+    return CASE_RESULTS.get((case["cid"], alpha)) or _solve(case, alpha)
+
+
+@cached("cases")
+def _case_fragments(cid, alpha):
+    """Card, step-by-step and verdict HTML for one case at one α (steps may be None)."""
+    case = _CASE_BY_ID[cid]
+    r = _case_result(case, alpha)
+    d, tail = case["dist"], case["tail"]
+    sd_sym  = "σ" if d == "z" else "s"
+    sgn     = "±" if tail == "two" else ""
+    df_txt  = f", df={r.df}" if d == "t" else ""
+    test    = f'{_TAIL_NAME[tail]} {d}-test'
+
+    if tail == "two":
+        crit_line = f'{d}_crit (α/2 = {alpha/2:.3f}{df_txt}) = ±{hl(f"{r.crit:.3f}")}'
+        p_line    = f'2×P({d.upper()} > |{r.stat:.4f}|)'
+    else:
+        crit_line = f'{d}_crit (α={alpha}{df_txt}, {tail}) = {hl(f"{r.crit:.3f}")}'
+        p_line    = f'P({d.upper()} {"<" if tail == "left" else ">"} {r.stat:.4f})'
+    formula = (f'SE     = {sd_sym}/√n = {case["sd"]}/√{case["n"]} = {r.se:.4f}\n'
+               f'{d}      = (x̄ − μ₀)/SE = ({case["xb"]} − {case["mu0"]})/{r.se:.4f} = {hl(f"{r.stat:.4f}")}\n'
+               + (f'df     = n−1 = {r.df}\n' if d == "t" else "")
+               + f'{crit_line}\n'
+               f'p-value = {p_line} = {hl(f"{r.pv:.4f}")}')
+
+    why_title, why_var, why_txt = case["why"]
+    why_col = S["gold"] if why_var == "gold" else S["grn"]
+    card = card_html(f'{case["icon"]} Case {case["cid"]} — {case["title"]}',
+        ib(_case_header(str(case["cid"]), case["domain"], case["question"], test, case["color"]),
+           case["header_variant"]) +
+        p(case["intro"]) +
         two_col(
             ib(f'<span style="color:#ADD8E6;-webkit-text-fill-color:#ADD8E6;font-weight:600">Hypotheses</span><br>'
-               + p(f'{lb_t("<strong>H₀:</strong>")} μ = 500g (machine correctly calibrated)'
-                   f'<br>{lb_t("<strong>H₁:</strong>")} μ ≠ 500g (machine drifted — either direction)'
-                   f'<br>{bdg("Two-Tailed Test", "blue")} — drift could be over- or under-filling'), "blue"),
-            ib(f'<span style="color:#FFD700;-webkit-text-fill-color:#FFD700;font-weight:600">Why two-tailed?</span><br>'
-               + p('The inspector does not predict which direction the machine drifted. '
-                   'Under-filling cheats consumers (legal risk). Over-filling wastes product (cost risk). '
-                   'Both matter equally — so α is split across both tails.'), "gold"),
+               + p(f'{lb_t("<strong>H₀:</strong>")} {case["h0"]}'
+                   f'<br>{lb_t("<strong>H₁:</strong>")} {case["h1"]}'
+                   f'<br>{bdg(test, case["color"])} — {case["hyp_note"]}'), "blue"),
+            ib(f'<span style="color:{why_col};-webkit-text-fill-color:{why_col};font-weight:600">{why_title}</span><br>'
+               + p(why_txt.format(df=r.df)), why_var),
         ) +
-        fml(f'SE     = σ/√n = {sigma}/√{n} = {se:.4f}\n'
-            f'z      = ({xb} − {mu0})/{se:.4f} = {hl(f"{z:.4f}")}\n'
-            f'z_crit (α/2 = {alpha/2:.3f}) = ±{hl(f"{zc:.3f}")}\n'
-            f'p-value = 2×P(Z > |{z:.4f}|) = {hl(f"{pv:.4f}")}')
+        fml(formula)
     )
 
-    metric_row([
-        ("z-statistic", f"{z:.4f}", None),
-        (f"z-critical (±, α={alpha})", f"±{zc:.3f}", None),
-        ("p-value", f"{pv:.4f}", None),
-        ("Decision", "REJECT H₀ 🔴" if rej else "FAIL TO REJECT 🟢", None),
-    ])
+    steps = None
+    if "steps" in case:
+        stp = case["steps"]
+        ssteps = [
+            ("Set hypotheses", f'H₀: {case["h0_short"]} &nbsp;|&nbsp; H₁: {case["h1_short"]} → '
+                               f'{bdg(_TAIL_NAME[tail], case["color"])}'),
+            ("Compute SE",     fml(f'SE = {case["sd"]}/√{case["n"]} = {r.se:.4f} {stp["unit"]}')),
+            (f"Compute {d}",   fml(f'{d} = ({case["xb"]} − {case["mu0"]}) / {r.se:.4f} = {hl(f"{r.stat:.4f}")}')),
+            (f"Find {d}_crit", txt_s(f'{_TAIL_NAME[tail]} α={alpha}: {d}_crit = {sgn}') + hl(f"{r.crit:.3f}")),
+            ("Decision",       _result_badge(r.rej) + txt_s(f' — {d} = {r.stat:.4f} vs {d}_crit = {sgn}{r.crit:.3f}') +
+                               p(f'p-value = {r.pv:.4f} {"< α → " + stp["signif"] if r.pv < alpha else "> α → Insufficient evidence"}')),
+        ]
+        steps = ib(
+            f'<span style="color:#FFD700;-webkit-text-fill-color:#FFD700;font-weight:600">Step-by-Step Solution:</span>'
+            f'<div style="margin-top:10px">{steps_html(ssteps)}</div>', "gold"
+        )
 
-    render_ib(
-        f'<span style="color:#28a745;-webkit-text-fill-color:#28a745;font-weight:600">Real-World Interpretation: </span>'
-        + txt_s(f'{"The weight deviation is statistically significant — the machine has drifted and needs recalibration. The under-fill of 0.9g may seem small, but across millions of boxes this represents significant material loss or regulatory risk." if rej else "The 0.9g under-fill is within normal sampling variation at this significance level. No immediate recalibration is required, but the inspector should increase monitoring frequency."}'),
-        "green"
-    )
-    fig = _plot_test(z, alpha, "two", f"QC: Box Weight Calibration Test | α={alpha}")
-    st.pyplot(fig, use_container_width=True); plt.close(fig)
-
-
-def _case_sleep_study(alpha):
-    """Case 4 — Psychology: Sleep deprivation and reaction time"""
-    xb, mu0, s, n = 285.0, 270.0, 40.0, 25
-    se = s / np.sqrt(n)
-    t  = (xb - mu0) / se
-    df = n - 1
-    tc = stats.t.ppf(1 - alpha, df)   # right-tailed (we predict increase)
-    pv = 1 - stats.t.cdf(t, df)
-    rej = t > tc
-
-    render_card("🧠 Case 4 — Psychology: Sleep Deprivation & Reaction Time",
-        ib(_case_header("4", "🧬 Behavioural Science", "Does sleep deprivation worsen reaction time?",
-                         "Right-Tailed t-test", "red"),
-           "red") +
-        p(f'A sleep researcher studies the effect of 24-hour sleep deprivation. '
-          f'Normal reaction time for adults averages {hl("270 ms")}. '
-          f'After keeping {hl("n = 25 volunteers")} awake for 24 hours, '
-          f'mean reaction time = {hl("285 ms")} (s = 40 ms). '
-          f'Does sleep deprivation significantly worsen (increase) reaction time?') +
-        two_col(
-            ib(f'<span style="color:#ADD8E6;-webkit-text-fill-color:#ADD8E6;font-weight:600">Hypotheses</span><br>'
-               + p(f'{lb_t("<strong>H₀:</strong>")} μ ≤ 270 ms (no worsening)'
-                   f'<br>{lb_t("<strong>H₁:</strong>")} μ > 270 ms (reaction time worsened)'
-                   f'<br>{bdg("Right-Tailed t-test", "red")} — n=25, σ unknown'), "blue"),
-            ib(f'<span style="color:#FFD700;-webkit-text-fill-color:#FFD700;font-weight:600">Small Sample Note</span><br>'
-               + p(f'With only n = 25, the Central Limit Theorem gives weaker assurance. '
-                   f'The t-distribution with df = {df} has heavier tails, appropriately accounting for '
-                   f'greater uncertainty with small samples.'), "gold"),
-        ) +
-        fml(f'SE     = s/√n = {s}/√{n} = {se:.4f}\n'
-            f't      = ({xb} − {mu0})/{se:.4f} = {hl(f"{t:.4f}")}\n'
-            f'df     = {df}\n'
-            f't_crit (α={alpha}, right) = {hl(f"{tc:.3f}")}\n'
-            f'p-value = {hl(f"{pv:.4f}")}')
+    v_title, v_var, v_rej, v_fail = case["verdict"]
+    v_col = S["grn"] if v_var == "green" else S["lb"]
+    verdict = ib(
+        f'<span style="color:{v_col};-webkit-text-fill-color:{v_col};font-weight:600">{v_title}</span>'
+        + txt_s(v_rej if (r.rej or v_fail is None) else v_fail),
+        v_var
     )
+    return card, steps, verdict
 
-    metric_row([
-        ("t-statistic", f"{t:.4f}", None),
-        (f"t-critical (df={df})", f"{tc:.3f}", None),
-        ("p-value", f"{pv:.4f}", None),
-        ("Decision", "REJECT H₀ 🔴" if rej else "FAIL TO REJECT 🟢", None),
-    ])
 
-    render_ib(
-        f'<span style="color:#28a745;-webkit-text-fill-color:#28a745;font-weight:600">Real-World Interpretation: </span>'
-        + txt_s(f'{"The 15 ms increase in reaction time is statistically significant. Sleep deprivation measurably impairs response time — consistent with extensive neuroscience literature. A 15 ms delay can be safety-critical in driving or surgery." if rej else "The 15 ms increase is not statistically significant at this level with n = 25. A larger sample is likely needed — the small n gives low power to detect modest effects."}'),
-        "green"
-    )
-    fig = _plot_test(t, alpha, "right", f"Sleep Study: Reaction Time Test | α={alpha}, df={df}")
-    st.pyplot(fig, use_container_width=True); plt.close(fig)
-
-
-def _case_crop_yield(alpha):
-    """Case 5 — Agriculture: New fertiliser crop yield"""
-    xb, mu0, sigma, n = 52.8, 50.0, 7.5, 36
-    se = sigma / np.sqrt(n)
-    z  = (xb - mu0) / se
-    zc = stats.norm.ppf(1 - alpha)   # right-tailed
-    pv = 1 - stats.norm.cdf(z)
-    rej = z > zc
-
-    render_card("🌾 Case 5 — Agriculture: Fertiliser Yield Test",
-        ib(_case_header("5", "🌱 Agricultural Research", "Does the new fertiliser increase crop yield?",
-                         "Right-Tailed z-test", "green"),
-           "green") +
-        p(f'An agricultural research station tests a new nitrogen-rich fertiliser. '
-          f'The standard variety yields {hl("50 kg/plot")} on average (σ = 7.5 kg, known from historical records). '
-          f'Testing on {hl("n = 36 plots")} with the new fertiliser gives mean = {hl("52.8 kg/plot")}. '
-          f'Is this a genuine improvement?') +
-        two_col(
-            ib(f'<span style="color:#ADD8E6;-webkit-text-fill-color:#ADD8E6;font-weight:600">Hypotheses</span><br>'
-               + p(f'{lb_t("<strong>H₀:</strong>")} μ ≤ 50 kg (no improvement)'
-                   f'<br>{lb_t("<strong>H₁:</strong>")} μ > 50 kg (yield improved)'
-                   f'<br>{bdg("Right-Tailed z-test", "green")} — σ known from records'), "blue"),
-            ib(f'<span style="color:#28a745;-webkit-text-fill-color:#28a745;font-weight:600">Practical Significance</span><br>'
-               + p('Statistical significance alone is not enough. A 2.8 kg increase per plot '
-                   'across thousands of hectares represents significant commercial value. '
-                   'But if the new fertiliser costs much more, the farmer must weigh '
-                   'statistical vs <em>economic</em> significance.'), "green"),
-        ) +
-        fml(f'SE     = σ/√n = {sigma}/√{n} = {se:.4f}\n'
-            f'z      = ({xb} − {mu0})/{se:.4f} = {hl(f"{z:.4f}")}\n'
-            f'z_crit (α={alpha}, right) = {hl(f"{zc:.3f}")}\n'
-            f'p-value = P(Z > {z:.4f}) = {hl(f"{pv:.4f}")}')
-    )
+def _render_case(case, alpha):
+    r = _case_result(case, alpha)
+    d, tail = case["dist"], case["tail"]
+    sgn     = "±" if tail == "two" else ""
+    df_txt  = f", df={r.df}" if d == "t" else ""
+    card, steps, verdict = _case_fragments(case["cid"], alpha)
 
+    st.html(card)
+    crit_lbl = (f"{d}-critical (±, α={alpha}{df_txt})" if tail == "two"
+                else f"{d}-critical (α={alpha}{df_txt})")
     metric_row([
-        ("z-statistic", f"{z:.4f}", None),
-        (f"z-critical (α={alpha})", f"{zc:.3f}", None),
-        ("p-value", f"{pv:.4f}", None),
-        ("Decision", "REJECT H₀ 🔴" if rej else "FAIL TO REJECT 🟢", None),
+        (f"{d}-statistic", f"{r.stat:.4f}", None),
+        (crit_lbl, f"{sgn}{r.crit:.3f}", None),
+        ("p-value", f"{r.pv:.4f}", None),
+        ("Decision", "REJECT H₀ 🔴" if r.rej else "FAIL TO REJECT 🟢", None),
     ])
+    if steps:
+        st.html(steps)
+    st.html(verdict)
+    _show_plot(r.stat, alpha, tail, f'{case["plot_title"]} | α={alpha}{df_txt}')
 
-    render_ib(
-        f'<span style="color:#ADD8E6;-webkit-text-fill-color:#ADD8E6;font-weight:600">Statistical vs Economic Significance: </span>'
-        + txt_s('Statistical significance tells you the effect is real. Economic significance tells you '
-                'if it is big enough to matter. A 2.8 kg/plot increase is statistically significant, '
-                'but the farmer must also ask: does the cost of the new fertiliser justify this gain?'),
-        "blue"
-    )
-    fig = _plot_test(z, alpha, "right", f"Crop Yield: Fertiliser Test | α={alpha}")
-    st.pyplot(fig, use_container_width=True); plt.close(fig)
-
-
-def _case_call_centre(alpha):
-    """Case 6 — Operations: Call centre response time"""
-    xb, mu0, s, n = 4.6, 5.0, 1.8, 81
-    se = s / np.sqrt(n)
-    t  = (xb - mu0) / se
-    df = n - 1
-    tc_two = stats.t.ppf(1 - alpha / 2, df)
-    pv = 2 * (1 - stats.t.cdf(abs(t), df))
-    rej = abs(t) > tc_two
-
-    render_card("📞 Case 6 — Operations: Call Centre Response Time",
-        ib(_case_header("6", "🏢 Operations Management", "Has average call handling time changed?",
-                         "Two-Tailed t-test", "blue"),
-           "blue") +
-        p(f'A telecom company sets a target call handling time of {hl("5.0 minutes")}. '
-          f'After a new CRM software rollout, {hl("n = 81 calls")} are monitored: '
-          f'mean = {hl("4.6 min")}, s = 1.8 min. '
-          f'Has the average handling time changed (either direction — faster or slower)?') +
-        two_col(
-            ib(f'<span style="color:#ADD8E6;-webkit-text-fill-color:#ADD8E6;font-weight:600">Hypotheses</span><br>'
-               + p(f'{lb_t("<strong>H₀:</strong>")} μ = 5.0 min (time unchanged)'
-                   f'<br>{lb_t("<strong>H₁:</strong>")} μ ≠ 5.0 min (time changed)'
-                   f'<br>{bdg("Two-Tailed t-test", "blue")} — could be faster or slower'), "blue"),
-            ib(f'<span style="color:#FFD700;-webkit-text-fill-color:#FFD700;font-weight:600">Management Implication</span><br>'
-               + p('A significant <em>decrease</em> in time could mean improved efficiency OR '
-                   'rushed service (quality risk). A significant <em>increase</em> means bottlenecks. '
-                   'Either direction matters — hence two-tailed. The direction of the result '
-                   'guides the management response.'), "gold"),
-        ) +
-        fml(f'SE     = s/√n = {s}/√{n} = {se:.4f}\n'
-            f't      = ({xb} − {mu0})/{se:.4f} = {hl(f"{t:.4f}")}\n'
-            f'df     = {df}\n'
-            f't_crit (α/2={alpha/2:.3f}, df={df}) = ±{hl(f"{tc_two:.3f}")}\n'
-            f'p-value = 2×P(T > |{t:.4f}|) = {hl(f"{pv:.4f}")}')
+
+@st.fragment
+def _case_explorer():
+    """α + case selector and the selected case — reruns on its own."""
+    col1, _ = st.columns([1, 2])
+    alpha = col1.select_slider(
+        "Significance Level α (applies to all cases)",
+        options=ALPHAS, value=0.05, key="nf_alpha"
     )
+    case = st.radio("Select Case Study", list(_CASE_BY_LABEL), horizontal=True, key="nf_case")
 
-    metric_row([
-        ("t-statistic", f"{t:.4f}", None),
-        (f"t-critical (±, df={df})", f"±{tc_two:.3f}", None),
-        ("p-value", f"{pv:.4f}", None),
-        ("Decision", "REJECT H₀ 🔴" if rej else "FAIL TO REJECT 🟢", None),
-    ])
+    st.markdown("---")
 
-    render_ib(
-        f'<span style="color:#28a745;-webkit-text-fill-color:#28a745;font-weight:600">Real-World Interpretation: </span>'
-        + txt_s(f'{"The 0.4-minute reduction in handling time is statistically significant. The CRM software measurably changed call handling. Management should now investigate whether this reflects genuine efficiency gains or compromised service quality." if rej else "The 0.4-minute reduction is not statistically significant. The new CRM has not measurably changed average call time — observed differences are within normal random variation."}'),
-        "green"
-    )
-    fig = _plot_test(t, alpha, "two", f"Call Centre: Handling Time Test | α={alpha}, df={df}")
-    st.pyplot(fig, use_container_width=True); plt.close(fig)
+    _render_case(_CASE_BY_LABEL[case], alpha)
 
 
 # ═══════════════════════════════════════════════════════════
@@ -388,46 +349,19 @@ def tab_non_finance():
         )
     )
 
-    # Global alpha selector
-    col1, _ = st.columns([1, 2])
-    alpha = col1.select_slider(
-        "Significance Level α (applies to all cases)",
-        options=[0.10, 0.05, 0.025, 0.01], value=0.05, key="nf_alpha"
-    )
-
     # Overview table
     section_heading("📋 Case Study Overview")
     st.html(table_html(
         ["#", "Domain", "Question", "Test Type", "H₀", "H₁"],
         [
-            [bdg("1","red"),    txt_s("Medicine"),      txt_s("Drug lowers BP?"),           bdg("Left z","red"),     txt_s("μ ≥ 140"),  txt_s("μ < 140")],
-            [bdg("2","gold"),   txt_s("Education"),     txt_s("Teaching method improves?"), bdg("Right t","gold"),   txt_s("μ ≤ 68"),   txt_s("μ > 68")],
-            [bdg("3","blue"),   txt_s("Manufacturing"), txt_s("Machine calibrated?"),       bdg("Two-tail z","blue"),txt_s("μ = 500g"), txt_s("μ ≠ 500g")],
-            [bdg("4","red"),    txt_s("Psychology"),    txt_s("Sleep worsens RT?"),         bdg("Right t","red"),    txt_s("μ ≤ 270"),  txt_s("μ > 270")],
-            [bdg("5","green"),  txt_s("Agriculture"),   txt_s("Fertiliser increases yield?"),bdg("Right z","green"), txt_s("μ ≤ 50"),   txt_s("μ > 50")],
-            [bdg("6","blue"),   txt_s("Operations"),    txt_s("Call time changed?"),        bdg("Two-tail t","blue"),txt_s("μ = 5.0"),  txt_s("μ ≠ 5.0")],
+            [bdg(str(c["cid"]), c["color"]), txt_s(c["short_domain"]), txt_s(c["short_question"]),
+             bdg(f'{_TAIL_SHORT[c["tail"]]} {c["dist"]}', c["color"]),
+             txt_s(c["h0_short"]), txt_s(c["h1_short"])]
+            for c in CASES
         ]
     ))
 
-    # Case selector
-    cases = [
-        "💊 Case 1 — Drug Trial (Medicine)",
-        "📚 Case 2 — Teaching Method (Education)",
-        "🏭 Case 3 — Factory QC (Manufacturing)",
-        "🧠 Case 4 — Sleep Study (Psychology)",
-        "🌾 Case 5 — Fertiliser Yield (Agriculture)",
-        "📞 Case 6 — Call Centre (Operations)",
-    ]
-    case = st.radio("Select Case Study", cases, horizontal=True, key="nf_case")
-
-    st.markdown("---")
-
-    if   "Case 1" in case: _case_drug_trial(alpha)
-    elif "Case 2" in case: _case_exam_scores(alpha)
-    elif "Case 3" in case: _case_factory_weight(alpha)
-    elif "Case 4" in case: _case_sleep_study(alpha)
-    elif "Case 5" in case: _case_crop_yield(alpha)
-    elif "Case 6" in case: _case_call_centre(alpha)
+    _case_explorer()
 
     # Cross-domain comparison
     section_heading("🔄 The Universal Pattern")
@@ -0,0 +1,229 @@
+"""
+tab_two_sample.py — Two-sample t-tests: fund vs benchmark (paired), strategy A vs B (pooled / Welch).
+A summary-statistics calculator plus a strategy screen that runs one test
+per strategy in a single vectorised call (two_sample.py).
+"""
+import streamlit as st
+import numpy as np
+
+from components import (
+    render_card, ib, render_ib, fml, bdg,
+    hl, vf, vr, lb_t, mut_t, txt_s, p,
+    steps_html, three_col,
+    metric_row, section_heading,
+)
+from tab_explainers import explainer_two_sample
+from tabs import _show_plot
+from cache import cached
+import result_store
+from data_grid import result_grid
+from two_sample import paired_t, pooled_t, welch_t, against_benchmark
+
+ALPHAS = [0.10, 0.05, 0.025, 0.01]
+
+METHOD_LABEL = {
+    "paired": "Paired (fund vs benchmark)",
+    "welch":  "Welch (unequal variances)",
+    "pooled": "Pooled (equal variances)",
+}
+_TAIL_LABEL = {"two": "Two-Tailed (μ₁ ≠ μ₂)", "right": "Right-Tailed (μ₁ > μ₂)", "left": "Left-Tailed (μ₁ < μ₂)"}
+_TAIL_SYM   = {"two": "≠", "right": ">", "left": "<"}
+
+# Monthly returns in % — a fund against its benchmark, or two unrelated strategies
+PAIRED_DEFAULTS = dict(n=36, mean_d=0.42, sd_d=1.10)
+INDEP_DEFAULTS  = dict(n1=36, mean1=1.35, sd1=3.8, n2=48, mean2=0.82, sd2=2.1)
+
+
+# ═══════════════════════════════════════════════════════════
+# STATIC SECTIONS
+# ═══════════════════════════════════════════════════════════
+@cached("html")
+def _intro_html():
+    return (
+        p(f'Most real questions compare {hl("two return series")} rather than one series against a '
+          f'fixed number: <em>"Did the fund beat its benchmark?"</em> or '
+          f'<em>"Does strategy A earn more than strategy B?"</em>') +
+        three_col(
+            ib(f'<span style="color:#FFD700;-webkit-text-fill-color:#FFD700;font-weight:600">Paired</span><br>'
+               + p('Same periods, matched observations. Test the mean of d = x − y.')
+               + fml('t = d̄ / (s_d/√n), df = n − 1'), "gold"),
+            ib(f'<span style="color:#ADD8E6;-webkit-text-fill-color:#ADD8E6;font-weight:600">Pooled</span><br>'
+               + p('Independent samples, equal variances assumed.')
+               + fml('s_p² = ((n₁−1)s₁² + (n₂−1)s₂²)/(n₁+n₂−2)\nt = (x̄₁ − x̄₂) / (s_p·√(1/n₁ + 1/n₂))'), "blue"),
+            ib(f'<span style="color:#28a745;-webkit-text-fill-color:#28a745;font-weight:600">Welch</span><br>'
+               + p('Independent samples, variances may differ — the safe default.')
+               + fml('t = (x̄₁ − x̄₂) / √(s₁²/n₁ + s₂²/n₂)\ndf = Welch–Satterthwaite'), "green"),
+        )
+    )
+
+
+# ═══════════════════════════════════════════════════════════
+# CALCULATOR
+# ═══════════════════════════════════════════════════════════
+def _solve(method, tail, alpha, v):
+    if method == "paired":
+        return paired_t(v["n"], v["mean_d"], v["sd_d"] ** 2, tail, alpha)
+    test = welch_t if method == "welch" else pooled_t
+    return test(v["n1"], v["mean1"], v["sd1"] ** 2, v["n2"], v["mean2"], v["sd2"] ** 2, tail, alpha)
+
+
+def _steps(method, tail, alpha, v, r):
+    crit = f"±{abs(r.crit):.3f}" if tail == "two" else f"{r.crit:.3f}"
+    if method == "paired":
+        se_line = f'SE = s_d/√n = {v["sd_d"]}/√{v["n"]} = {r.se:.4f}'
+        t_line  = f't  = d̄ / SE = {v["mean_d"]} / {r.se:.4f} = {hl(f"{r.t:.4f}")}'
+        df_line = f'df = n − 1 = {r.df:g}'
+    else:
+        if method == "welch":
+            se_line = (f'SE = √({v["sd1"]}²/{v["n1"]} + {v["sd2"]}²/{v["n2"]}) = {r.se:.4f}')
+            df_line = f'df = (s₁²/n₁ + s₂²/n₂)² / Σ (sᵢ²/nᵢ)²/(nᵢ−1) = {float(r.df):.2f}'
+        else:
+            se_line = f'SE = s_p·√(1/{v["n1"]} + 1/{v["n2"]}) = {r.se:.4f}'
+            df_line = f'df = n₁ + n₂ − 2 = {r.df:g}'
+        t_line = f't  = ({v["mean1"]} − {v["mean2"]}) / {r.se:.4f} = {hl(f"{r.t:.4f}")}'
+    p_txt = "2 × P(T > |t|)" if tail == "two" else f'P(T {_TAIL_SYM[tail]} t)'
+    return steps_html([
+        ("Hypotheses",     f'H₀: μ₁ − μ₂ = 0 | H₁: μ₁ − μ₂ {_TAIL_SYM[tail]} 0 → '
+                           f'{bdg(METHOD_LABEL[method].split(" (")[0] + " t-test", "blue")}'),
+        ("Standard error", fml(se_line)),
+        ("Test statistic", fml(f'{t_line}\n{df_line}')),
+        ("Critical value", txt_s(f'α = {alpha}, {tail}: t_crit = ') + hl(crit)),
+        ("Decision",       (vr("REJECT H₀") if r.reject else vf("FAIL TO REJECT H₀")) +
+                           txt_s(f' — p = {p_txt} = {float(r.p):.4f}')),
+    ])
+
+
+@st.fragment
+def _two_sample_calculator():
+    """Method, tail, α and summary statistics → result; reruns on its own."""
+    c1, c2, c3 = st.columns([1.2, 1.2, 1])
+    method = c1.radio("Test", list(METHOD_LABEL), format_func=METHOD_LABEL.get, key="ts_method")
+    tail   = c2.radio("Alternative", list(_TAIL_LABEL), format_func=_TAIL_LABEL.get, key="ts_tail")
+    alpha  = c3.select_slider("Significance Level α", options=ALPHAS, value=0.05, key="ts_alpha")
+
+    if method == "paired":
+        section_heading("Differences d = fund − benchmark (monthly %)")
+        a, b, c = st.columns(3)
+        v = dict(
+            n      = a.number_input("Months (n)",         value=PAIRED_DEFAULTS["n"],      min_value=2,    key="ts_n"),
+            mean_d = b.number_input("Mean difference d̄", value=PAIRED_DEFAULTS["mean_d"], step=0.01,      key="ts_md"),
+            sd_d   = c.number_input("Std dev of d (s_d)", value=PAIRED_DEFAULTS["sd_d"],   min_value=0.01, key="ts_sd"),
+        )
+    else:
+        a, b = st.columns(2)
+        with a:
+            section_heading("Strategy A (monthly %)")
+            n1    = st.number_input("n₁",       value=INDEP_DEFAULTS["n1"],    min_value=2,    key="ts_n1")
+            mean1 = st.number_input("Mean x̄₁", value=INDEP_DEFAULTS["mean1"], step=0.01,      key="ts_m1")
+            sd1   = st.number_input("Std dev s₁", value=INDEP_DEFAULTS["sd1"], min_value=0.01, key="ts_s1")
+        with b:
+            section_heading("Strategy B (monthly %)")
+            n2    = st.number_input("n₂",       value=INDEP_DEFAULTS["n2"],    min_value=2,    key="ts_n2")
+            mean2 = st.number_input("Mean x̄₂", value=INDEP_DEFAULTS["mean2"], step=0.01,      key="ts_m2")
+            sd2   = st.number_input("Std dev s₂", value=INDEP_DEFAULTS["sd2"], min_value=0.01, key="ts_s2")
+        v = dict(n1=n1, mean1=mean1, sd1=sd1, n2=n2, mean2=mean2, sd2=sd2)
+
+    r = _solve(method, tail, alpha, v)
+    crit = f"±{abs(r.crit):.3f}" if tail == "two" else f"{r.crit:.3f}"
+    metric_row([
+        ("t-statistic",              f"{r.t:.4f}", None),
+        (f"Critical (α={alpha})",    crit,         None),
+        ("df",                       f"{float(r.df):.2f}" if method == "welch" else f"{r.df:g}", None),
+        ("p-value",                  f"{float(r.p):.4f}", None),
+        ("Decision", "REJECT H₀ 🔴" if r.reject else "FAIL TO REJECT 🟢", None),
+    ])
+    render_ib(
+        f'<span style="color:#FFD700;-webkit-text-fill-color:#FFD700;font-weight:600">Step-by-Step:</span>'
+        f'<div style="margin-top:10px">{_steps(method, tail, alpha, v, r)}</div>',
+        "gold"
+    )
+
+    if method != "paired":
+        other = pooled_t if method == "welch" else welch_t
+        o = other(v["n1"], v["mean1"], v["sd1"] ** 2, v["n2"], v["mean2"], v["sd2"] ** 2, tail, alpha)
+        ratio = max(v["sd1"], v["sd2"]) ** 2 / min(v["sd1"], v["sd2"]) ** 2
+        render_ib(
+            f'<span style="color:#ADD8E6;-webkit-text-fill-color:#ADD8E6;font-weight:600">Pooled vs Welch:</span> '
+            + txt_s(f' variance ratio = {ratio:.2f}. The {"pooled" if method == "welch" else "Welch"} test gives '
+                    f't = {o.t:.4f}, df = {float(o.df):.1f}, p = {float(o.p):.4f}. ')
+            + mut_t('With a variance ratio well above 2 (or unequal n), trust Welch.'),
+            "blue"
+        )
+
+    _show_plot(float(r.t), alpha, tail,
+               f'{METHOD_LABEL[method]} | t={float(r.t):.3f}, df={float(r.df):.1f}, α={alpha}')
+
+
+# ═══════════════════════════════════════════════════════════
+# STRATEGY SCREEN
+# ═══════════════════════════════════════════════════════════
+def _simulated_returns(k, months, seed=7):
+    """Benchmark + k strategies (monthly %): most have zero true alpha, every tenth has +0.5%."""
+    rng   = np.random.default_rng(seed)
+    bench = rng.normal(0.8, 4.0, months)
+    alpha = np.where(np.arange(k) % 10 == 0, 0.5, 0.0)
+    beta  = rng.uniform(0.7, 1.3, k)
+    noise = rng.normal(0.0, 1.0, (months, k)) * rng.uniform(0.8, 3.0, k)
+    return bench, bench[:, None] * beta + alpha + noise, alpha > 0
+
+
+def _screen_summary(k, months, method):
+    """Hit counts and every strategy's result as columns — what the screen shows, and what the result store keeps."""
+    bench, R, true_alpha = _simulated_returns(k, months)
+    r = against_benchmark(R, bench, method=method, tail="right", alpha=0.05)
+    return dict(
+        hits=int(r.reject.sum()), true_hits=int((r.reject & true_alpha).sum()),
+        diff=r.diff, t=r.t, df=r.df, p=r.p, reject=r.reject, true_alpha=true_alpha,
+    )
+
+
+@st.fragment
+def _strategy_screen():
+    """Every strategy against the benchmark in one batched call."""
+    c1, c2, c3 = st.columns(3)
+    k      = c1.select_slider("Strategies", options=[50, 200, 1000, 5000], value=200, key="ts_k")
+    months = c2.select_slider("Months of history", options=[36, 60, 120, 240], value=60, key="ts_months")
+    method = c3.radio("Test", ["paired", "welch"], format_func=METHOD_LABEL.get, key="ts_screen_method")
+
+    r = result_store.get_or_compute(
+        "strategy_screen", dict(data="simulated", k=k, months=months, seed=7, method=method, rows="all"),
+        "right", 0.05, lambda: _screen_summary(k, months, method))
+
+    metric_row([
+        ("Strategies tested",          f"{k:,}",                           None),
+        ("Significant at 5%",          f"{r['hits']:,}",                   None),
+        ("…of which truly +alpha",     f"{r['true_hits']:,}",              None),
+        ("False discoveries",          f"{r['hits'] - r['true_hits']:,}",  None),
+    ])
+    result_grid({
+        "Strategy":           np.array([f"S{i:04d}" for i in range(k)]),
+        "Mean excess (%/mo)": np.asarray(r["diff"], dtype=float),
+        "t":                  np.asarray(r["t"], dtype=float),
+        "df":                 np.asarray(r["df"], dtype=float),
+        "p-value":            np.asarray(r["p"], dtype=float),
+        "Significant":        np.asarray(r["reject"], dtype=bool),
+        "True alpha":         np.asarray(r["true_alpha"], dtype=bool),
+    }, key="ts_grid", formats={"Mean excess (%/mo)": "%+.3f", "t": "%.3f", "df": "%.1f", "p-value": "%.2e"},
+       flags=("Significant", "True alpha"), search="Strategy", sort=("p-value", True), mark="Significant")
+    render_ib(
+        lb_t('<strong>Why paired wins here:</strong> ')
+        + txt_s('each strategy moves with the benchmark, so the month-by-month differences '
+                'strip out market noise. Welch treats the two series as unrelated and sees '
+                'the shared market swings as noise. ')
+        + mut_t(f'With {k:,} tests at α = 5%, about {0.05 * k:.0f} false positives are expected by chance.'),
+        "blue"
+    )
+
+
+# ═══════════════════════════════════════════════════════════
+# MAIN TAB
+# ═══════════════════════════════════════════════════════════
+def tab_two_sample():
+    render_card("⇄ Two-Sample Tests: Fund vs Benchmark, Strategy vs Strategy", _intro_html())
+    explainer_two_sample()
+
+    section_heading("🧮 Two-Sample Calculator")
+    _two_sample_calculator()
+
+    section_heading("⚡ Strategy Screen — every strategy vs the benchmark")
+    _strategy_screen()
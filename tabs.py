@@ -1,12 +1,13 @@
 """
 tabs.py — All six tab functions using st.html() with 100% inline styles.
 """
+import html
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+
 import streamlit as st
 import numpy as np
-import scipy.stats as stats
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
 
 from components import (
     render_card, ib, render_ib, fml, bdg,
@@ -19,16 +20,29 @@ from tab_explainers import (
     explainer_overview, explainer_one_tailed, explainer_two_tailed,
     explainer_comparison, explainer_finance, explainer_python,
 )
+from cache import cached
+from pvalues import critical, p_value, ppf, reject
+from variance_tests import event_variance_tests
+from rolling import rolling_t_test
+from dist_explorer import dist_explorer
+from figures import render_png, submit
+from code_runner import default_runner, enabled as code_runner_enabled
+from data_grid import result_grid
+from critical_grid import (
+    ALPHAS as CRIT_ALPHAS, DF_MAX, converged_df,
+    lookup as crit_lookup, warm as warm_critical_grid,
+)
 from charts import (
     normal_curve_overview, right_tailed_chart, left_tailed_chart,
-    two_tailed_chart, comparison_chart,
+    two_tailed_chart, comparison_chart, rolling_stat_chart, convergence_chart,
 )
 
 # ═══════════════════════════════════════════════════════════════════
 # TAB 1 — OVERVIEW
 # ═══════════════════════════════════════════════════════════════════
-def tab_overview():
-    render_card("📐 Foundation: What is Hypothesis Testing?",
+@cached("html")
+def _overview_foundation_html():
+    return (
         p("Hypothesis testing is a statistical decision framework using sample data to make "
           "inferences about population parameters. In finance: "
           "<em>\"Does this fund generate alpha?\"</em> or "
@@ -64,8 +78,10 @@ def tab_overview():
         )
     )
 
-    explainer_overview()
-    render_card("🗺 Decision Guide: Which Test?",
+
+@cached("html")
+def _overview_decision_html():
+    return (
         table_html(
             ["Research Question","H₁","Test","Critical Region"],
             [
@@ -76,22 +92,32 @@ def tab_overview():
         )
     )
 
-    render_card("🔢 Key Constants at a Glance",
-        p("The four anchor critical values that cover 90% of all finance hypothesis tests:")
-    )
-    metric_row([
-        ("One-Tail α=5%", "z = 1.645", None),
-        ("Two-Tail α=5%", "z = ±1.960", None),
-        ("One-Tail α=1%", "z = 2.326", None),
-        ("Two-Tail α=1%", "z = ±2.576", None),
-    ])
+
+OVERVIEW_CONSTANTS_INTRO = p("The four anchor critical values that cover 90% of all finance hypothesis tests:")
+OVERVIEW_CONSTANTS = [
+    ("One-Tail α=5%", "z = 1.645", None),
+    ("Two-Tail α=5%", "z = ±1.960", None),
+    ("One-Tail α=1%", "z = 2.326", None),
+    ("Two-Tail α=1%", "z = ±2.576", None),
+]
+
+
+def tab_overview():
+    render_card("📐 Foundation: What is Hypothesis Testing?", _overview_foundation_html())
+
+    explainer_overview()
+    render_card("🗺 Decision Guide: Which Test?", _overview_decision_html())
+
+    render_card("🔢 Key Constants at a Glance", OVERVIEW_CONSTANTS_INTRO)
+    metric_row(OVERVIEW_CONSTANTS)
 
 
 # ═══════════════════════════════════════════════════════════════════
 # TAB 2 — ONE-TAILED
 # ═══════════════════════════════════════════════════════════════════
-def tab_one_tailed():
-    render_card("→ One-Tailed Tests: Right-Tailed & Left-Tailed",
+@cached("html")
+def _one_tailed_intro_html(alpha=0.05):
+    return (
         p(f'Used when there is a {lb_t("<strong>directional hypothesis</strong>")}. '
           f'All α is concentrated in ONE tail, giving more power to detect effects in that direction.') +
         two_col(
@@ -99,19 +125,124 @@ def tab_one_tailed():
                + p(f'{lb_t("<strong>H₀:</strong>")} μ ≤ μ₀ &nbsp;|&nbsp; {lb_t("<strong>H₁:</strong>")} μ &gt; μ₀')
                + p(f'Reject H₀ if statistic in the {hl("RIGHT tail")}')
                + p(f'{gt("Finance use:")} Fund return exceeds benchmark?')
-               + right_tailed_chart()
+               + right_tailed_chart(alpha)
                + fml(f'z = (x̄ − μ₀) / (σ/√n)\nReject if z > z_α\nα=5%: z > {hl("+1.645")}\nα=1%: z > {hl("+2.326")}'),
                "gold"),
             ib(f'<div style="font-family:{FH};font-size:1.05rem;color:#dc3545;-webkit-text-fill-color:#dc3545;margin:0 0 7px 0">◀ Left-Tailed Test</div>'
                + p(f'{lb_t("<strong>H₀:</strong>")} μ ≥ μ₀ &nbsp;|&nbsp; {lb_t("<strong>H₁:</strong>")} μ &lt; μ₀')
                + p(f'Reject H₀ if statistic in the {rt2("LEFT tail")}')
                + p(f'{gt("Finance use:")} Portfolio losses worsened?')
-               + left_tailed_chart()
+               + left_tailed_chart(alpha)
                + fml(f'z = (x̄ − μ₀) / (σ/√n)\nReject if z < −z_α\nα=5%: z < {hl("−1.645")}\nα=1%: z < {hl("−2.326")}'),
                "red"),
         )
     )
 
+
+OT_ALPHAS   = [0.10, 0.05, 0.025, 0.01]
+OT_DEFAULTS = dict(x_bar=13.5, mu_0=12.0, sigma=6.0, n=36, alpha=0.05, tail="right")
+OT_FIELDS   = dict(
+    x_bar=dict(label="Sample Mean (x̄) %", step=0.1, min=None),
+    mu_0 =dict(label="Pop. Mean (μ₀) %",   step=0.1, min=None),
+    sigma=dict(label="Std Dev (σ) %",      step=0.1, min=0.1),
+    n    =dict(label="Sample Size (n)",    step=1,   min=1),
+)
+
+ROLL_WINDOWS, ROLL_MONTHS = [36, 60], 240
+# Monthly excess return over the market (%): (label, alpha before month 120, alpha after, tracking error)
+ROLL_FUNDS = [
+    ("Steady Alpha",   0.45, 0.45, 2.0),
+    ("Faded Alpha",    0.70, 0.00, 2.5),
+    ("Late Bloomer",   0.00, 0.60, 2.0),
+    ("Closet Tracker", 0.02, 0.02, 0.6),
+]
+
+
+def _fund_histories(k=len(ROLL_FUNDS), seed=5):
+    """ROLL_MONTHS × k excess returns: the named funds, then (for k > 4) random-skill peers."""
+    rng = np.random.default_rng(seed)
+    a1, a2, te = (np.array([f[i] for f in ROLL_FUNDS]) for i in (1, 2, 3))
+    if k > len(ROLL_FUNDS):
+        extra = k - len(ROLL_FUNDS)
+        a1 = np.r_[a1, rng.normal(0.0, 0.3, extra)]
+        a2 = np.r_[a2, rng.normal(0.0, 0.3, extra)]
+        te = np.r_[te, rng.uniform(0.5, 3.0, extra)]
+    half = ROLL_MONTHS // 2
+    mu = np.vstack([np.tile(a1, (half, 1)), np.tile(a2, (ROLL_MONTHS - half, 1))])
+    return mu + rng.standard_normal((ROLL_MONTHS, k)) * te
+
+
+def _rolling_alpha_test(alpha):
+    """Right-tailed alpha t-test on every trailing window; the named fund charted, the panel batched."""
+    c1, c2 = st.columns([1, 2])
+    window = c1.radio("Trailing window (months)", ROLL_WINDOWS, horizontal=True, key="roll_window")
+    fund   = c2.radio("Fund", range(len(ROLL_FUNDS)), format_func=lambda i: ROLL_FUNDS[i][0],
+                      horizontal=True, key="roll_fund")
+
+    X = _fund_histories()
+    r = rolling_t_test(X, window, mu0=0.0, tail="right", alpha=alpha)
+    st.html(rolling_stat_chart(r.t[:, fund], r.crit[:, fund], "right", "t",
+                               f"{ROLL_FUNDS[fund][0]} — rolling {window}-month alpha t-test (α={alpha})",
+                               x0=int(r.end[0])))
+
+    panel = _rolling_panel(window, alpha)
+    metric_row([
+        ("Latest t",                    f"{r.t[-1, fund]:.3f}",                 None),
+        (f"t_crit (df={window - 1})",   f"{r.crit[-1, fund]:.3f}",              None),
+        ("Windows rejecting H₀",        f"{r.reject[:, fund].mean():.0%}",      None),
+        ("Of 1,000 funds rejecting now", f"{panel.reject.mean():.0%}",          None),
+    ])
+    render_ib(
+        lb_t('<strong>How it stays fast:</strong> ')
+        + txt_s('each window\'s mean and variance come from differences of running sums of x and x², '
+                'so every window costs the same whatever its length. ')
+        + mut_t('One fund with skill in one decade can look like a genius or a fraud depending on the window you pick.'),
+        "blue"
+    )
+    section_heading(f"🗂 All 1,000 funds — latest {window}-month window")
+    _rolling_panel_grid(window, alpha)
+
+
+RollingPanel = namedtuple("RollingPanel", "mean t p reject share")
+ROLL_PANEL_FUNDS = 1000
+ROLL_PANEL_NAMES = np.array([f[0] for f in ROLL_FUNDS]
+                            + [f"Peer {i:04d}" for i in range(len(ROLL_FUNDS) + 1, ROLL_PANEL_FUNDS + 1)])
+
+
+@cached("cases")
+def _rolling_panel(window, alpha) -> RollingPanel:
+    """Latest-window test of every fund in the 1,000-fund panel, plus each fund's share of rejecting
+    windows — computed once per (window, α) per process and shared by the metrics and the grid."""
+    r = rolling_t_test(_fund_histories(ROLL_PANEL_FUNDS), window, mu0=0.0, tail="right", alpha=alpha)
+    panel = RollingPanel(r.mean[-1], r.t[-1], r.p[-1], r.reject[-1], r.reject.mean(axis=0))
+    for col in panel:
+        col.setflags(write=False)                  # shared across sessions
+    return panel
+
+
+@st.fragment
+def _rolling_panel_grid(window, alpha):
+    """Every fund of the panel in a paged grid; sorting or paging reruns only this fragment."""
+    panel = _rolling_panel(window, alpha)
+    result_grid({
+        "Fund":              ROLL_PANEL_NAMES,
+        "Alpha (%/mo)":      panel.mean,
+        "t":                 panel.t,
+        "p-value":           panel.p,
+        "Reject H₀":         panel.reject,
+        "Windows rejecting (%)": 100 * panel.share,
+    }, key="roll_grid", formats={"Alpha (%/mo)": "%+.3f", "t": "%.3f", "p-value": "%.2e",
+                                 "Windows rejecting (%)": "%.0f"},
+       flags=("Reject H₀",), search="Fund", sort=("t", False), mark="Reject H₀")
+
+
+@st.fragment
+def tab_one_tailed():
+    """The whole tab is one calculator: recording a decision reruns only this fragment."""
+    # Last recorded decision (or the defaults) — drives the diagrams and the server-side summary
+    rec = st.session_state.get("ot_explorer") or OT_DEFAULTS
+    render_card("→ One-Tailed Tests: Right-Tailed & Left-Tailed", _one_tailed_intro_html(rec["alpha"]))
+
     render_card("📊 Worked Example — Portfolio Alpha Test (Interactive)",
         ib(f'<span style="color:#FFD700;-webkit-text-fill-color:#FFD700;font-weight:600">Scenario:</span> '
            + txt_s(' A fund claims returns <em>greater than</em> the market return. '
@@ -120,33 +251,17 @@ def tab_one_tailed():
     )
 
     explainer_one_tailed()
-    c1, c2, c3, c4 = st.columns(4)
-    x_bar = c1.number_input("Sample Mean (x̄) %", value=13.5, step=0.1, key="ot_xb")
-    mu_0  = c2.number_input("Pop. Mean (μ₀) %",   value=12.0, step=0.1, key="ot_mu")
-    sigma = c3.number_input("Std Dev (σ) %", value=6.0, min_value=0.1, step=0.1, key="ot_sg")
-    n     = c4.number_input("Sample Size (n)", value=36, min_value=1, step=1, key="ot_n")
-
-    alpha_c = st.select_slider("Significance Level α", options=[0.10,0.05,0.025,0.01], value=0.05, key="ot_a")
-    tail_c  = st.radio("Test Direction",
-                       ["Right-Tailed (H₁: μ > μ₀)","Left-Tailed (H₁: μ < μ₀)"],
-                       horizontal=True, key="ot_t")
-    tail = "right" if "Right" in tail_c else "left"
+    dist_explorer("one", OT_DEFAULTS, OT_ALPHAS, key="ot_explorer",
+                  fields=OT_FIELDS, name="Portfolio Alpha Test")
+    _recorded_decision("ot_explorer")
 
-    se = sigma / np.sqrt(n)
-    z_stat = (x_bar - mu_0) / se
-    if tail == "right":
-        z_crit = stats.norm.ppf(1-alpha_c); p_val = 1-stats.norm.cdf(z_stat); rej = z_stat > z_crit
-    else:
-        z_crit = stats.norm.ppf(alpha_c);   p_val = stats.norm.cdf(z_stat);   rej = z_stat < z_crit
-
-    metric_row([
-        ("z-statistic",    f"{z_stat:.4f}", None),
-        ("Critical Value", f"{z_crit:.3f}", None),
-        ("p-value",        f"{p_val:.4f}",  None),
-        ("Decision", "REJECT H₀ 🔴" if rej else "FAIL TO REJECT 🟢", None),
-    ])
-    fig = _plot_test(z_stat, alpha_c, tail, f"One-Tailed ({tail}) | α={alpha_c}")
-    st.pyplot(fig, use_container_width=True); plt.close(fig)
+    render_card("📈 Rolling Alpha Test — Is the Skill Persistent?",
+        ib(f'<span style="color:#FFD700;-webkit-text-fill-color:#FFD700;font-weight:600">Scenario:</span> '
+           + txt_s(' The same right-tailed test (H₀: monthly alpha ≤ 0) run on every trailing window of a '
+                   '20-year track record. The red band is the critical value.'),
+           "gold")
+    )
+    _rolling_alpha_test(rec["alpha"])
 
     render_ib(
         f'<span style="color:#ADD8E6;-webkit-text-fill-color:#ADD8E6;font-weight:600">Key Insight:</span> '
@@ -159,12 +274,13 @@ def tab_one_tailed():
 # ═══════════════════════════════════════════════════════════════════
 # TAB 3 — TWO-TAILED
 # ═══════════════════════════════════════════════════════════════════
-def tab_two_tailed():
-    render_card("↔ Two-Tailed Test: Testing for Any Difference",
+@cached("html")
+def _two_tailed_intro_html(alpha=0.05):
+    return (
         p(f'Used for {lb_t("<strong>non-directional hypotheses</strong>")} — detecting a difference in '
           f'<em>either direction</em>. α is split equally (α/2 per tail), requiring more extreme '
           f'test statistics to reject H₀.') +
-        two_tailed_chart() +
+        two_tailed_chart(alpha) +
         fml(f'H₀: μ = μ₀  |  H₁: μ ≠ μ₀\n\nReject H₀ if |z| > z_{{α/2}}\n\n'
             f'α = 5%:  |z| > {hl("1.960")}\nα = 1%:  |z| > {hl("2.576")}\nα = 10%: |z| > {hl("1.645")}\n\n'
             f'p-value (two-tailed) = 2 × P(Z > |z|)') +
@@ -174,6 +290,23 @@ def tab_two_tailed():
            "blue")
     )
 
+
+TT_ALPHAS   = [0.10, 0.05, 0.025, 0.01]
+TT_DEFAULTS = dict(x_bar=47.5, mu_0=50.0, sigma=12.0, n=64, alpha=0.05, tail="two")
+TT_FIELDS   = dict(
+    x_bar=dict(label="Sample Mean (x̄)", step=0.5, min=None),
+    mu_0 =dict(label="Pop. Mean (μ₀)",   step=0.5, min=None),
+    sigma=dict(label="Std Dev (σ)",      step=0.5, min=0.1),
+    n    =dict(label="Sample Size (n)",  step=1,   min=1),
+)
+
+
+@st.fragment
+def tab_two_tailed():
+    """Fragment — recording a decision reruns only this tab."""
+    rec = st.session_state.get("tt_explorer") or TT_DEFAULTS
+    render_card("↔ Two-Tailed Test: Testing for Any Difference", _two_tailed_intro_html(rec["alpha"]))
+
     render_card("📊 Worked Example — VaR Change Test (Interactive)",
         ib(f'<span style="color:#FFD700;-webkit-text-fill-color:#FFD700;font-weight:600">Scenario:</span> '
            + txt_s(' Historical daily VaR = ₹50 Lakhs. After a system upgrade, 64 days show '
@@ -182,28 +315,13 @@ def tab_two_tailed():
     )
 
     explainer_two_tailed()
-    c1, c2, c3, c4 = st.columns(4)
-    x_bar = c1.number_input("Sample Mean (x̄)", value=47.5, step=0.5, key="tt_xb")
-    mu_0  = c2.number_input("Pop. Mean (μ₀)",   value=50.0, step=0.5, key="tt_mu")
-    sigma = c3.number_input("Std Dev (σ)",       value=12.0, min_value=0.1, step=0.5, key="tt_sg")
-    n     = c4.number_input("Sample Size (n)",   value=64,   min_value=1,   step=1,   key="tt_n")
+    dist_explorer("two", TT_DEFAULTS, TT_ALPHAS, key="tt_explorer",
+                  fields=TT_FIELDS, name="VaR Change Test")
+    _recorded_decision("tt_explorer")
 
-    alpha_c = st.select_slider("Significance Level α", options=[0.10,0.05,0.025,0.01], value=0.05, key="tt_a")
-
-    se     = sigma / np.sqrt(n)
-    z_stat = (x_bar - mu_0) / se
-    z_crit = stats.norm.ppf(1 - alpha_c/2)
-    p_val  = 2 * (1 - stats.norm.cdf(abs(z_stat)))
-    rej    = abs(z_stat) > z_crit
-
-    metric_row([
-        ("z-statistic",    f"{z_stat:.4f}",  None),
-        ("Critical Value", f"±{z_crit:.3f}", None),
-        ("p-value",        f"{p_val:.4f}",   None),
-        ("Decision", "REJECT H₀ 🔴" if rej else "FAIL TO REJECT 🟢", None),
-    ])
-    fig = _plot_test(z_stat, alpha_c, "two", f"Two-Tailed | α={alpha_c}")
-    st.pyplot(fig, use_container_width=True); plt.close(fig)
+    # Step-by-step for the recorded inputs
+    x_bar, mu_0, sigma, n, alpha_c = (rec[k] for k in ("x_bar", "mu_0", "sigma", "n", "alpha"))
+    se, z_stat, z_crit, p_val, rej = _solve_z(x_bar, mu_0, sigma, n, alpha_c, "two")
 
     ssteps = [
         ("Hypotheses",     f'H₀: μ = {mu_0} | H₁: μ ≠ {mu_0} → {bdg("Two-Tailed","blue")}'),
@@ -220,7 +338,7 @@ def tab_two_tailed():
         "gold"
     )
 
-    otc = stats.norm.ppf(alpha_c)
+    otc = _crit(alpha_c)
     render_ib(
         f'<span style="color:#dc3545;-webkit-text-fill-color:#dc3545;font-weight:600">⚠ Critical Insight:</span> '
         + txt_s(f' If we wrongly used a left-tailed test: z = {z_stat:.4f} vs z_crit = {otc:.4f}. '
@@ -233,9 +351,10 @@ def tab_two_tailed():
 # ═══════════════════════════════════════════════════════════════════
 # TAB 4 — COMPARISON
 # ═══════════════════════════════════════════════════════════════════
-def tab_comparison():
-    render_card("⚖ One-Tailed vs Two-Tailed: Complete Comparison",
-        comparison_chart() +
+@cached("html")
+def _comparison_table_html(alpha=0.05):
+    return (
+        comparison_chart(alpha) +
         table_html(
             ["Feature","One-Tailed","Two-Tailed"],
             [
@@ -251,8 +370,10 @@ def tab_comparison():
         )
     )
 
-    explainer_comparison()
-    render_card("🎯 Type I & Type II Errors",
+
+@cached("html")
+def _comparison_errors_html():
+    return (
         two_col(
             ib(f'<span style="color:#dc3545;-webkit-text-fill-color:#dc3545;font-weight:600">'
                f'Type I Error (α) — False Positive</span><br>'
@@ -273,81 +394,106 @@ def tab_comparison():
            "green")
     )
 
+
+CMP_ALPHAS = [0.10, 0.05, 0.025, 0.01, 0.005]
+
+
+def tab_comparison():
+    render_card("⚖ One-Tailed vs Two-Tailed: Complete Comparison", _comparison_table_html())
+
+    explainer_comparison()
+    render_card("🎯 Type I & Type II Errors", _comparison_errors_html())
+
     render_card("🔭 Critical Value Explorer",
-        p("Select α and test type to explore critical values and rejection regions dynamically.")
+        p("Select α and test type to explore critical values and rejection regions dynamically. "
+          f"Set the degrees of freedom (n − 1, up to {DF_MAX:,}) to read off the t critical value for your sample.")
     )
-    col1, col2 = st.columns(2)
-    alpha_e   = col1.select_slider("α", options=[0.10,0.05,0.025,0.01,0.005], value=0.05, key="cmp_a")
-    test_type = col2.radio("Test Type", ["One-Tailed","Two-Tailed"], horizontal=True, key="cmp_t")
-
-    if test_type == "One-Tailed":
-        zc = stats.norm.ppf(1-alpha_e)
-        tc30 = stats.t.ppf(1-alpha_e, 30); tc60 = stats.t.ppf(1-alpha_e, 60)
-        label = f"One-Tail (α={alpha_e})"; tail_p = "right"
-    else:
-        zc = stats.norm.ppf(1-alpha_e/2)
-        tc30 = stats.t.ppf(1-alpha_e/2, 30); tc60 = stats.t.ppf(1-alpha_e/2, 60)
-        label = f"Two-Tail (α={alpha_e})"; tail_p = "two"
+    _critical_value_explorer()
 
-    metric_row([
-        (f"z-critical ({label})", f"±{zc:.3f}", None),
-        ("t-critical (df=30)",    f"±{tc30:.3f}", None),
-        ("t-critical (df=60)",    f"±{tc60:.3f}", None),
-        ("t-critical (df=∞)",     f"±{zc:.3f}", None),
-    ])
-    fig2 = _plot_test(0, alpha_e, tail_p, f"Critical Region | {label}")
-    st.pyplot(fig2, use_container_width=True); plt.close(fig2)
+
+@st.fragment
+def _critical_value_explorer():
+    """Conventional-α explorer plus a lookup for any (α, df, tail), both on the shared critical_grid."""
+    warm_critical_grid()
+    df = int(st.number_input("Degrees of freedom (n − 1)", min_value=1, max_value=DF_MAX, value=11, step=1,
+                             key="cmp_df", help="e.g. 11 for a year of monthly returns"))
+    dist_explorer("explore", dict(alpha=0.05, tail="one"), CMP_ALPHAS, key="cmp_explorer", record=False,
+                  dfs=tuple(dict.fromkeys((df, 30, 60))))
+
+    section_heading("Any α, df and tail")
+    c1, c2 = st.columns([1, 2])
+    with c1:
+        alpha = st.number_input("α", min_value=0.0001, max_value=0.5, value=0.05, step=0.005,
+                                format="%.4f", key="cmp_any_a")
+        tail = st.radio("Tail", ["two", "right", "left"], horizontal=True, key="cmp_any_t")
+    t_c, z_c = crit_lookup(alpha, tail, df), crit_lookup(alpha, tail)
+    conv = converged_df(alpha, tail)
+    fmt_c = (lambda v: f"±{abs(v):.3f}") if tail == "two" else (lambda v: f"{v:+.3f}")
+    with c2:
+        metric_row([(f"t-critical (df={df:,})", fmt_c(t_c)), ("z-critical", fmt_c(z_c)),
+                    ("t vs z", f"{abs(t_c) / abs(z_c) - 1:+.1%}" if z_c else "—"),
+                    ("t ≈ z (1%) from", f"df = {conv:,}" if conv else f"> {DF_MAX:,}")])
+    st.html(convergence_chart(alpha, tail, df))
 
 
 # ═══════════════════════════════════════════════════════════════════
 # TAB 5 — FINANCE EXAMPLES
 # ═══════════════════════════════════════════════════════════════════
-def tab_finance_examples():
-    def ex_box(num, title, badge_txt, badge_var, h0, h1, note, variant):
-        return ib(
-            f'<div style="font-family:{FH};font-size:1.05rem;color:{S[badge_var if badge_var!="red" else "red"]};'
-            f'-webkit-text-fill-color:{S[badge_var if badge_var!="red" else "red"]};margin:0 0 6px 0">'
-            f'{num}. {title}</div>'
-            + bdg(badge_txt, badge_var)
-            + p(f'{lb_t("<strong>H₀:</strong>")} {h0} &nbsp;|&nbsp; {lb_t("<strong>H₁:</strong>")} {h1}')
-            + p(note),
-            variant
-        )
+def _ex_box(num, title, badge_txt, badge_var, h0, h1, note, variant):
+    return ib(
+        f'<div style="font-family:{FH};font-size:1.05rem;color:{S[badge_var if badge_var!="red" else "red"]};'
+        f'-webkit-text-fill-color:{S[badge_var if badge_var!="red" else "red"]};margin:0 0 6px 0">'
+        f'{num}. {title}</div>'
+        + bdg(badge_txt, badge_var)
+        + p(f'{lb_t("<strong>H₀:</strong>")} {h0} &nbsp;|&nbsp; {lb_t("<strong>H₁:</strong>")} {h1}')
+        + p(note),
+        variant
+    )
+
 
-    render_card("💹 Real-World Finance & Risk Applications",
+@cached("html")
+def _finance_examples_html():
+    return (
         two_col(
-            ex_box("1","Portfolio Alpha (Jensen's α)","Right-Tailed","gold","α ≤ 0","α &gt; 0","t = α_hat / SE(α_hat) from regression","gold"),
-            ex_box("2","CAPM Beta Neutrality","Two-Tailed","blue","β = 1","β ≠ 1","t = (β_hat − 1) / SE(β_hat)","blue"),
+            _ex_box("1","Portfolio Alpha (Jensen's α)","Right-Tailed","gold","α ≤ 0","α &gt; 0","t = α_hat / SE(α_hat) from regression","gold"),
+            _ex_box("2","CAPM Beta Neutrality","Two-Tailed","blue","β = 1","β ≠ 1","t = (β_hat − 1) / SE(β_hat)","blue"),
         ) +
         two_col(
-            ex_box("3","VaR Backtesting (Kupiec)","Right-Tailed","red","exceedance = 5%","&gt; 5%","Binomial test on number of VaR breaches","red"),
-            ex_box("4","Credit Default Rate","Right-Tailed","gold","default rate ≤ 2%","&gt; 2%","Monitor loan portfolio risk deterioration","gold"),
+            _ex_box("3","VaR Backtesting (Kupiec)","Right-Tailed","red","exceedance = 5%","&gt; 5%","Binomial test on number of VaR breaches","red"),
+            _ex_box("4","Credit Default Rate","Right-Tailed","gold","default rate ≤ 2%","&gt; 2%","Monitor loan portfolio risk deterioration","gold"),
         ) +
         two_col(
-            ex_box("5","Bond Portfolio Duration","Two-Tailed","blue","D = 7 yrs","D ≠ 7 yrs","Post-rebalancing duration shift check","blue"),
-            ex_box("6","Sharpe Ratio Test","Right-Tailed","gold","SR ≤ 0.5","SR &gt; 0.5","Jobson-Korkie test for risk-adjusted performance","gold"),
+            _ex_box("5","Bond Portfolio Duration","Two-Tailed","blue","D = 7 yrs","D ≠ 7 yrs","Post-rebalancing duration shift check","blue"),
+            _ex_box("6","Sharpe Ratio Test","Right-Tailed","gold","SR ≤ 0.5","SR &gt; 0.5","Jobson-Korkie test for risk-adjusted performance","gold"),
         )
     )
 
-    explainer_finance()
-    render_card("📋 Solved: Bond Portfolio Duration Test (t-test)",
-        ib(f'<span style="color:#FFD700;-webkit-text-fill-color:#FFD700;font-weight:600">Scenario:</span> '
-           + txt_s(' Target modified duration = 7 years. After restructuring, 49 bonds: '
-                   'mean = 7.84 yrs, s = 2.94 yrs. Has duration changed? α = 1%.'),
-           "gold")
-    )
+
+BOND_EXAMPLE_TITLE = "📋 Solved: Bond Portfolio Duration Test (t-test)"
+BOND_PLOT_TITLE    = "Bond Duration Test (t-distribution, df=48)"
+VOL_CHANGE_TITLE   = "🌪 Volatility Change Test — Has Market Risk Increased?"
+VOL_SIGMA0, VOL_EVENT, VOL_WINDOW = 1.2, 250, 60     # long-run daily σ (%), event day, days each side
+
+
+@cached("html")
+def _bond_duration_example():
+    """(scenario html, metrics, steps html, t_stat, α) — fixed inputs, solved once."""
+    scenario = ib(f'<span style="color:#FFD700;-webkit-text-fill-color:#FFD700;font-weight:600">Scenario:</span> '
+                  + txt_s(' Target modified duration = 7 years. After restructuring, 49 bonds: '
+                          'mean = 7.84 yrs, s = 2.94 yrs. Has duration changed? α = 1%.'),
+                  "gold")
 
     xb, mu, sb, nb, ab = 7.84, 7.0, 2.94, 49, 0.01
     se_b   = sb / np.sqrt(nb); t_stat = (xb-mu)/se_b; df = nb-1
-    t_crit = stats.t.ppf(1-ab/2, df); p_b = 2*(1-stats.t.cdf(abs(t_stat), df))
+    t_crit = float(critical(ab, "two", df)); p_b = float(p_value(t_stat, "two", df))
     rej_b  = abs(t_stat) > t_crit
 
-    metric_row([
+    metrics = [
         ("t-statistic",                  f"{t_stat:.4f}",  None),
         ("Critical Value (df=48, α=1%)", f"±{t_crit:.3f}", None),
         ("p-value",                      f"{p_b:.4f}",     None),
         ("Decision", "REJECT H₀ 🔴" if rej_b else "FAIL TO REJECT 🟢", None),
-    ])
+    ]
 
     ssteps = [
         ("Hypotheses",     f'H₀: μ = {mu} | H₁: μ ≠ {mu} → {bdg("Two-Tailed t-test","blue")}'),
@@ -355,23 +501,177 @@ def tab_finance_examples():
         ("Test statistic", fml(f't = ({xb} − {mu}) / ({sb}/√{nb})\n  = {xb-mu:.2f} / {se_b:.4f} = {hl(f"{t_stat:.4f}")}')),
         ("Decision",       (vr("REJECT H₀") if rej_b else vf("FAIL TO REJECT H₀")) +
                            txt_s(f' at α={ab}')),
-        ("Note",           txt_s(f'At α=5% (t_crit=±{stats.t.ppf(0.975,df):.3f}): also fail to reject. '
+        ("Note",           txt_s(f'At α=5% (t_crit=±{_crit(0.975, df):.3f}): also fail to reject. '
                                  f'p-value = {p_b:.4f} (borderline).')),
     ]
-    st.html(f'<div style="margin-top:14px;{NO_SEL}">{steps_html(ssteps)}</div>')
+    steps = f'<div style="margin-top:14px;{NO_SEL}">{steps_html(ssteps)}</div>'
+    return scenario, metrics, steps, float(t_stat), ab
+
+
+def tab_finance_examples():
+    render_card("💹 Real-World Finance & Risk Applications", _finance_examples_html())
+
+    explainer_finance()
+    scenario, metrics, steps, t_stat, ab = _bond_duration_example()
+    render_card(BOND_EXAMPLE_TITLE, scenario)
+    metric_row(metrics)
+    st.html(steps)
+
+    _show_plot(t_stat, ab, "two", BOND_PLOT_TITLE)
+
+    render_card(VOL_CHANGE_TITLE,
+        ib(f'<span style="color:#FFD700;-webkit-text-fill-color:#FFD700;font-weight:600">Scenario:</span> '
+           + txt_s(' A rate decision lands on day 250. Using 60 trading days either side, '
+                   'has daily volatility <em>increased</em>? Long-run daily σ₀ = 1.2%.'),
+           "gold")
+    )
+    _volatility_change_test()
+
+
+def _policy_returns(k, shock, seed=11):
+    """Daily % returns, 500 days × k assets (fat-tailed); the first third of assets see σ × shock from day 250."""
+    rng = np.random.default_rng(seed)
+    X = rng.standard_t(5, (2 * VOL_EVENT, k)) * np.sqrt(3 / 5) * VOL_SIGMA0
+    X[VOL_EVENT:, : max(1, k // 3)] *= shock
+    return X
 
-    fig3 = _plot_test(t_stat, ab, "two", "Bond Duration Test (t-distribution, df=48)")
-    st.pyplot(fig3, use_container_width=True); plt.close(fig3)
+
+@st.fragment
+def _volatility_change_test():
+    """χ² vs σ₀, F and Levene on one asset, then the same call across a simulated universe."""
+    c1, c2, c3 = st.columns(3)
+    shock = c1.select_slider("True volatility multiplier after the event",
+                             options=[1.0, 1.1, 1.25, 1.5, 2.0], value=1.25, key="vol_shock")
+    alpha = c2.select_slider("α", options=[0.10, 0.05, 0.01], value=0.05, key="vol_alpha")
+    k     = c3.select_slider("Assets in the universe", options=[1, 100, 1000, 5000], value=1000, key="vol_k")
+
+    X = _policy_returns(k, shock)
+    r = event_variance_tests(X, np.arange(k), VOL_EVENT, VOL_WINDOW, tail="right", alpha=alpha,
+                             sigma0_sq=VOL_SIGMA0 ** 2)
+
+    (n1, _, v1), (n2, _, v2) = ([float(m[0]) for m in w] for w in (r["before"], r["after"]))
+    chi, f, lev = (r[t] for t in ("chi2", "f", "levene"))
+    verdict = lambda rej: "REJECT H₀ 🔴" if rej else "FAIL TO REJECT 🟢"
+    metric_row([
+        ("σ before → after (daily %)", f"{np.sqrt(v1):.3f} → {np.sqrt(v2):.3f}", None),
+        (f"χ² vs σ₀ (crit {float(chi.crit[0]):.1f})", f"{float(chi.stat[0]):.2f} · p={float(chi.p[0]):.4f}", None),
+        (f"F after/before (crit {float(f.crit[0]):.3f})", f"{float(f.stat[0]):.3f} · p={float(f.p[0]):.4f}", None),
+        ("Levene (Brown–Forsythe)", f"{float(lev.stat[0]):.3f} · p={float(lev.p[0]):.4f}", None),
+    ])
+    ssteps = [
+        ("Hypotheses",  f'H₀: σ²_after = σ²_before | H₁: σ²_after &gt; σ²_before → {bdg("Right-Tailed","red")}'),
+        ("χ² test",     fml(f'χ² = (n−1)s²/σ₀² = {n2 - 1:.0f} × {v2:.4f} / {VOL_SIGMA0 ** 2:.2f} = {hl(f"{float(chi.stat[0]):.2f}")}'
+                            f'\ndf = {n2 - 1:.0f} → {verdict(bool(chi.reject[0]))}')),
+        ("F test",      fml(f'F = s²_after / s²_before = {v2:.4f} / {v1:.4f} = {hl(f"{float(f.stat[0]):.3f}")}'
+                            f'\ndf = ({n2 - 1:.0f}, {n1 - 1:.0f}) → {verdict(bool(f.reject[0]))}')),
+        ("Levene",      txt_s('ANOVA on |x − median| of each window — does not assume normal returns → ')
+                        + hl(verdict(bool(lev.reject[0])))),
+    ]
+    render_ib(
+        f'<span style="color:#FFD700;-webkit-text-fill-color:#FFD700;font-weight:600">Asset #1 Step-by-Step:</span>'
+        f'<div style="margin-top:10px">{steps_html(ssteps)}</div>',
+        "gold"
+    )
+    if k > 1:
+        shocked = np.arange(k) < max(1, k // 3)
+        calm = int((~shocked).sum())
+        render_ib(
+            lb_t('<strong>Whole universe, one call:</strong> ')
+            + txt_s(f'F flags {int((f.reject & shocked).sum()):,} and Levene {int((lev.reject & shocked).sum()):,} '
+                    f'of the {int(shocked.sum()):,} assets whose volatility really changed. Among the {calm:,} '
+                    f'that did not, F raises {hl(f"{int((f.reject & ~shocked).sum()):,}")} false alarms and '
+                    f'Levene {hl(f"{int((lev.reject & ~shocked).sum()):,}")} — α = {alpha} expects about '
+                    f'{alpha * calm:,.0f}. ')
+            + mut_t('With fat-tailed returns the F test over-rejects on unshocked assets; Levene holds its size.'),
+            "blue"
+        )
 
 
 # ═══════════════════════════════════════════════════════════════════
 # TAB 6 — PYTHON CODE
 # ═══════════════════════════════════════════════════════════════════
-def tab_python_code():
-    render_card("🐍 Python Implementation", "")
-    explainer_python()
+@st.fragment
+def _z_test_runner():
+    """Inputs + Run button + result: reruns on its own, not the whole app."""
+    c1, _ = st.columns([1, 1])
+    with c1:
+        section_heading("Z-Test Parameters")
+        xb  = st.number_input("Sample Mean",     value=13.5, key="py_xb")
+        mu  = st.number_input("Population Mean", value=12.0, key="py_mu")
+        sig = st.number_input("Std Dev",         value=6.0,  min_value=0.01, key="py_sg")
+        nn  = st.number_input("n",               value=36,   min_value=1,    key="py_n")
+        alp = st.select_slider("α", options=[0.10,0.05,0.01], value=0.05, key="py_a")
+        tl  = st.radio("Tail", ["right","left","two"], horizontal=True, key="py_t")
+
+    if st.button("▶ Run Z-Test", key="run_zt"):
+        se, zs, zc, pv, rej = _solve_z(xb, mu, sig, nn, alp, tl)
+        cv_s = f"±{zc:.3f}" if tl == "two" else f"{zc:.3f}"
+        dtxt = "REJECT H₀" if rej else "FAIL TO REJECT H₀"; dcol = "#dc3545" if rej else "#28a745"
+        render_ib(
+            f'<span style="font-family:{FM};font-size:.9rem;color:#e6f1ff;-webkit-text-fill-color:#e6f1ff">'
+            f'z-stat = {hl(f"{zs:.4f}")} &nbsp;|&nbsp; z_crit = {hl(cv_s)} &nbsp;|&nbsp; p = {hl(f"{pv:.4f}")}</span><br>'
+            f'<span style="color:{dcol};-webkit-text-fill-color:{dcol};font-size:1.1rem;font-weight:700">{dtxt}</span>',
+            "gold"
+        )
+        _show_plot(zs, alp, tl, f"z={zs:.3f} | α={alp}")
+
+
+@st.fragment
+def _sandbox_runner():
+    """Editor + Run: the snippet executes in a fresh warm worker from code_runner, never in the app process."""
+    src = st.text_area("Python", value=_PY_REFERENCE, height=360, key="py_src", label_visibility="collapsed")
+    if not st.button("▶ Run Code", key="run_src"):
+        return
+    res = default_runner().run(src)
+    metric_row([("Status", "OK" if res.ok else (res.limit or "error").upper()),
+                ("Run Time", f"{res.ms:,.0f} ms"), ("Figures", len(res.figures))])
+    if res.stdout:
+        st.code(res.stdout, language="text")
+    if res.error:
+        render_ib(f'<pre style="font-family:{FM};font-size:.82rem;white-space:pre-wrap;margin:0;'
+                  f'color:#e6f1ff;-webkit-text-fill-color:#e6f1ff">{html.escape(res.error)}</pre>', "red")
+    for png in res.figures:
+        st.image(png, use_container_width=True)
+
+
+REF_ALPHAS = (0.10, 0.05, 0.025, 0.01, 0.005, 0.001)
+REF_DFS    = "11, 30, 60, 120"
+
+
+@cached("html")
+def _critical_values_table_html(alphas: tuple, dfs: tuple):
+    rows = []
+    for a in alphas:
+        rows.append([
+            txt_s(f"{a:g}"),
+            hl(f"{crit_lookup(a, 'right'):.3f}"),
+            hl(f"{crit_lookup(a, 'two'):.3f}"),
+            *(txt_s(f"{crit_lookup(a, 'two', d):.3f}") for d in dfs),
+        ])
+    return table_html(["α", "One-Tail z", "Two-Tail z (±)", *(f"Two-Tail t (df={d:,})" for d in dfs)], rows)
 
-    st.code('''import numpy as np
+
+def _parse_dfs(text):
+    """Comma-separated degrees of freedom → (valid ones in order, first six; rejected tokens)."""
+    ok, bad = [], []
+    for tok in filter(None, (t.strip() for t in text.split(","))):
+        (ok if tok.isdigit() and 1 <= int(tok) <= DF_MAX else bad).append(tok)
+    return tuple(dict.fromkeys(int(t) for t in ok))[:6], bad
+
+
+@st.fragment
+def _critical_values_reference():
+    c1, c2 = st.columns([2, 1])
+    alphas = c1.multiselect("α levels", CRIT_ALPHAS, default=list(REF_ALPHAS), key="ref_alphas",
+                            format_func=lambda a: f"{a:g}")
+    dfs, bad = _parse_dfs(c2.text_input("t columns: degrees of freedom", REF_DFS, key="ref_dfs",
+                                        help=f"Comma-separated, 1 to {DF_MAX:,} (up to six)"))
+    if bad:
+        st.caption(f"Ignored: {', '.join(bad)} — degrees of freedom are whole numbers from 1 to {DF_MAX:,}.")
+    st.html(_critical_values_table_html(tuple(sorted(alphas, reverse=True)), dfs))
+
+
+_PY_REFERENCE = '''import numpy as np
 import scipy.stats as stats
 
 def z_test(sample_mean, pop_mean, pop_std, n, alpha=0.05, tail="two"):
@@ -414,50 +714,33 @@ def t_test_one_sample(data, pop_mean, alpha=0.05, tail="two"):
 # Critical values reference
 for a in [0.10, 0.05, 0.01]:
     print(f"α={a}: 1-tail z={stats.norm.ppf(1-a):.3f} | 2-tail z=±{stats.norm.ppf(1-a/2):.3f}")
-''', language="python")
+'''
+
+
+def tab_python_code():
+    render_card("🐍 Python Implementation", "")
+    explainer_python()
+
+    st.code(_PY_REFERENCE, language="python")
 
     render_card("▶ Live Code Runner",
         ib(f'<span style="color:#e6f1ff;-webkit-text-fill-color:#e6f1ff">'
            f'Adjust parameters and click Run to execute a live z-test.</span>', "blue")
     )
 
-    c1, _ = st.columns([1, 1])
-    with c1:
-        section_heading("Z-Test Parameters")
-        xb  = st.number_input("Sample Mean",     value=13.5, key="py_xb")
-        mu  = st.number_input("Population Mean", value=12.0, key="py_mu")
-        sig = st.number_input("Std Dev",         value=6.0,  min_value=0.01, key="py_sg")
-        nn  = st.number_input("n",               value=36,   min_value=1,    key="py_n")
-        alp = st.select_slider("α", options=[0.10,0.05,0.01], value=0.05, key="py_a")
-        tl  = st.radio("Tail", ["right","left","two"], horizontal=True, key="py_t")
+    _z_test_runner()
 
-    if st.button("▶ Run Z-Test", key="run_zt"):
-        se  = sig / np.sqrt(nn); zs = (xb - mu) / se
-        if   tl == "right": zc = stats.norm.ppf(1-alp);   pv = 1-stats.norm.cdf(zs);          rej = zs > zc
-        elif tl == "left":  zc = stats.norm.ppf(alp);      pv = stats.norm.cdf(zs);             rej = zs < zc
-        else:               zc = stats.norm.ppf(1-alp/2);  pv = 2*(1-stats.norm.cdf(abs(zs)));  rej = abs(zs) > zc
-        cv_s = f"±{zc:.3f}" if tl == "two" else f"{zc:.3f}"
-        dtxt = "REJECT H₀" if rej else "FAIL TO REJECT H₀"; dcol = "#dc3545" if rej else "#28a745"
-        render_ib(
-            f'<span style="font-family:{FM};font-size:.9rem;color:#e6f1ff;-webkit-text-fill-color:#e6f1ff">'
-            f'z-stat = {hl(f"{zs:.4f}")} &nbsp;|&nbsp; z_crit = {hl(cv_s)} &nbsp;|&nbsp; p = {hl(f"{pv:.4f}")}</span><br>'
-            f'<span style="color:{dcol};-webkit-text-fill-color:{dcol};font-size:1.1rem;font-weight:700">{dtxt}</span>',
-            "gold"
+    # running pasted code is opt-in per deployment (HT_CODE_RUNNER=1); otherwise the reference above stays read-only
+    if code_runner_enabled():
+        render_card("🧪 Run Your Own Code",
+            ib(txt_s('Edit the snippet — or paste your own NumPy / SciPy code — and run it. ')
+               + mut_t(f'np, stats and plt are pre-imported; print() output and matplotlib figures come back. '
+                       f'Limits: {default_runner().describe()}.'), "blue")
         )
-        fig4 = _plot_test(zs, alp, tl, f"z={zs:.3f} | α={alp}")
-        st.pyplot(fig4, use_container_width=True); plt.close(fig4)
+        _sandbox_runner()
 
     section_heading("🔢 Critical Values Reference Table")
-    rows = []
-    for a in [0.10, 0.05, 0.025, 0.01, 0.005]:
-        rows.append([
-            txt_s(f"{a:.3f}"),
-            hl(f"{stats.norm.ppf(1-a):.3f}"),
-            hl(f"{stats.norm.ppf(1-a/2):.3f}"),
-            txt_s(f"{stats.t.ppf(1-a/2,30):.3f}"),
-            txt_s(f"{stats.t.ppf(1-a/2,60):.3f}"),
-        ])
-    st.html(table_html(["α","One-Tail z","Two-Tail z (±)","t (df=30)","t (df=60)"], rows))
+    _critical_values_reference()
 
     render_ib(
         f'<span style="color:#ADD8E6;-webkit-text-fill-color:#ADD8E6;font-weight:600">Memory Anchor:</span> '
@@ -469,47 +752,75 @@ for a in [0.10, 0.05, 0.01]:
 
 
 # ═══════════════════════════════════════════════════════════════════
-# SHARED PLOT HELPER
+# SHARED QUANTILE + PLOT HELPERS
 # ═══════════════════════════════════════════════════════════════════
-def _plot_test(z_stat, alpha, tail, title=""):
-    fig, ax = plt.subplots(figsize=(10, 4))
-    fig.patch.set_facecolor("#0a1628"); ax.set_facecolor("#112240")
-    x = np.linspace(-4, 4, 600); y = stats.norm.pdf(x)
-    ax.plot(x, y, color="#ADD8E6", lw=2.5, zorder=3)
-    ax.fill_between(x, y, alpha=0.22, color="#004d80")
-
-    def shade(xl): ax.fill_between(xl, stats.norm.pdf(xl), color="#dc3545", alpha=0.72, zorder=2)
-
-    if tail == "two":
-        zc = stats.norm.ppf(1-alpha/2)
-        shade(np.linspace(zc,4.05,150)); shade(np.linspace(-4.05,-zc,150))
-        ax.axvline(zc,  color="#dc3545", ls="--", lw=1.8, label=f"z_crit=±{zc:.3f}")
-        ax.axvline(-zc, color="#dc3545", ls="--", lw=1.8)
-    elif tail == "right":
-        zc = stats.norm.ppf(1-alpha)
-        shade(np.linspace(zc,4.05,150))
-        ax.axvline(zc, color="#dc3545", ls="--", lw=1.8, label=f"z_crit=+{zc:.3f}")
+def _solve_z(x_bar, mu_0, sigma, n, alpha, tail):
+    """One-sample z-test → (se, z, signed critical value, p-value, reject)."""
+    se = sigma / np.sqrt(n)
+    z  = (x_bar - mu_0) / se
+    zc = float(critical(alpha, tail))
+    return se, z, zc, float(p_value(z, tail)), bool(reject(z, zc, tail))
+
+
+def _recorded_decision(key):
+    """Decision sent back by the explorer, re-solved server-side and logged for the session."""
+    rec = st.session_state.get(key)
+    if not rec:
+        render_ib(mut_t("Everything above updates in your browser as you type. "
+                        "Click <strong>📌 Record decision</strong> to log a result here."), "blue")
+        return
+    _, z, zc, p_val, rej = _solve_z(rec["x_bar"], rec["mu_0"], rec["sigma"], rec["n"],
+                                    rec["alpha"], rec["tail"])
+    log = st.session_state.setdefault(f"{key}_log", [])
+    if not log or log[-1]["recorded_at"] != rec["recorded_at"]:
+        log.append(dict(rec, z=z, p_value=p_val, reject=rej))
+    crit_txt = f"±{zc:.3f}" if rec["tail"] == "two" else f"{zc:.3f}"
+    rows = [[txt_s(str(i)), txt_s(f'x̄={r["x_bar"]}, μ₀={r["mu_0"]}, σ={r["sigma"]}, n={r["n"]}'),
+             txt_s(f'{r["tail"]}, α={r["alpha"]}'), hl(f'{r["z"]:.4f}'), txt_s(f'{r["p_value"]:.4f}'),
+             vr("REJECT") if r["reject"] else vf("FAIL TO REJECT")]
+            for i, r in enumerate(reversed(log[-10:]), 1)]
+    render_card("📌 Recorded Decisions",
+        p(f'Latest: z = {hl(f"{z:.4f}")} vs critical {hl(crit_txt)}, p = {hl(f"{p_val:.4f}")} → '
+          + (vr("REJECT H₀") if rej else vf("FAIL TO REJECT H₀"))) +
+        table_html(["#", "Inputs", "Test", "z", "p-value", "Decision"], rows)
+    )
+
+
+def _crit(q, df=None):
+    """Inverse CDF of N(0,1), or of t(df) when df is given."""
+    return float(ppf(q, df))
+
+
+@cached("figures")
+def _plot_png(z_stat, alpha, tail, title=""):
+    """figures.plot_test as PNG bytes (via the shared template) — shared by every session asking for the same plot."""
+    return render_png(z_stat, alpha, tail, title)
+
+
+# Script-run thread → list of (placeholder, Future) while a plot_batch() is open
+_batch = threading.local()
+
+
+@contextmanager
+def plot_batch():
+    """Render every _show_plot inside the block concurrently; each fills its own placeholder on exit.
+
+    Placeholders are created where the plot belongs, the PNGs are drawn on the
+    figures thread pool, and only this script-run thread writes to the page."""
+    pending, outer = [], getattr(_batch, "pending", None)
+    _batch.pending = pending
+    try:
+        yield
+    finally:
+        _batch.pending = outer
+    for slot, png in pending:
+        slot.image(png.result(), use_container_width=True)
+
+
+def _show_plot(z_stat, alpha, tail, title=""):
+    args = (float(z_stat), alpha, tail, title)
+    pending = getattr(_batch, "pending", None)
+    if pending is None:
+        st.image(_plot_png(*args), use_container_width=True)
     else:
-        zc = stats.norm.ppf(alpha)
-        shade(np.linspace(-4.05,zc,150))
-        ax.axvline(zc, color="#dc3545", ls="--", lw=1.8, label=f"z_crit={zc:.3f}")
-
-    if z_stat != 0:
-        ax.axvline(z_stat, color="#FFD700", lw=2.5, zorder=4, label=f"z_stat={z_stat:.4f}")
-        ax.scatter([z_stat],[stats.norm.pdf(z_stat)], color="#FFD700", s=80, zorder=5)
-        rej = ((tail=="two"   and abs(z_stat) > stats.norm.ppf(1-alpha/2)) or
-               (tail=="right" and z_stat      > stats.norm.ppf(1-alpha))   or
-               (tail=="left"  and z_stat      < stats.norm.ppf(alpha)))
-        ax.text(0.5, 0.92, "REJECT H₀" if rej else "FAIL TO REJECT H₀",
-                transform=ax.transAxes, ha="center", fontsize=13, fontweight="bold",
-                color="#dc3545" if rej else "#28a745")
-
-    ax.set_title(title, color="#FFD700", fontsize=11, pad=8)
-    ax.set_xlabel("Standard Deviations from Mean", color="#8892b0", fontsize=9)
-    ax.set_ylabel("Density", color="#8892b0", fontsize=9)
-    ax.tick_params(colors="#8892b0", labelsize=8)
-    ax.legend(facecolor="#112240", labelcolor="#e6f1ff", fontsize=9, edgecolor="#1e3a5f")
-    for sp in ax.spines.values(): sp.set_color("#1e3a5f")
-    ax.grid(axis="y", color="#1e3a5f", alpha=0.4, lw=0.5)
-    plt.tight_layout(pad=1.2)
-    return fig
+        pending.append((st.empty(), submit(_plot_png, *args)))
@@ -0,0 +1,119 @@
+"""
+two_sample.py — Paired, pooled and Welch two-sample t-tests, batched.
+
+Every test works from sufficient statistics (n, mean, variance), so the
+same formulas serve a single calculator input and thousands of pairs at
+once: arguments broadcast like any numpy expression. For a returns matrix
+(T periods × k series) the per-column moments are computed once
+(`column_moments`) and every pair reuses them; paired tests add one
+column-wise cross-product per pair for the covariance.
+
+    X  = returns matrix, T × k (NaN = missing for pooled / Welch)
+    M  = column_moments(X)
+    r  = compare_pairs(M, i=[0, 0, 3], j=[1, 2, 4], method="welch")
+    r.p  → array of three p-values
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from pvalues import critical, p_value, reject
+
+METHODS = ("paired", "pooled", "welch")
+
+Moments     = namedtuple("Moments", "n mean var centered")
+TTestResult = namedtuple("TTestResult", "diff se t df p crit reject")
+
+
+# ═══════════════════════════════════════════════════════════════════
+# MOMENTS
+# ═══════════════════════════════════════════════════════════════════
+def column_moments(X) -> Moments:
+    """Per-column n, mean and sample variance (ddof=1), NaN-aware, plus the centred matrix."""
+    X = np.asarray(X, dtype=float)
+    if X.ndim == 1:
+        X = X[:, None]
+    ok   = np.isfinite(X)
+    n    = ok.sum(axis=0)
+    Xz   = np.where(ok, X, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = Xz.sum(axis=0) / n
+        C    = np.where(ok, X - mean, 0.0)
+        var  = np.einsum("tk,tk->k", C, C) / (n - 1)
+    return Moments(n, mean, var, C)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# TESTS ON SUFFICIENT STATISTICS (broadcast)
+# ═══════════════════════════════════════════════════════════════════
+def _result(diff, se, df, tail, alpha, delta0=0.0):
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t = (diff - delta0) / se
+    crit = critical(alpha, tail, df)
+    return TTestResult(diff, se, t, df, p_value(t, tail, df), crit, reject(t, crit, tail))
+
+
+def welch_df(n1, var1, n2, var2):
+    """Welch–Satterthwaite degrees of freedom."""
+    a, b = var1 / n1, var2 / n2
+    return (a + b) ** 2 / (a * a / (n1 - 1) + b * b / (n2 - 1))
+
+
+def welch_t(n1, mean1, var1, n2, mean2, var2, tail="two", alpha=0.05, delta0=0.0):
+    """Unequal-variance t-test of μ₁ − μ₂ = delta0."""
+    se = np.sqrt(var1 / n1 + var2 / n2)
+    return _result(np.subtract(mean1, mean2), se, welch_df(n1, var1, n2, var2), tail, alpha, delta0)
+
+
+def pooled_t(n1, mean1, var1, n2, mean2, var2, tail="two", alpha=0.05, delta0=0.0):
+    """Equal-variance (Student) t-test of μ₁ − μ₂ = delta0, df = n₁ + n₂ − 2."""
+    df = np.add(n1, n2) - 2
+    sp2 = ((np.subtract(n1, 1)) * var1 + (np.subtract(n2, 1)) * var2) / df
+    se = np.sqrt(sp2 * (1.0 / np.asarray(n1, dtype=float) + 1.0 / np.asarray(n2, dtype=float)))
+    return _result(np.subtract(mean1, mean2), se, df, tail, alpha, delta0)
+
+
+def paired_t(n, mean_d, var_d, tail="two", alpha=0.05, delta0=0.0):
+    """Paired t-test on the differences d = x − y: one-sample t of mean_d against delta0."""
+    se = np.sqrt(var_d / np.asarray(n, dtype=float))
+    return _result(np.asarray(mean_d, dtype=float), se, np.subtract(n, 1), tail, alpha, delta0)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# BATCHED DRIVERS
+# ═══════════════════════════════════════════════════════════════════
+def compare_pairs(M: Moments, i, j, method="welch", tail="two", alpha=0.05, delta0=0.0):
+    """Test column i against column j for every (i, j), reusing the moments in M."""
+    i, j = np.asarray(i), np.asarray(j)
+    if method == "welch":
+        return welch_t(M.n[i], M.mean[i], M.var[i], M.n[j], M.mean[j], M.var[j], tail, alpha, delta0)
+    if method == "pooled":
+        return pooled_t(M.n[i], M.mean[i], M.var[i], M.n[j], M.mean[j], M.var[j], tail, alpha, delta0)
+    if method == "paired":
+        T = M.centered.shape[0]
+        if (M.n[i] != T).any() or (M.n[j] != T).any():
+            raise ValueError("paired tests need complete rows; drop periods with missing values first")
+        n   = M.n[i]
+        cov = np.einsum("tp,tp->p", M.centered[:, i], M.centered[:, j]) / (n - 1)
+        var_d = np.maximum(M.var[i] + M.var[j] - 2 * cov, 0.0)
+        return paired_t(n, M.mean[i] - M.mean[j], var_d, tail, alpha, delta0)
+    raise ValueError(f"method must be one of {METHODS}, got {method!r}")
+
+
+def against_benchmark(X, benchmark, method="paired", tail="two", alpha=0.05, delta0=0.0):
+    """Every column of X (T × k) against one benchmark series (T,)."""
+    X = np.asarray(X, dtype=float)
+    if X.ndim == 1:
+        X = X[:, None]
+    b = np.asarray(benchmark, dtype=float).reshape(-1, 1)
+    if method == "paired":
+        D = column_moments(X - b)
+        return paired_t(D.n, D.mean, D.var, tail, alpha, delta0)
+    M = column_moments(np.hstack([X, b]))
+    k = X.shape[1]
+    return compare_pairs(M, np.arange(k), np.full(k, k), method, tail, alpha, delta0)
+
+
+def all_pairs(k):
+    """Index arrays (i, j) for every unordered pair of k columns."""
+    return np.triu_indices(k, 1)
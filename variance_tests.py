@@ -0,0 +1,108 @@
+"""
+variance_tests.py — Has volatility changed? Chi-square, F and Levene tests, batched.
+
+    χ² test   one window's variance against a target σ₀²:  χ² = (n−1)s²/σ₀², df = n−1
+    F test    after-window vs before-window variance:      F = s²_after / s²_before
+    Levene    same question, robust to fat tails: ANOVA on |x − median| of each window
+
+The window moments come from one cumulative pass over each asset's
+series (rolling.prefix_moments): after that, n, mean and variance of any
+window are O(1) differences, so thousands of (asset, event date) pairs
+are tested in one vectorised call. Levene needs the observations themselves and gathers the
+windows with one fancy-index per call.
+
+    X = returns, T days × k assets (NaN = no price)
+    r = event_variance_tests(X, asset=[0, 0, 5], event=[250, 500, 250], window=60)
+    r["f"].p, r["levene"].p  → one p-value per (asset, event)
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from pvalues import chi2_critical, chi2_p_value, f_critical, f_p_value, reject_asym
+from rolling import Prefix, prefix_moments, window_moments
+
+VarTestResult  = namedtuple("VarTestResult", "stat df p crit reject")
+FTestResult    = namedtuple("FTestResult", "stat dfn dfd p crit reject")
+
+
+# ═══════════════════════════════════════════════════════════════════
+# TESTS ON SUFFICIENT STATISTICS (broadcast)
+# ═══════════════════════════════════════════════════════════════════
+def chi2_variance_test(n, var, sigma0_sq, tail="right", alpha=0.05) -> VarTestResult:
+    """H₀: σ² = σ₀². tail="right" asks whether volatility has risen."""
+    df = np.subtract(n, 1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        stat = df * np.asarray(var, dtype=float) / sigma0_sq
+    crit = chi2_critical(alpha, tail, df)
+    return VarTestResult(stat, df, chi2_p_value(stat, df, tail), crit, reject_asym(stat, crit, tail))
+
+
+def f_variance_test(n_before, var_before, n_after, var_after, tail="right", alpha=0.05) -> FTestResult:
+    """H₀: σ²_after = σ²_before, F = s²_after / s²_before ~ F(n_after−1, n_before−1)."""
+    dfn, dfd = np.subtract(n_after, 1), np.subtract(n_before, 1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        stat = np.asarray(var_after, dtype=float) / var_before
+    crit = f_critical(alpha, tail, dfn, dfd)
+    return FTestResult(stat, dfn, dfd, f_p_value(stat, dfn, dfd, tail), crit, reject_asym(stat, crit, tail))
+
+
+def levene_test(before, after, center="median", alpha=0.05) -> FTestResult:
+    """Levene / Brown–Forsythe test on windows shaped (..., w); NaN entries are ignored.
+
+    center="median" is the Brown–Forsythe variant (robust to fat tails),
+    "mean" the original Levene. Always right-tailed: W ~ F(1, N−2)."""
+    loc = np.nanmedian if center == "median" else np.nanmean
+    groups = []
+    for g in (np.asarray(before, dtype=float), np.asarray(after, dtype=float)):
+        z  = np.abs(g - loc(g, axis=-1, keepdims=True))
+        ok = np.isfinite(z)
+        n  = ok.sum(axis=-1)
+        zs = np.where(ok, z, 0.0)
+        zbar = zs.sum(axis=-1) / n
+        ss   = np.where(ok, (zs - zbar[..., None]) ** 2, 0.0).sum(axis=-1)
+        groups.append((n, zbar, ss))
+    (n1, z1, ss1), (n2, z2, ss2) = groups
+    N = n1 + n2
+    zall = (n1 * z1 + n2 * z2) / N
+    with np.errstate(invalid="ignore", divide="ignore"):
+        W = (N - 2) * (n1 * (z1 - zall) ** 2 + n2 * (z2 - zall) ** 2) / (ss1 + ss2)
+    dfn, dfd = np.ones_like(N), N - 2
+    crit = f_critical(alpha, "right", dfn, dfd)
+    return FTestResult(W, dfn, dfd, f_p_value(W, dfn, dfd, "right"), crit, W > crit)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# BATCHED EVENT DRIVER
+# ═══════════════════════════════════════════════════════════════════
+def event_variance_tests(X, asset, event, window, tail="right", alpha=0.05,
+                         sigma0_sq=None, levene=True, prefix: Prefix = None) -> dict:
+    """
+    Before = rows [event − window, event), after = rows [event, event + window)
+    of column `asset`, for every (asset, event) pair (arrays broadcast).
+
+    Returns {"before": (n, mean, var), "after": (n, mean, var), "f": FTestResult,
+    "levene": FTestResult (if levene), "chi2": VarTestResult (if sigma0_sq)}.
+    Pass `prefix` to reuse one prefix_moments(X) across calls (e.g. nightly
+    runs over many event lists).
+    """
+    X = np.asarray(X, dtype=float)
+    if X.ndim == 1:
+        X = X[:, None]
+    asset, event = np.broadcast_arrays(np.asarray(asset), np.asarray(event))
+    if (event - window < 0).any() or (event + window > X.shape[0]).any():
+        raise ValueError(f"every event needs {window} rows before and after it")
+    P = prefix if prefix is not None else prefix_moments(X)
+
+    before = window_moments(P, asset, event - window, event)
+    after  = window_moments(P, asset, event, event + window)
+    out = dict(before=before, after=after,
+               f=f_variance_test(before[0], before[2], after[0], after[2], tail, alpha))
+    if sigma0_sq is not None:
+        out["chi2"] = chi2_variance_test(after[0], after[2], sigma0_sq, tail, alpha)
+    if levene:
+        offs = np.arange(window)
+        rows = event[..., None] + offs
+        cols = asset[..., None]
+        out["levene"] = levene_test(X[rows - window, cols], X[rows, cols], alpha=alpha)
+    return out